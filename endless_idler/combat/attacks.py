@@ -0,0 +1,177 @@
+"""Attack resolution for `BattleEngine`: targeting, damage rolls and hits.
+
+Single hits, the wind gust that splits over every enemy and the lightning
+multi-hit all roll through `calculate_damage` and land through `_hit`, which
+emits the events the battle screen and replay recorder consume.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from endless_idler.combat.events import DodgeEvent
+from endless_idler.combat.events import FellEvent
+from endless_idler.combat.events import HitEvent
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.sim import calculate_damage
+from endless_idler.combat.sim import choose_weighted_target_by_aggro
+from endless_idler.combat.stats import Stats
+from endless_idler.passives.execution import apply_target_selection_passives
+
+
+LIGHTNING_HITS = 5
+
+
+@dataclass(slots=True)
+class AttackContext:
+    """Who is attacking, with what, and the stat lists its passives see."""
+
+    attacker: Combatant
+    element_id: str
+    damage_multiplier: float
+    onsite_allies: list[Stats]
+    offsite_allies: list[Stats]
+    enemies: list[Stats]
+
+    @property
+    def all_allies(self) -> list[Stats]:
+        return self.onsite_allies + self.offsite_allies
+
+
+class BattleAttacks:
+    """`BattleEngine` mixin that resolves one attacker's attack against its enemies."""
+
+    def _pick_target(self, context: AttackContext, enemies: list[Combatant], attacker_side: str) -> Combatant:
+        if attacker_side == "party":
+            initial_target = self._rng.choice(enemies)
+        else:
+            initial_target, _ = choose_weighted_target_by_aggro([(c, None) for c in enemies], self._rng)
+        final_stats = apply_target_selection_passives(
+            attacker=context.attacker.stats,
+            original_target=initial_target.stats,
+            available_targets=context.enemies,
+            all_allies=context.all_allies,
+            onsite_allies=context.onsite_allies,
+            offsite_allies=context.offsite_allies,
+            enemies=context.enemies,
+        )
+        return next(c for c in enemies if c.stats is final_stats)
+
+    def _roll_damage(self, context: AttackContext, target: Combatant) -> tuple[int, bool, bool]:
+        return calculate_damage(
+            context.attacker.stats,
+            target.stats,
+            self._rng,
+            damage_multiplier=context.damage_multiplier,
+            all_allies=context.all_allies,
+            onsite_allies=context.onsite_allies,
+            offsite_allies=context.offsite_allies,
+            enemies=context.enemies,
+        )
+
+    def _wind_attack(self, context: AttackContext, enemies: list[Combatant]) -> None:
+        attacker = context.attacker
+        # TARGET_SELECTION passives may pull the whole gust onto one enemy.
+        original_stats = enemies[0].stats
+        final_stats = apply_target_selection_passives(
+            attacker=attacker.stats,
+            original_target=original_stats,
+            available_targets=context.enemies,
+            all_allies=context.all_allies,
+            onsite_allies=context.onsite_allies,
+            offsite_allies=context.offsite_allies,
+            enemies=context.enemies,
+        )
+        if final_stats is not original_stats:
+            target = next(c for c in enemies if c.stats is final_stats)
+            damage, crit, dodged = self._roll_damage(context, target)
+            if dodged:
+                self._emit(DodgeEvent(attacker=attacker, target=target))
+            elif damage > 0:
+                fell = self._hit(context, target, damage, crit)
+                self._status(f"{attacker.name} gusts {target.name} for {damage}{' (CRIT)' if crit else ''} (redirected)")
+                if fell:
+                    self._fell(target)
+            return
+
+        target_count = len(enemies)
+        total_damage = 0
+        any_crit = False
+        for target in enemies:
+            damage, crit, dodged = self._roll_damage(context, target)
+            if dodged:
+                self._emit(DodgeEvent(attacker=attacker, target=target))
+                continue
+            damage = int(damage // max(1, target_count))
+            if damage <= 0:
+                continue
+            total_damage += damage
+            any_crit = any_crit or crit
+            if self._hit(context, target, damage, crit):
+                self._fell(target)
+        if total_damage > 0:
+            self._status(f"{attacker.name} gusts for {total_damage}{' (CRIT)' if any_crit else ''}")
+
+    def _lightning_attack(self, context: AttackContext, target: Combatant) -> None:
+        attacker = context.attacker
+        total_damage = 0
+        any_crit = False
+        landed = 0
+        for _ in range(LIGHTNING_HITS):
+            if target.stats.hp <= 0:
+                break
+            damage, crit, dodged = self._roll_damage(context, target)
+            if dodged:
+                self._emit(DodgeEvent(attacker=attacker, target=target))
+                continue
+            if damage <= 0:
+                continue
+            landed += 1
+            any_crit = any_crit or crit
+            total_damage += damage
+            if self._hit(context, target, damage, crit):
+                self._fell(target)
+                break
+        if landed:
+            self._status(
+                f"{attacker.name} zaps {target.name} {landed}x for {total_damage}{' (CRIT)' if any_crit else ''}"
+            )
+
+    def _single_attack(self, context: AttackContext, target: Combatant) -> None:
+        attacker = context.attacker
+        damage, crit, dodged = self._roll_damage(context, target)
+        if dodged:
+            self._status(f"{target.name} dodged!")
+            self._emit(DodgeEvent(attacker=attacker, target=target))
+            return
+        if damage <= 0:
+            return
+
+        fell = self._hit(context, target, damage, crit)
+        self._status(f"{attacker.name} hits {target.name} for {damage}{' (CRIT)' if crit else ''}")
+        if fell:
+            self._fell(target)
+
+    def _hit(self, context: AttackContext, target: Combatant, damage: int, crit: bool) -> bool:
+        """Apply a landed hit; returns True when it knocked the target out."""
+        previous_hp = int(target.stats.hp)
+        target.stats.hp = max(0, previous_hp - int(damage))
+        self._emit(
+            HitEvent(
+                attacker=context.attacker,
+                target=target,
+                damage=int(damage),
+                crit=crit,
+                element_id=context.element_id,
+            )
+        )
+        return previous_hp > 0 and target.stats.hp <= 0
+
+    def _fell(self, target: Combatant) -> None:
+        self._scheduler.remove(target)
+        self._status(f"{target.name} fell!")
+        if id(target) in self._party_ids:
+            self._emit(FellEvent(target=target, side="party"))
+        elif id(target) in self._foe_ids:
+            self._foe_kills += 1
+            self._emit(FellEvent(target=target, side="foes"))
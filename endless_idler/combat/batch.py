@@ -0,0 +1,298 @@
+"""Vectorized battle kernel for balance sweeps (needs the `sim` extra: NumPy).
+
+`BatchBattle` lays B battles out as (B, N) arrays: one row per battle and one
+column per party, reserve or foe slot. It steps them all at once and draws
+every target, dodge, crit and variance roll in bulk. The rules follow
+`BattleEngine`: action-gauge turn order (`endless_idler.combat.turns`), aggro-weighted foe
+targeting, the ice/light/dark/fire/wind/lightning mechanics, and stalemate
+bleed. Passives are not run. Stats are read once, so active stat effects count,
+but nothing changes them mid-fight.
+
+Rows that finish are compacted away, so long stalemates only cost their own rows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from endless_idler.combat.attacks import LIGHTNING_HITS
+from endless_idler.combat.batch_mechanics import EMPTY
+from endless_idler.combat.batch_mechanics import FOE
+from endless_idler.combat.batch_mechanics import PARTY
+from endless_idler.combat.batch_mechanics import RESERVE
+from endless_idler.combat.batch_mechanics import BatchMechanics
+from endless_idler.combat.batch_rolls import TYPE_MATRIX
+from endless_idler.combat.batch_rolls import damage_rolls
+from endless_idler.combat.batch_rolls import sample_damage
+from endless_idler.combat.batch_rolls import weighted_pick
+from endless_idler.combat.damage_types import ELEMENT_CODES
+from endless_idler.combat.damage_types import GENERIC_ELEMENT_CODE
+from endless_idler.combat.engine import BATTLE_STEP_SECONDS
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.turns import base_action_value
+
+
+_GENERIC = GENERIC_ELEMENT_CODE
+_LIGHTNING = ELEMENT_CODES["lightning"]
+_WIND = ELEMENT_CODES["wind"]
+
+# Per-slot arrays, shape (B, N).
+_STAT_FIELDS = (
+    "hp",
+    "max_hp",
+    "atk",
+    "defense",
+    "crit_rate",
+    "crit_damage",
+    "dodge",
+    "vitality",
+    "mitigation",
+    "aggro",
+    "passes",
+    "element",
+    "team",
+    "charged",
+    "turns",
+    "base_action_value",
+    "next_turn_at",
+)
+# Per-battle arrays, shape (B,).
+_ROW_FIELDS = (
+    "rows_origin",
+    "foe_kills",
+    "stalemate_ratio",
+    "stalemate_stacks",
+    "bleed_counter",
+)
+
+BatchLineup = tuple[Sequence[Combatant], Sequence[Combatant], Sequence[Combatant]]
+
+__all__ = [
+    "EMPTY",
+    "FOE",
+    "PARTY",
+    "RESERVE",
+    "TYPE_MATRIX",
+    "BatchBattle",
+    "BatchLineup",
+    "BatchOutcome",
+    "damage_rolls",
+    "sample_damage",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOutcome:
+    """Per-battle results, in the order the lineups were given."""
+
+    victory: np.ndarray
+    defeat: np.ndarray
+    foe_kills: np.ndarray
+    steps: np.ndarray
+
+    @property
+    def battles(self) -> int:
+        return int(self.victory.size)
+
+    @property
+    def win_rate(self) -> float:
+        return float(self.victory.mean()) if self.victory.size else 0.0
+
+
+class BatchBattle(BatchMechanics):
+    """Steps many independent battles as NumPy arrays."""
+
+    def __init__(
+        self,
+        lineups: Sequence[BatchLineup],
+        *,
+        seed: int | None = None,
+        step_seconds: float = BATTLE_STEP_SECONDS,
+    ) -> None:
+        battles = len(lineups)
+        width = max((len(party) + len(reserves) + len(foes) for party, reserves, foes in lineups), default=0)
+        self._rng = np.random.default_rng(seed)
+        self._step_seconds = float(step_seconds)
+        self._elapsed = 0.0
+        self._steps = 0
+        self._stalemate_checked_at: float | None = None
+
+        shape = (battles, width)
+        self.hp = np.zeros(shape, dtype=np.int64)
+        self.max_hp = np.ones(shape, dtype=np.int64)
+        self.atk = np.zeros(shape)
+        self.defense = np.zeros(shape)
+        self.crit_rate = np.zeros(shape)
+        self.crit_damage = np.ones(shape)
+        self.dodge = np.zeros(shape)
+        self.vitality = np.ones(shape)
+        self.mitigation = np.ones(shape)
+        self.aggro = np.zeros(shape)
+        self.passes = np.ones(shape, dtype=np.int64)
+        self.element = np.full(shape, _GENERIC, dtype=np.int64)
+        self.team = np.full(shape, EMPTY, dtype=np.int64)
+        self.charged = np.zeros(shape, dtype=bool)
+        self.turns = np.zeros(shape, dtype=np.int64)
+        # Reserves and empty slots never take turns.
+        self.base_action_value = np.full(shape, np.inf)
+
+        for row, (party, reserves, foes) in enumerate(lineups):
+            slots = [(PARTY, c) for c in party] + [(RESERVE, c) for c in reserves] + [(FOE, c) for c in foes]
+            for column, (team, combatant) in enumerate(slots):
+                stats = combatant.stats
+                self.hp[row, column] = max(0, int(stats.hp))
+                self.max_hp[row, column] = max(1, int(combatant.max_hp))
+                self.atk[row, column] = float(stats.atk)
+                self.defense[row, column] = float(stats.defense)
+                self.crit_rate[row, column] = float(stats.crit_rate)
+                self.crit_damage[row, column] = float(stats.crit_damage)
+                self.dodge[row, column] = float(stats.dodge_odds)
+                self.vitality[row, column] = float(stats.vitality)
+                self.mitigation[row, column] = float(stats.mitigation)
+                self.aggro[row, column] = max(0.0, float(stats.aggro))
+                self.passes[row, column] = max(1, int(getattr(stats, "damage_reduction_passes", 1) or 1))
+                self.element[row, column] = stats.element_code
+                self.team[row, column] = team
+                if team != RESERVE:
+                    self.base_action_value[row, column] = base_action_value(stats.spd)
+
+        self.next_turn_at = self.base_action_value.copy()
+        self.rows_origin = np.arange(battles)
+        self.foe_kills = np.zeros(battles, dtype=np.int64)
+        self.stalemate_ratio = np.zeros(battles)
+        self.stalemate_stacks = np.zeros(battles, dtype=np.int64)
+        self.bleed_counter = np.zeros(battles, dtype=np.int64)
+
+        self._victory = np.zeros(battles, dtype=bool)
+        self._defeat = np.zeros(battles, dtype=bool)
+        self._final_kills = np.zeros(battles, dtype=np.int64)
+        self._final_steps = np.zeros(battles, dtype=np.int64)
+        self._finished = np.zeros(battles, dtype=bool)
+
+    @classmethod
+    def repeat(cls, lineup: BatchLineup, *, battles: int, seed: int | None = None) -> BatchBattle:
+        """`battles` copies of one lineup (only read, so the combatants are shared)."""
+        return cls([lineup] * max(0, int(battles)), seed=seed)
+
+    @property
+    def running(self) -> int:
+        return int(self.rows_origin.size)
+
+    def run(self, *, max_steps: int = 20_000) -> BatchOutcome:
+        """Step until every battle ends or `max_steps` run out (unfinished ones count as neither)."""
+        while self.running and self._steps < max_steps:
+            self.step()
+        return BatchOutcome(
+            victory=self._victory.copy(),
+            defeat=self._defeat.copy(),
+            foe_kills=np.where(self._finished, self._final_kills, 0),
+            steps=np.where(self._finished, self._final_steps, self._steps),
+        )
+
+    def step(self) -> None:
+        if not self.running:
+            return
+        self._steps += 1
+        self._elapsed += self._step_seconds
+        self._check_stalemate()
+        self._apply_stalemate_bleed()
+        if self._settle():
+            self._take_turns()
+            self._settle()
+
+    def _take_turns(self) -> None:
+        rng = self._rng
+        rows = np.arange(self.running)
+        alive = self.hp > 0
+
+        # Lowest pending action value acts; argmin breaks ties by column, like TurnScheduler.
+        attacker = np.argmin(np.where(alive, self.next_turn_at, np.inf), axis=1)
+        self.next_turn_at[rows, attacker] += self.base_action_value[rows, attacker]
+        party_turn = (self.team[rows, attacker] == PARTY)[:, None]
+        allies = alive & np.where(party_turn, (self.team == PARTY) | (self.team == RESERVE), self.team == FOE)
+        enemies = alive & np.where(party_turn, self.team == FOE, self.team == PARTY)
+
+        self.turns[rows, attacker] += 1
+        element = self.element[rows, attacker]
+        acting, multiplier = self._element_mechanics(rows, attacker, element, allies)
+
+        kills = np.zeros(rows.size, dtype=np.int64)
+
+        # Wind: every living enemy takes its own roll, split by the enemy count.
+        wind = np.flatnonzero(acting & (element == _WIND))
+        if wind.size:
+            targets = enemies[wind]
+            damage, _, _ = self._rolls(wind, attacker[wind], np.arange(self.hp.shape[1])[None, :], multiplier[wind])
+            gust = np.where(targets, damage // np.maximum(1, targets.sum(axis=1))[:, None], 0)
+            hp = self.hp[wind]
+            after = np.maximum(0, hp - gust)
+            self.hp[wind] = after
+            kills[wind] = (targets & (after <= 0) & (self.team[wind] == FOE)).sum(axis=1)
+
+        single = np.flatnonzero(acting & (element != _WIND))
+        if single.size:
+            targets = enemies[single]
+            # The party picks foes uniformly; foes pick by aggro (uniformly if nobody has any).
+            weights = np.where(targets, self.aggro[single], 0.0)
+            uniform = party_turn[single, 0] | (weights.sum(axis=1) <= 0)
+            weights[uniform] = targets[uniform]
+            target = weighted_pick(weights, rng)
+            hits = np.where(element[single] == _LIGHTNING, LIGHTNING_HITS, 1)
+            for hit in range(int(hits.max())):
+                landing = np.flatnonzero((hits > hit) & (self.hp[single, target] > 0))
+                if not landing.size:
+                    break
+                battle = single[landing]
+                column = target[landing]
+                damage, _, _ = self._rolls(battle, attacker[battle], column[:, None], multiplier[battle])
+                after = np.maximum(0, self.hp[battle, column] - damage[:, 0])
+                self.hp[battle, column] = after
+                kills[battle] += (after <= 0) & (self.team[battle, column] == FOE)
+
+        self.foe_kills += kills
+
+    def _rolls(
+        self,
+        rows: np.ndarray,
+        attacker: np.ndarray,
+        targets: np.ndarray,
+        multiplier: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rolls for each row's attacker against `targets` (column indices, (B, K) or (1, K))."""
+        target_rows = rows[:, None]
+        return damage_rolls(
+            atk=self.atk[rows, attacker][:, None],
+            attacker_element=self.element[rows, attacker][:, None],
+            attacker_vitality=self.vitality[rows, attacker][:, None],
+            crit_rate=self.crit_rate[rows, attacker][:, None],
+            crit_damage=self.crit_damage[rows, attacker][:, None],
+            defense=self.defense[target_rows, targets],
+            passes=self.passes[target_rows, targets],
+            target_element=self.element[target_rows, targets],
+            target_vitality=self.vitality[target_rows, targets],
+            mitigation=self.mitigation[target_rows, targets],
+            dodge=self.dodge[target_rows, targets],
+            damage_multiplier=multiplier[:, None],
+            rng=self._rng,
+        )
+
+    def _settle(self) -> bool:
+        """Record and drop finished rows; returns True while any battle is still running."""
+        alive = self.hp > 0
+        party_alive = (alive & (self.team == PARTY)).any(axis=1)
+        foes_alive = (alive & (self.team == FOE)).any(axis=1)
+        over = ~party_alive | ~foes_alive
+        if over.any():
+            origin = self.rows_origin[over]
+            self._victory[origin] = party_alive[over] & ~foes_alive[over]
+            self._defeat[origin] = foes_alive[over] & ~party_alive[over]
+            self._final_kills[origin] = self.foe_kills[over]
+            self._final_steps[origin] = self._steps
+            self._finished[origin] = True
+            keep = ~over
+            for name in _STAT_FIELDS + _ROW_FIELDS:
+                setattr(self, name, getattr(self, name)[keep])
+        return bool(self.running)
@@ -0,0 +1,120 @@
+"""Element mechanics and stalemate bleed for `BatchBattle` (needs the `sim` extra: NumPy).
+
+Both mirror the scalar rules in `endless_idler.combat.mechanics` and
+`endless_idler.combat.stalemate`, applied to every running battle at once.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from endless_idler.combat.batch_rolls import reduce_hp_percent
+from endless_idler.combat.damage_types import ELEMENT_CODES
+from endless_idler.combat.stalemate import STALEMATE_BLEED_INTERVAL_STEPS
+from endless_idler.combat.stalemate import STALEMATE_BLEED_PER_STACK
+from endless_idler.combat.stalemate import STALEMATE_CHECK_SECONDS
+from endless_idler.combat.stalemate import STALEMATE_RATIO_CHANGE
+
+
+EMPTY = -1
+PARTY = 0
+RESERVE = 1
+FOE = 2
+
+_FIRE = ELEMENT_CODES["fire"]
+_ICE = ELEMENT_CODES["ice"]
+_DARK = ELEMENT_CODES["dark"]
+_LIGHT = ELEMENT_CODES["light"]
+
+
+class BatchMechanics:
+    """`BatchBattle` mixin for the pre-attack element rules and the stalemate state."""
+
+    def _element_mechanics(
+        self,
+        rows: np.ndarray,
+        attacker: np.ndarray,
+        element: np.ndarray,
+        allies: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Apply ice, light, dark and fire before the attack; returns (acting, damage multiplier)."""
+        acting = np.ones(rows.size, dtype=bool)
+        multiplier = np.ones(rows.size)
+
+        # Ice: every other turn is spent charging.
+        ice = np.flatnonzero(element == _ICE)
+        if ice.size:
+            was_charged = self.charged[ice, attacker[ice]]
+            self.charged[ice, attacker[ice]] = ~was_charged
+            acting[ice[~was_charged]] = False
+
+        # Light: heal wounded allies instead of attacking (reserves heal double).
+        light = np.flatnonzero(acting & (element == _LIGHT))
+        if light.size:
+            hp = self.hp[light]
+            max_hp = self.max_hp[light]
+            wounded = allies[light] & (hp < max_hp)
+            wounded_count = wounded.sum(axis=1)
+            base_power = np.maximum(1, np.round(self.atk[light, attacker[light]] * 0.05))
+            per_target = np.where(
+                wounded_count == 1,
+                base_power,
+                np.maximum(1, np.round(base_power / np.maximum(1, wounded_count))),
+            )
+            amount = per_target[:, None] * np.where(self.team[light] == RESERVE, 2, 1)
+            self.hp[light] = hp + np.where(wounded, np.minimum(amount, max_hp - hp), 0).astype(np.int64)
+            acting[light[wounded_count > 0]] = False
+
+        # Dark: sacrifice ally HP (reserves three times as much) for a damage bonus.
+        dark = np.flatnonzero(acting & (element == _DARK))
+        if dark.size:
+            percent = np.where(self.team[dark] == RESERVE, 0.15, 0.05)
+            removed = reduce_hp_percent(self.hp[dark], self.max_hp[dark], percent, allies[dark])
+            self.hp[dark] -= removed
+            multiplier[dark] *= 1.0 + 0.0001 * removed.sum(axis=1)
+
+        # Fire: growing self-bleed for a damage bonus.
+        fire = np.flatnonzero(acting & (element == _FIRE))
+        if fire.size:
+            column = attacker[fire]
+            bleed = np.minimum(0.50, 0.0005 * self.turns[fire, column])
+            removed = reduce_hp_percent(self.hp[fire, column], self.max_hp[fire, column], bleed, True)
+            self.hp[fire, column] -= removed
+            multiplier[fire] *= 1.0 + 0.05 * removed
+
+        return acting, multiplier
+
+    def _hp_ratio(self) -> np.ndarray:
+        alive = self.hp > 0
+        ratio = np.where(alive, self.max_hp / np.maximum(1, self.hp), 0.0)
+        allies = np.where((self.team == PARTY) | (self.team == RESERVE), ratio, 0.0).sum(axis=1)
+        foes = np.where(self.team == FOE, ratio, 0.0).sum(axis=1)
+        return allies / np.maximum(0.01, foes)
+
+    def _check_stalemate(self) -> None:
+        if self._stalemate_checked_at is None:
+            self.stalemate_ratio = self._hp_ratio()
+            self._stalemate_checked_at = self._elapsed
+            return
+        if self._elapsed - self._stalemate_checked_at < STALEMATE_CHECK_SECONDS:
+            return
+        current = self._hp_ratio()
+        previous = self.stalemate_ratio
+        change = np.abs(current - previous) / np.maximum(0.01, np.abs(previous))
+        self.stalemate_stacks += change < STALEMATE_RATIO_CHANGE
+        self.stalemate_ratio = current
+        self._stalemate_checked_at = self._elapsed
+
+    def _apply_stalemate_bleed(self) -> None:
+        bleeding = self.stalemate_stacks > 0
+        if not bleeding.any():
+            return
+        self.bleed_counter += bleeding
+        due = bleeding & (self.bleed_counter >= STALEMATE_BLEED_INTERVAL_STEPS)
+        if not due.any():
+            return
+        self.bleed_counter[due] = 0
+        percent = STALEMATE_BLEED_PER_STACK * self.stalemate_stacks
+        damage = np.maximum(1, np.floor(self.hp * percent[:, None])).astype(np.int64)
+        apply = due[:, None] & (self.hp > 0) & (self.team != EMPTY)
+        self.hp = np.where(apply, np.maximum(0, self.hp - damage), self.hp)
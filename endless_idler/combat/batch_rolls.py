@@ -0,0 +1,92 @@
+"""Vectorized roll kernels for `BatchBattle` (needs the `sim` extra: NumPy).
+
+`damage_rolls` is `calculate_damage` without passives over broadcast arrays;
+the helpers below it are the array forms of aggro targeting and the
+percent-of-max HP removal used by dark and fire.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from endless_idler.combat.damage_types import TYPE_MULTIPLIERS
+from endless_idler.combat.mechanics import MIN_REMAINING_HP_FRACTION
+from endless_idler.combat.stats import Stats
+
+
+# The scalar path's TYPE_MULTIPLIERS, indexed [attacker_code, defender_code].
+TYPE_MATRIX = np.array(TYPE_MULTIPLIERS, dtype=np.float64)
+
+
+def damage_rolls(
+    *,
+    atk: np.ndarray,
+    attacker_element: np.ndarray,
+    attacker_vitality: np.ndarray,
+    crit_rate: np.ndarray,
+    crit_damage: np.ndarray,
+    defense: np.ndarray,
+    passes: np.ndarray,
+    target_element: np.ndarray,
+    target_vitality: np.ndarray,
+    mitigation: np.ndarray,
+    dodge: np.ndarray,
+    damage_multiplier: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """`calculate_damage` without passives, over broadcast arrays.
+
+    Returns (damage, crit, dodged); dodged entries deal 0 damage.
+    """
+    shape = np.broadcast_shapes(np.shape(atk), np.shape(defense))
+    dodged = rng.random(shape) < np.clip(dodge, 0.0, 1.0)
+
+    mitigation_multiplier = (100.0 / (100.0 + np.maximum(0.0, defense))) ** np.maximum(1, passes)
+    base = atk * mitigation_multiplier
+    base = base * TYPE_MATRIX[attacker_element, target_element]
+    base = base * np.maximum(0.01, attacker_vitality)
+    base = base / np.maximum(0.01, target_vitality)
+    base = base / np.maximum(0.1, mitigation)
+    base = base * np.maximum(0.0, damage_multiplier)
+
+    crit = rng.random(shape) < np.clip(crit_rate, 0.0, 1.0)
+    base = np.where(crit, base * np.maximum(1.0, crit_damage), base)
+    base = base * rng.uniform(0.9, 1.1, shape)
+    damage = np.maximum(1, np.floor(base)).astype(np.int64)
+    return np.where(dodged, 0, damage), crit & ~dodged, dodged
+
+
+def sample_damage(attacker: Stats, target: Stats, *, samples: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """`samples` independent vectorized rolls of one attacker hitting one target."""
+    shape = (max(0, int(samples)),)
+    return damage_rolls(
+        atk=np.full(shape, float(attacker.atk)),
+        attacker_element=np.full(shape, attacker.element_code),
+        attacker_vitality=np.full(shape, float(attacker.vitality)),
+        crit_rate=np.full(shape, float(attacker.crit_rate)),
+        crit_damage=np.full(shape, float(attacker.crit_damage)),
+        defense=np.full(shape, float(target.defense)),
+        passes=np.full(shape, max(1, int(getattr(target, "damage_reduction_passes", 1) or 1))),
+        target_element=np.full(shape, target.element_code),
+        target_vitality=np.full(shape, float(target.vitality)),
+        mitigation=np.full(shape, float(target.mitigation)),
+        dodge=np.full(shape, float(target.dodge_odds)),
+        damage_multiplier=np.ones(shape),
+        rng=rng,
+    )
+
+
+def weighted_pick(weights: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """One column per row, drawn proportionally to non-negative `weights` (B, N)."""
+    cumulative = np.cumsum(weights, axis=1)
+    roll = rng.random(weights.shape[0]) * cumulative[:, -1]
+    picked = (cumulative < roll[:, None]).sum(axis=1)
+    return np.minimum(picked, weights.shape[1] - 1)
+
+
+def reduce_hp_percent(hp: np.ndarray, max_hp: np.ndarray, percent: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """`reduce_hp_percent_of_max` over arrays; returns the HP removed (0 outside `mask`)."""
+    min_hp = np.maximum(1, np.ceil(MIN_REMAINING_HP_FRACTION * max_hp))
+    desired = np.ceil(np.maximum(0.0, percent) * max_hp)
+    removed = np.minimum(np.maximum(0, hp - min_hp), np.maximum(0, desired))
+    return np.where(mask & (hp > min_hp), removed, 0).astype(np.int64)
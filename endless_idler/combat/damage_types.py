@@ -55,9 +55,30 @@ _PROTOTYPE_TYPE_CHART: dict[str, dict[str, str]] = {
 }
 
 
-def type_multiplier(attacker_type_id: str, defender_type_id: str) -> float:
-    attacker = normalize_damage_type_id(attacker_type_id)
-    defender = normalize_damage_type_id(defender_type_id)
+# Small-int element codes, fixed once at import. `Stats` resolves its code when
+# `damage_type` is assigned, so hit resolution can index `TYPE_MULTIPLIERS` directly.
+ELEMENT_IDS: tuple[str, ...] = (
+    "fire",
+    "ice",
+    "lightning",
+    "dark",
+    "light",
+    "wind",
+    "generic",
+)
+ELEMENT_CODES: dict[str, int] = {element_id: code for code, element_id in enumerate(ELEMENT_IDS)}
+GENERIC_ELEMENT_CODE = ELEMENT_CODES["generic"]
+
+
+def element_code(value: str) -> int:
+    """Code for an element ID; unknown IDs fall back to generic."""
+    code = ELEMENT_CODES.get(value)
+    if code is None:
+        code = ELEMENT_CODES.get(normalize_damage_type_id(value), GENERIC_ELEMENT_CODE)
+    return code
+
+
+def _chart_multiplier(attacker: str, defender: str) -> float:
     defender_info = _PROTOTYPE_TYPE_CHART.get(defender, _PROTOTYPE_TYPE_CHART["generic"])
 
     if defender_info["weakness"] == attacker:
@@ -67,67 +88,132 @@ def type_multiplier(attacker_type_id: str, defender_type_id: str) -> float:
     return 1.0
 
 
+# TYPE_MULTIPLIERS[attacker_code][defender_code] == type_multiplier(attacker_id, defender_id)
+TYPE_MULTIPLIERS: tuple[tuple[float, ...], ...] = tuple(
+    tuple(_chart_multiplier(attacker, defender) for defender in ELEMENT_IDS) for attacker in ELEMENT_IDS
+)
+
+
+def type_multiplier(attacker_type_id: str, defender_type_id: str) -> float:
+    attacker_code = ELEMENT_CODES.get(attacker_type_id)
+    defender_code = ELEMENT_CODES.get(defender_type_id)
+    if attacker_code is not None and defender_code is not None:
+        return TYPE_MULTIPLIERS[attacker_code][defender_code]
+    return _chart_multiplier(
+        normalize_damage_type_id(attacker_type_id),
+        normalize_damage_type_id(defender_type_id),
+    )
+
+
 class DamageTypeBase:
+    """A stateless damage type; each class has one shared instance (a flyweight).
+
+    Constructing a damage type returns that instance, so damage types can be
+    compared by identity (`stats.damage_type is FIRE`).
+    """
+
+    __slots__ = ()
+
     id: str = "generic"
     name: str = "Generic"
 
+    def __new__(cls) -> DamageTypeBase:
+        instance = _INSTANCES.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            _INSTANCES[cls] = instance
+        return instance
+
+    def __copy__(self) -> DamageTypeBase:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> DamageTypeBase:
+        return self
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id!r}, name={self.name!r})"
 
 
+_INSTANCES: dict[type[DamageTypeBase], DamageTypeBase] = {}
+
+
 class Fire(DamageTypeBase):
+    __slots__ = ()
     id = "fire"
     name = "Fire"
 
 
 class Ice(DamageTypeBase):
+    __slots__ = ()
     id = "ice"
     name = "Ice"
 
 
 class Wind(DamageTypeBase):
+    __slots__ = ()
     id = "wind"
     name = "Wind"
 
 
 class Lightning(DamageTypeBase):
+    __slots__ = ()
     id = "lightning"
     name = "Lightning"
 
 
 class Light(DamageTypeBase):
+    __slots__ = ()
     id = "light"
     name = "Light"
 
 
 class Dark(DamageTypeBase):
+    __slots__ = ()
     id = "dark"
     name = "Dark"
 
 
 class Generic(DamageTypeBase):
+    __slots__ = ()
     id = "generic"
     name = "Generic"
 
 
-_DAMAGE_TYPES_BY_ID: dict[str, type[DamageTypeBase]] = {
-    cls.id: cls
-    for cls in (
-        Fire,
-        Ice,
-        Wind,
-        Lightning,
-        Light,
-        Dark,
-        Generic,
+FIRE = Fire()
+ICE = Ice()
+WIND = Wind()
+LIGHTNING = Lightning()
+LIGHT = Light()
+DARK = Dark()
+GENERIC = Generic()
+
+_DAMAGE_TYPES_BY_ID: dict[str, DamageTypeBase] = {
+    damage_type.id: damage_type
+    for damage_type in (
+        FIRE,
+        ICE,
+        WIND,
+        LIGHTNING,
+        LIGHT,
+        DARK,
+        GENERIC,
     )
 }
+# Raw spellings seen by `load_damage_type`, so each is normalized only once.
+_DAMAGE_TYPES_BY_RAW: dict[str, DamageTypeBase] = dict(_DAMAGE_TYPES_BY_ID)
 
 
 def load_damage_type(value: str | DamageTypeBase | None) -> DamageTypeBase:
+    """The shared damage-type instance for `value` (generic when unknown)."""
     if isinstance(value, DamageTypeBase):
         return value
 
-    normalized = normalize_damage_type_id(str(value or "generic"))
-    normalized = normalized.split("/", 1)[0].strip()
-    return _DAMAGE_TYPES_BY_ID.get(normalized, Generic)()
+    raw = str(value or "generic")
+    damage_type = _DAMAGE_TYPES_BY_RAW.get(raw)
+    if damage_type is None:
+        normalized = normalize_damage_type_id(raw)
+        normalized = normalized.split("/", 1)[0].strip()
+        damage_type = _DAMAGE_TYPES_BY_ID.get(normalized, GENERIC)
+        if len(_DAMAGE_TYPES_BY_RAW) < 256:
+            _DAMAGE_TYPES_BY_RAW[raw] = damage_type
+    return damage_type
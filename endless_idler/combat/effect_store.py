@@ -0,0 +1,141 @@
+"""Indexed storage for the `StatEffect`s active on one `Stats`.
+
+Effects are keyed by name (adding a name again replaces the old effect and
+moves it to the end), with secondary indexes by source and by modified stat.
+Expiry uses a tick clock and a heap of expiry ticks instead of decrementing
+every effect on every tick. `StatEffect.duration` is brought up to date
+whenever effects are read back out of the store.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from endless_idler.combat.stat_effect import StatEffect
+
+
+@dataclass(slots=True)
+class _Entry:
+    effect: StatEffect
+    seq: int
+    # Tick on which the effect expires; None for permanent (negative duration) effects.
+    expires_at: int | None
+
+
+class EffectStore:
+    """Active effects in application order, with O(1) lookups and heap-based expiry.
+
+    `modifier()` returns the per-stat total of every effect's `stat_modifiers`,
+    summed in application order so the floats match a plain walk over the
+    effects. Effects are read when they are added: to change one, add it
+    again instead of editing its `stat_modifiers` or `duration` in place.
+    """
+
+    def __init__(self) -> None:
+        self._by_name: dict[str, _Entry] = {}
+        # Insertion-ordered name sets (dict keys), so removal keeps effect order.
+        self._by_source: dict[str, dict[str, None]] = {}
+        self._by_stat: dict[str, dict[str, float]] = {}
+        self._totals: dict[str, float] = {}
+        # (expires_at, seq, name); entries whose seq no longer matches are stale.
+        self._expiry: list[tuple[int, int, str]] = []
+        self._clock = 0
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[StatEffect]:
+        for entry in list(self._by_name.values()):
+            yield self._synced(entry)
+
+    def get(self, name: str) -> StatEffect | None:
+        entry = self._by_name.get(name)
+        return None if entry is None else self._synced(entry)
+
+    def modifier(self, stat_name: str) -> float:
+        return self._totals.get(stat_name, 0.0)
+
+    def add(self, effect: StatEffect) -> None:
+        self.remove(effect.name)
+        self._seq += 1
+        duration = int(effect.duration)
+        expires_at = None if duration < 0 else self._clock + duration
+        self._by_name[effect.name] = _Entry(effect=effect, seq=self._seq, expires_at=expires_at)
+        self._by_source.setdefault(effect.source, {})[effect.name] = None
+        for stat_name, value in effect.stat_modifiers.items():
+            if isinstance(value, (int, float)):
+                value = float(value)
+                self._by_stat.setdefault(stat_name, {})[effect.name] = value
+                # The new effect is last, so a running sum keeps the walk order.
+                self._totals[stat_name] = self._totals.get(stat_name, 0.0) + value
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, self._seq, effect.name))
+
+    def remove(self, name: str) -> bool:
+        entry = self._by_name.pop(name, None)
+        if entry is None:
+            return False
+        effect = entry.effect
+        names = self._by_source.get(effect.source)
+        if names is not None:
+            names.pop(name, None)
+            if not names:
+                del self._by_source[effect.source]
+        for stat_name in effect.stat_modifiers:
+            contributions = self._by_stat.get(stat_name)
+            if contributions is None or contributions.pop(name, None) is None:
+                continue
+            self._resum(stat_name, contributions)
+        # The heap entry goes stale and is dropped when it surfaces.
+        return True
+
+    def remove_source(self, source: str) -> int:
+        names = self._by_source.get(source)
+        if not names:
+            return 0
+        removed = 0
+        for name in list(names):
+            removed += int(self.remove(name))
+        return removed
+
+    def tick(self) -> list[StatEffect]:
+        """Advance one tick and drop the effects that ran out; returns them."""
+        self._clock += 1
+        expired: list[StatEffect] = []
+        while self._expiry and self._expiry[0][0] <= self._clock:
+            _, seq, name = heapq.heappop(self._expiry)
+            entry = self._by_name.get(name)
+            if entry is None or entry.seq != seq:
+                continue
+            self.remove(name)
+            expired.append(self._synced(entry))
+        return expired
+
+    def clear(self) -> None:
+        self._by_name.clear()
+        self._by_source.clear()
+        self._by_stat.clear()
+        self._totals.clear()
+        self._expiry.clear()
+
+    def _resum(self, stat_name: str, contributions: dict[str, float]) -> None:
+        if not contributions:
+            del self._by_stat[stat_name]
+            self._totals.pop(stat_name, None)
+            return
+        total = 0.0
+        for value in contributions.values():
+            total += value
+        self._totals[stat_name] = total
+
+    def _synced(self, entry: _Entry) -> StatEffect:
+        if entry.expires_at is not None:
+            entry.effect.duration = max(0, entry.expires_at - self._clock)
+        return entry.effect
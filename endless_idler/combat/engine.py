@@ -0,0 +1,308 @@
+"""Headless battle rules.
+
+`BattleEngine` steps a battle between a party (plus its reserves) and a list of
+foes and describes everything that happened as a list of typed events. It has
+no Qt dependency: the battle screen replays the events onto its widgets, while
+tests and simulations can call `run()` to resolve a battle at full speed.
+
+The events live in `endless_idler.combat.events`, attack resolution in
+`attacks` and stalemate bleed in `stalemate`; this module owns the turn loop.
+"""
+
+from __future__ import annotations
+
+import random
+
+from typing import Any
+
+from endless_idler.combat.attacks import LIGHTNING_HITS
+from endless_idler.combat.attacks import AttackContext
+from endless_idler.combat.attacks import BattleAttacks
+from endless_idler.combat.damage_types import DARK
+from endless_idler.combat.damage_types import FIRE
+from endless_idler.combat.damage_types import ICE
+from endless_idler.combat.damage_types import LIGHT
+from endless_idler.combat.damage_types import LIGHTNING
+from endless_idler.combat.damage_types import WIND
+from endless_idler.combat.events import BattleEvent
+from endless_idler.combat.events import BattleOverEvent
+from endless_idler.combat.events import BleedEvent
+from endless_idler.combat.events import DodgeEvent
+from endless_idler.combat.events import FellEvent
+from endless_idler.combat.events import HealEvent
+from endless_idler.combat.events import HitEvent
+from endless_idler.combat.events import StatChangeEvent
+from endless_idler.combat.events import StatusEvent
+from endless_idler.combat.events import TurnEvent
+from endless_idler.combat.mechanics import apply_dark_sacrifice
+from endless_idler.combat.mechanics import apply_fire_self_bleed
+from endless_idler.combat.mechanics import dark_damage_multiplier_from_removed_hp
+from endless_idler.combat.mechanics import fire_damage_multiplier_from_removed_hp
+from endless_idler.combat.mechanics import resolve_light_heal
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.stalemate import STALEMATE_BLEED_INTERVAL_STEPS
+from endless_idler.combat.stalemate import STALEMATE_BLEED_PER_STACK
+from endless_idler.combat.stalemate import STALEMATE_CHECK_SECONDS
+from endless_idler.combat.stalemate import STALEMATE_RATIO_CHANGE
+from endless_idler.combat.stalemate import BattleStalemate
+from endless_idler.combat.turns import TurnScheduler
+from endless_idler.passives.execution import trigger_turn_start_passives
+from endless_idler.passives.results import HealResult
+from endless_idler.passives.results import RedirectResult
+from endless_idler.passives.results import ShieldResult
+from endless_idler.passives.results import StatChangeResult
+from endless_idler.passives.results import iter_effects
+
+
+BATTLE_STEP_SECONDS = 0.24
+
+__all__ = [
+    "BATTLE_STEP_SECONDS",
+    "LIGHTNING_HITS",
+    "STALEMATE_BLEED_INTERVAL_STEPS",
+    "STALEMATE_BLEED_PER_STACK",
+    "STALEMATE_CHECK_SECONDS",
+    "STALEMATE_RATIO_CHANGE",
+    "BattleEngine",
+    "BattleEvent",
+    "BattleOverEvent",
+    "BleedEvent",
+    "DodgeEvent",
+    "FellEvent",
+    "HealEvent",
+    "HitEvent",
+    "StatChangeEvent",
+    "StatusEvent",
+    "TurnEvent",
+]
+
+
+class BattleEngine(BattleAttacks, BattleStalemate):
+    """Runs the battle rules one attacker turn per `step()`.
+
+    Onsite combatants act in action-gauge order (`TurnScheduler`): faster
+    combatants get proportionally more turns. Stalemate detection runs on
+    simulated time (`step_seconds` per step), so a battle resolves the same way
+    whether it is stepped by a UI timer or in a tight loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        party: list[Combatant],
+        reserves: list[Combatant],
+        foes: list[Combatant],
+        rng: random.Random,
+        step_seconds: float = BATTLE_STEP_SECONDS,
+    ) -> None:
+        self.party = party
+        self.reserves = reserves
+        self.foes = foes
+        self._rng = rng
+        self._step_seconds = float(max(0.0, step_seconds))
+        self._elapsed = 0.0
+        # Identity sets: Combatant is a dataclass, so `in` on the lists would compare every field.
+        self._party_ids = {id(combatant) for combatant in party}
+        self._foe_ids = {id(combatant) for combatant in foes}
+        self._scheduler = TurnScheduler(party + foes)
+        self._over = False
+        self._foe_kills = 0
+        self._events: list[BattleEvent] = []
+
+        self._stalemate_hp_ratio: float | None = None
+        self._stalemate_last_check_at = 0.0
+        self._stalemate_stacks = 0
+        self._stalemate_tick_counter = 0
+
+    @property
+    def over(self) -> bool:
+        return self._over
+
+    @property
+    def foe_kills(self) -> int:
+        return self._foe_kills
+
+    @property
+    def stalemate_stacks(self) -> int:
+        return self._stalemate_stacks
+
+    def upcoming_turns(self, count: int = 5) -> list[Combatant]:
+        """Who acts next, in order, assuming no speed changes or deaths."""
+        return self._scheduler.upcoming(count)
+
+    def run(self, *, max_steps: int = 100_000) -> BattleOverEvent | None:
+        """Step until the battle ends; returns the final event, or None if `max_steps` ran out."""
+        for _ in range(max(0, int(max_steps))):
+            for event in self.step():
+                if isinstance(event, BattleOverEvent):
+                    return event
+        return None
+
+    def step(self) -> list[BattleEvent]:
+        """Advance one turn and return the events it produced."""
+        events: list[BattleEvent] = []
+        if self._over:
+            return events
+        self._events = events
+        self._elapsed += self._step_seconds
+        self._step()
+        return events
+
+    def _step(self) -> None:
+        if self._is_over():
+            self._finish()
+            return
+
+        self._check_stalemate()
+        self._apply_stalemate_bleed()
+
+        party_alive = [c for c in self.party if c.stats.hp > 0]
+        foes_alive = [c for c in self.foes if c.stats.hp > 0]
+        if not party_alive or not foes_alive:
+            self._finish()
+            return
+
+        # Passive results name allies by slot in `all_allies`, which `allies` mirrors.
+        allies = party_alive + [c for c in self.reserves if c.stats.hp > 0]
+        ally_stats = [c.stats for c in allies]
+        turn_start_results = trigger_turn_start_passives(
+            all_allies=ally_stats,
+            onsite_allies=ally_stats[: len(party_alive)],
+            offsite_allies=ally_stats[len(party_alive) :],
+            enemies=[c.stats for c in foes_alive],
+        )
+        if turn_start_results:
+            self._apply_passive_results(turn_start_results, allies)
+
+        # Turn-start passives may have buffed or slowed someone.
+        self._scheduler.refresh_speeds()
+        attacker = self._scheduler.next_turn()
+        if attacker is None:
+            self._finish()
+            return
+        attacker_side = "party" if id(attacker) in self._party_ids else "foes"
+        self._emit(TurnEvent(actor=attacker))
+
+        attacker.turns_taken += 1
+        damage_type = attacker.stats.damage_type
+        element_id = attacker.stats.element_id
+
+        if attacker_side == "party":
+            allies_onsite = party_alive
+            allies_offsite = [c for c in self.reserves if c.stats.hp > 0]
+            enemies = foes_alive
+        else:
+            allies_onsite = foes_alive
+            allies_offsite = []
+            enemies = party_alive
+
+        if damage_type is ICE:
+            if not attacker.ice_charge_ready:
+                attacker.ice_charge_ready = True
+                self._status(f"{attacker.name} is charging…")
+                return
+            attacker.ice_charge_ready = False
+
+        if damage_type is LIGHT:
+            healed = resolve_light_heal(
+                attacker=attacker,
+                onsite_allies=allies_onsite,
+                offsite_allies=allies_offsite,
+            )
+            if healed:
+                self._status(f"{attacker.name} heals!")
+                for target, amount in healed:
+                    self._emit(HealEvent(source=attacker, target=target, amount=amount))
+                return
+
+        if damage_type is DARK:
+            allies = allies_onsite + allies_offsite
+            hp_before = [int(ally.stats.hp) for ally in allies]
+            removed = apply_dark_sacrifice(onsite_allies=allies_onsite, offsite_allies=allies_offsite)
+            attacker.pending_damage_multiplier *= dark_damage_multiplier_from_removed_hp(removed)
+            if removed:
+                self._status(f"{attacker.name} sacrifices {removed} HP!")
+                for ally, before in zip(allies, hp_before, strict=False):
+                    lost = before - int(ally.stats.hp)
+                    if lost > 0:
+                        self._emit(BleedEvent(target=ally, amount=lost, cause="dark"))
+
+        if damage_type is FIRE:
+            removed = apply_fire_self_bleed(combatant=attacker, turns_taken=attacker.turns_taken)
+            attacker.pending_damage_multiplier *= fire_damage_multiplier_from_removed_hp(removed)
+            if removed:
+                self._emit(BleedEvent(target=attacker, amount=removed, cause="fire"))
+
+        damage_multiplier = float(max(0.0, attacker.pending_damage_multiplier))
+        attacker.pending_damage_multiplier = 1.0
+
+        if not enemies:
+            return
+
+        context = AttackContext(
+            attacker=attacker,
+            element_id=element_id,
+            damage_multiplier=damage_multiplier,
+            onsite_allies=[c.stats for c in allies_onsite],
+            offsite_allies=[c.stats for c in allies_offsite],
+            enemies=[c.stats for c in enemies],
+        )
+        if damage_type is WIND:
+            self._wind_attack(context, enemies)
+        elif damage_type is LIGHTNING:
+            self._lightning_attack(context, self._pick_target(context, enemies, attacker_side))
+        else:
+            self._single_attack(context, self._pick_target(context, enemies, attacker_side))
+
+        if self._is_over():
+            self._finish()
+
+
+    def _apply_passive_results(self, results: list[dict[str, Any]], allies: list[Combatant]) -> None:
+        """Emit events for the typed effects of passives, one per touched ally.
+
+        Passives have already changed the stats; the events let the screen and the
+        replay recorder update only the combatants involved.
+        """
+        for effect in iter_effects(results):
+            if isinstance(effect, RedirectResult) or not 0 <= effect.slot < len(allies):
+                # Redirects only matter while a target is being picked.
+                continue
+            target = allies[effect.slot]
+            if isinstance(effect, HealResult):
+                if effect.amount > 0:
+                    self._emit(HealEvent(source=None, target=target, amount=int(effect.amount)))
+            elif isinstance(effect, ShieldResult):
+                self._emit(StatChangeEvent(target=target, stat="shields", amount=float(effect.amount)))
+            elif isinstance(effect, StatChangeResult):
+                self._emit(StatChangeEvent(target=target, stat=effect.stat, amount=float(effect.amount)))
+
+
+    def _finish(self) -> None:
+        if self._over:
+            return
+        self._over = True
+        self._stalemate_stacks = 0
+        self._stalemate_hp_ratio = None
+        self._stalemate_tick_counter = 0
+
+        party_alive = any(c.stats.hp > 0 for c in self.party)
+        foes_alive = any(c.stats.hp > 0 for c in self.foes)
+        self._emit(
+            BattleOverEvent(
+                victory=bool(party_alive and not foes_alive),
+                defeat=bool(foes_alive and not party_alive),
+                foe_kills=self._foe_kills,
+            )
+        )
+
+    def _is_over(self) -> bool:
+        party_alive = any(c.stats.hp > 0 for c in self.party)
+        foes_alive = any(c.stats.hp > 0 for c in self.foes)
+        return not party_alive or not foes_alive
+
+    def _emit(self, event: BattleEvent) -> None:
+        self._events.append(event)
+
+    def _status(self, message: str) -> None:
+        self._events.append(StatusEvent(message))
@@ -0,0 +1,88 @@
+"""Typed events a `BattleEngine` step produces.
+
+The battle screen animates them and the replay recorder encodes them; neither
+needs to know how the engine decided on them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from endless_idler.combat.sim import Combatant
+
+
+@dataclass(frozen=True, slots=True)
+class TurnEvent:
+    actor: Combatant
+
+
+@dataclass(frozen=True, slots=True)
+class HitEvent:
+    attacker: Combatant
+    target: Combatant
+    damage: int
+    crit: bool
+    element_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class HealEvent:
+    # None for heals from passives rather than from an attack.
+    source: Combatant | None
+    target: Combatant
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class DodgeEvent:
+    attacker: Combatant
+    target: Combatant
+
+
+@dataclass(frozen=True, slots=True)
+class BleedEvent:
+    """HP lost outside a hit: dark sacrifice, fire self-bleed or stalemate bleed."""
+
+    target: Combatant
+    amount: int
+    cause: str
+
+
+@dataclass(frozen=True, slots=True)
+class StatChangeEvent:
+    """A passive changed a stat other than HP (shields count as the "shields" stat)."""
+
+    target: Combatant
+    stat: str
+    amount: float
+
+
+@dataclass(frozen=True, slots=True)
+class FellEvent:
+    target: Combatant
+    side: str
+
+
+@dataclass(frozen=True, slots=True)
+class StatusEvent:
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class BattleOverEvent:
+    victory: bool
+    defeat: bool
+    foe_kills: int
+
+
+BattleEvent = (
+    TurnEvent
+    | HitEvent
+    | HealEvent
+    | DodgeEvent
+    | BleedEvent
+    | StatChangeEvent
+    | FellEvent
+    | StatusEvent
+    | BattleOverEvent
+)
@@ -0,0 +1,283 @@
+"""Monte Carlo forecast for the next run fight.
+
+`simulate_fights` runs headless `BattleEngine` fights for a `FightSetup` and is
+the unit of work shipped to worker processes. `FightForecaster` spreads batches
+of it over a `ProcessPoolExecutor` and merges finished batches as they arrive,
+so `forecast()` sharpens while the pool works. Starting a new setup cancels the
+batches that have not begun and ignores results from older setups.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import multiprocessing
+import threading
+
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.characters.plugins import discover_character_plugins
+from endless_idler.combat.engine import BattleEngine
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.sim import build_battle
+from endless_idler.run_rules import apply_battle_result
+from endless_idler.run_rules import calculate_battle_gold
+from endless_idler.save import RunSave
+
+
+FORECAST_FIGHTS = 1000
+FORECAST_BATCH_FIGHTS = 25
+FORECAST_MAX_STEPS = 20_000
+
+_worker_plugins: list[CharacterPlugin] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FightSetup:
+    """Everything a worker process needs to rebuild the next fight."""
+
+    onsite: tuple[str, ...]
+    offsite: tuple[str, ...]
+    party_level: int
+    fight_number: int
+    stacks: dict[str, int] = field(default_factory=dict)
+    progress_by_id: dict[str, dict[str, float | int]] = field(default_factory=dict)
+    stats_by_id: dict[str, dict[str, float]] = field(default_factory=dict)
+    tokens: int = 0
+    winstreak: int = 0
+    party_hp_current: int = 0
+    party_hp_max: int = 0
+
+    @classmethod
+    def from_save(cls, save: RunSave) -> FightSetup:
+        return cls(
+            onsite=tuple(str(item) for item in save.onsite if item),
+            offsite=tuple(str(item) for item in save.offsite if item),
+            party_level=max(1, int(save.party_level)),
+            fight_number=max(1, int(save.fight_number)),
+            stacks=dict(save.stacks),
+            progress_by_id=dict(save.character_progress),
+            stats_by_id=dict(save.character_stats),
+            tokens=max(0, int(save.tokens)),
+            winstreak=max(0, int(getattr(save, "winstreak", 0))),
+            party_hp_current=int(save.party_hp_current),
+            party_hp_max=int(save.party_hp_max),
+        )
+
+    def build_battle(
+        self,
+        *,
+        plugins: list[CharacterPlugin],
+        rng: random.Random,
+    ) -> tuple[list[Combatant], list[Combatant], list[Combatant]]:
+        """Party, reserves and foes for this fight, rolled from `rng`."""
+        return build_battle(
+            onsite=list(self.onsite),
+            offsite=list(self.offsite),
+            party_level=self.party_level,
+            fight_number=self.fight_number,
+            stacks=self.stacks,
+            plugins=plugins,
+            rng=rng,
+            progress_by_id=self.progress_by_id,
+            stats_by_id=self.stats_by_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FightForecast:
+    """Totals over the fights that ended in a victory or a defeat.
+
+    Fights that ran out of steps without a result are only counted in
+    `unresolved`; the rates and expectations ignore them.
+    """
+
+    fights: int = 0
+    unresolved: int = 0
+    wins: int = 0
+    gold_total: int = 0
+    # Positive when the party loses HP; a won fight heals, so this can go negative.
+    party_hp_loss_total: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def expected_gold(self) -> float:
+        return self.gold_total / self.fights if self.fights else 0.0
+
+    @property
+    def expected_party_hp_loss(self) -> float:
+        return self.party_hp_loss_total / self.fights if self.fights else 0.0
+
+    def merged(self, other: FightForecast) -> FightForecast:
+        return FightForecast(
+            fights=self.fights + other.fights,
+            unresolved=self.unresolved + other.unresolved,
+            wins=self.wins + other.wins,
+            gold_total=self.gold_total + other.gold_total,
+            party_hp_loss_total=self.party_hp_loss_total + other.party_hp_loss_total,
+        )
+
+
+def party_hp_loss(setup: FightSetup, *, victory: bool) -> int:
+    save = RunSave(
+        fight_number=setup.fight_number,
+        party_hp_current=setup.party_hp_current,
+        party_hp_max=setup.party_hp_max,
+        winstreak=setup.winstreak,
+    )
+    before = max(0, min(int(setup.party_hp_current), max(1, int(setup.party_hp_max))))
+    if apply_battle_result(save, victory=victory):
+        return before
+    return before - int(save.party_hp_current)
+
+
+def simulate_fights(
+    setup: FightSetup,
+    seeds: list[int],
+    *,
+    plugins: list[CharacterPlugin] | None = None,
+) -> FightForecast:
+    """Fight the setup once per seed; runs inside worker processes."""
+    global _worker_plugins
+    if plugins is None:
+        if _worker_plugins is None:
+            _worker_plugins = discover_character_plugins()
+        plugins = _worker_plugins
+
+    hp_loss_by_result = {
+        True: party_hp_loss(setup, victory=True),
+        False: party_hp_loss(setup, victory=False),
+    }
+    fights = 0
+    wins = 0
+    gold_total = 0
+    hp_loss_total = 0
+    for seed in seeds:
+        rng = random.Random(seed)
+        party, reserves, foes = setup.build_battle(plugins=plugins, rng=rng)
+        engine = BattleEngine(party=party, reserves=reserves, foes=foes, rng=rng)
+        result = engine.run(max_steps=FORECAST_MAX_STEPS)
+        if result is None or not (result.victory or result.defeat):
+            continue
+        fights += 1
+        wins += int(result.victory)
+        gold_total += calculate_battle_gold(
+            result.foe_kills,
+            victory=result.victory,
+            tokens=setup.tokens,
+            winstreak=setup.winstreak,
+        )
+        hp_loss_total += hp_loss_by_result[result.victory]
+
+    return FightForecast(
+        fights=fights,
+        unresolved=len(seeds) - fights,
+        wins=wins,
+        gold_total=gold_total,
+        party_hp_loss_total=hp_loss_total,
+    )
+
+
+def _default_executor() -> Executor:
+    # Spawned workers: forking a process that runs a Qt event loop is not safe.
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+class FightForecaster:
+    """Runs `simulate_fights` batches in a process pool and merges partial results.
+
+    Thread-safe: pool callbacks merge under a lock, and the UI polls `forecast()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        fights: int = FORECAST_FIGHTS,
+        batch_fights: int = FORECAST_BATCH_FIGHTS,
+        executor_factory: Callable[[], Executor] | None = None,
+    ) -> None:
+        self._fights = max(1, int(fights))
+        self._batch_fights = max(1, int(batch_fights))
+        self._executor_factory = executor_factory or _default_executor
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._setup: FightSetup | None = None
+        self._pending: list[Future[FightForecast]] = []
+        self._remaining = 0
+        self._forecast = FightForecast()
+        self._seed_rng = random.Random()
+
+    @property
+    def setup(self) -> FightSetup | None:
+        return self._setup
+
+    def start(self, setup: FightSetup) -> None:
+        """Forecast `setup`, dropping whatever was being forecast before."""
+        self.cancel()
+        if not setup.onsite:
+            return
+        with self._lock:
+            generation = self._generation
+            self._setup = setup
+            if self._executor is None:
+                self._executor = self._executor_factory()
+            base_seed = self._seed_rng.randrange(1 << 30)
+            for start in range(0, self._fights, self._batch_fights):
+                seeds = [base_seed + index for index in range(start, min(self._fights, start + self._batch_fights))]
+                self._pending.append(self._executor.submit(simulate_fights, setup, seeds))
+            self._remaining = len(self._pending)
+            pending = list(self._pending)
+        # Outside the lock: a batch that already finished runs its callback right here.
+        for future in pending:
+            future.add_done_callback(lambda done, generation=generation: self._on_batch_done(generation, done))
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._setup = None
+            pending = self._pending
+            self._pending = []
+            self._remaining = 0
+            self._forecast = FightForecast()
+        # Cancelling runs done-callbacks synchronously, so keep it outside the lock.
+        for future in pending:
+            future.cancel()
+
+    def forecast(self) -> FightForecast | None:
+        """Merged result so far, or None before the first batch finishes."""
+        forecast = self._forecast
+        return forecast if forecast.fights else None
+
+    def is_running(self) -> bool:
+        """True until every batch of the current setup has been merged."""
+        return self._remaining > 0
+
+    def shutdown(self) -> None:
+        self.cancel()
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_batch_done(self, generation: int, future: Future[FightForecast]) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._remaining -= 1
+            if not failed:
+                self._forecast = self._forecast.merged(future.result())
@@ -18,6 +18,8 @@ STAT_SHARE_KEYS: tuple[str, ...] = (
     "spd",
 )
 
+INT_SHARE_STATS: frozenset[str] = frozenset({"max_hp", "atk", "defense", "regain", "spd"})
+
 
 def party_scaling(*, party_level: int, stars: int, stacks: int) -> float:
     stars = max(1, min(7, int(stars)))
@@ -166,6 +168,69 @@ def build_scaled_character_stats(
     return stats
 
 
+class OffsiteShareAggregator:
+    """Running per-stat totals of what offsite reserves share with the party.
+
+    Each reserve's contribution is remembered, so replacing one reserve's stats
+    only applies the difference to the totals instead of re-summing every reserve.
+    """
+
+    def __init__(self, *, share: float = 0.10) -> None:
+        self._share = float(share)
+        self._contributions: dict[str, dict[str, float]] = {}
+        self._totals: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._contributions
+
+    @property
+    def share(self) -> float:
+        return self._share
+
+    def set_reserve(self, key: str, stats: Stats) -> None:
+        contribution: dict[str, float] = {}
+        for stat_name in STAT_SHARE_KEYS:
+            base = stats.get_base_stat(stat_name)
+            if isinstance(base, (int, float)):
+                contribution[stat_name] = float(base) * self._share
+
+        previous = self._contributions.get(key)
+        self._contributions[key] = contribution
+        for stat_name, amount in contribution.items():
+            delta = amount if previous is None else amount - previous.get(stat_name, 0.0)
+            self._totals[stat_name] = self._totals.get(stat_name, 0.0) + delta
+        if previous:
+            for stat_name in previous.keys() - contribution.keys():
+                self._totals[stat_name] -= previous[stat_name]
+
+    def remove_reserve(self, key: str) -> None:
+        previous = self._contributions.pop(key, None)
+        if not previous:
+            return
+        for stat_name, amount in previous.items():
+            self._totals[stat_name] -= amount
+
+    def total(self, stat_name: str) -> float:
+        return self._totals.get(stat_name, 0.0)
+
+    def bonus(self, stat_name: str) -> int | float:
+        """Amount added to a party member's base stat (whole numbers for int stats)."""
+        amount = self._totals.get(stat_name, 0.0)
+        if stat_name in INT_SHARE_STATS:
+            return int(round(amount))
+        return float(amount)
+
+    def apply(self, stats: Stats) -> None:
+        if self._share <= 0 or not self._contributions:
+            return
+        for stat_name in self._totals:
+            stats.modify_base_stat(stat_name, self.bonus(stat_name))
+        stats.hp = stats.max_hp
+
+
 def apply_offsite_stat_share(
     *,
     party: list[Stats],
@@ -178,21 +243,9 @@ def apply_offsite_stat_share(
     if not party or not reserves:
         return
 
-    totals: dict[str, float] = {}
-    for reserve in reserves:
-        for stat_name in STAT_SHARE_KEYS:
-            base = reserve.get_base_stat(stat_name)
-            if isinstance(base, (int, float)):
-                totals[stat_name] = totals.get(stat_name, 0.0) + float(base) * share
-
-    if not totals:
-        return
+    aggregator = OffsiteShareAggregator(share=share)
+    for index, reserve in enumerate(reserves):
+        aggregator.set_reserve(str(index), reserve)
 
-    int_stats = {"max_hp", "atk", "defense", "regain", "spd"}
     for stats in party:
-        for stat_name, amount in totals.items():
-            if stat_name in int_stats:
-                stats.modify_base_stat(stat_name, int(round(amount)))
-            else:
-                stats.modify_base_stat(stat_name, float(amount))
-        stats.hp = stats.max_hp
+        aggregator.apply(stats)
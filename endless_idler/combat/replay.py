@@ -0,0 +1,69 @@
+"""Compact battle replays.
+
+A fight is fully determined by its `FightSetup` and the seed of the
+`random.Random` that rolls the lineups and then drives `BattleEngine`.
+`ReplayLog` stores both plus a packed event log (one fixed-size struct per
+event), so the battle screen can re-render a fight without running the rules
+and `verify_replay` can re-simulate it from the seed and check the log still
+matches. `ReplayStore` keeps the last few logs in a ring file next to the save.
+
+The log format lives in `endless_idler.combat.replay_log`, recording and
+playback in `replay_events` and the ring file in `replay_store`.
+"""
+
+from __future__ import annotations
+
+from endless_idler.combat.replay_events import ReplayPlayer
+from endless_idler.combat.replay_events import ReplayRecorder
+from endless_idler.combat.replay_events import record_battle
+from endless_idler.combat.replay_events import verify_replay
+from endless_idler.combat.replay_log import FLAG_BLEED_DARK
+from endless_idler.combat.replay_log import FLAG_BLEED_FIRE
+from endless_idler.combat.replay_log import FLAG_BLEED_STALEMATE
+from endless_idler.combat.replay_log import FLAG_CRIT
+from endless_idler.combat.replay_log import FLAG_DEFEAT
+from endless_idler.combat.replay_log import FLAG_VICTORY
+from endless_idler.combat.replay_log import KIND_BLEED
+from endless_idler.combat.replay_log import KIND_DODGE
+from endless_idler.combat.replay_log import KIND_FELL
+from endless_idler.combat.replay_log import KIND_HEAL
+from endless_idler.combat.replay_log import KIND_HIT
+from endless_idler.combat.replay_log import KIND_OVER
+from endless_idler.combat.replay_log import KIND_TURN
+from endless_idler.combat.replay_log import NO_COMBATANT
+from endless_idler.combat.replay_log import REPLAY_VERSION
+from endless_idler.combat.replay_log import ReplayLog
+from endless_idler.combat.replay_log import ReplayRecord
+from endless_idler.combat.replay_log import new_replay_seed
+from endless_idler.combat.replay_store import REPLAY_STORE_CAPACITY
+from endless_idler.combat.replay_store import ReplayStore
+from endless_idler.combat.replay_store import default_replay_path
+
+
+__all__ = [
+    "FLAG_BLEED_DARK",
+    "FLAG_BLEED_FIRE",
+    "FLAG_BLEED_STALEMATE",
+    "FLAG_CRIT",
+    "FLAG_DEFEAT",
+    "FLAG_VICTORY",
+    "KIND_BLEED",
+    "KIND_DODGE",
+    "KIND_FELL",
+    "KIND_HEAL",
+    "KIND_HIT",
+    "KIND_OVER",
+    "KIND_TURN",
+    "NO_COMBATANT",
+    "REPLAY_STORE_CAPACITY",
+    "REPLAY_VERSION",
+    "ReplayLog",
+    "ReplayPlayer",
+    "ReplayRecord",
+    "ReplayRecorder",
+    "ReplayStore",
+    "default_replay_path",
+    "new_replay_seed",
+    "record_battle",
+    "verify_replay",
+]
@@ -0,0 +1,282 @@
+"""Turning engine events into replay records and back.
+
+`ReplayRecorder` packs the events of each `BattleEngine` step; `ReplayPlayer`
+replays a `ReplayLog` through the same step interface, so the battle screen
+draws a replay exactly like a live fight.
+"""
+
+from __future__ import annotations
+
+import random
+
+from collections.abc import Iterable
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.engine import BattleEngine
+from endless_idler.combat.events import BattleEvent
+from endless_idler.combat.events import BattleOverEvent
+from endless_idler.combat.events import BleedEvent
+from endless_idler.combat.events import DodgeEvent
+from endless_idler.combat.events import FellEvent
+from endless_idler.combat.events import HealEvent
+from endless_idler.combat.events import HitEvent
+from endless_idler.combat.events import StatusEvent
+from endless_idler.combat.events import TurnEvent
+from endless_idler.combat.forecast import FightSetup
+from endless_idler.combat.replay_log import BLEED_FLAGS
+from endless_idler.combat.replay_log import FLAG_CRIT
+from endless_idler.combat.replay_log import FLAG_DEFEAT
+from endless_idler.combat.replay_log import FLAG_VICTORY
+from endless_idler.combat.replay_log import KIND_BLEED
+from endless_idler.combat.replay_log import KIND_DODGE
+from endless_idler.combat.replay_log import KIND_FELL
+from endless_idler.combat.replay_log import KIND_HEAL
+from endless_idler.combat.replay_log import KIND_HIT
+from endless_idler.combat.replay_log import KIND_OVER
+from endless_idler.combat.replay_log import KIND_TURN
+from endless_idler.combat.replay_log import NO_COMBATANT
+from endless_idler.combat.replay_log import RECORD
+from endless_idler.combat.replay_log import ReplayLog
+from endless_idler.combat.replay_log import ReplayRecord
+from endless_idler.combat.sim import Combatant
+
+
+class ReplayRecorder:
+    """Packs engine events into replay records, one `record()` call per engine step."""
+
+    def __init__(self, combatants: Iterable[Combatant]) -> None:
+        self._slot_by_id = {id(combatant): slot for slot, combatant in enumerate(combatants)}
+        self._records = bytearray()
+        self._step = 0
+
+    @property
+    def steps(self) -> int:
+        return self._step
+
+    @property
+    def records(self) -> bytes:
+        return bytes(self._records)
+
+    def record(self, events: Iterable[BattleEvent]) -> None:
+        self._step += 1
+        for event in events:
+            packed = self._pack(event)
+            if packed is not None:
+                self._records += packed
+
+    def log(self, *, setup: FightSetup, seed: int) -> ReplayLog:
+        return ReplayLog(setup=setup, seed=seed, records=self.records)
+
+    def _slot(self, combatant: Combatant | None) -> int:
+        if combatant is None:
+            return NO_COMBATANT
+        return self._slot_by_id.get(id(combatant), NO_COMBATANT)
+
+    def _pack(self, event: BattleEvent) -> bytes | None:
+        step = self._step
+        if isinstance(event, TurnEvent):
+            actor = event.actor
+            return RECORD.pack(step, KIND_TURN, self._slot(actor), NO_COMBATANT, 0, 0, int(actor.stats.hp))
+        if isinstance(event, HitEvent):
+            flags = FLAG_CRIT if event.crit else 0
+            return RECORD.pack(
+                step,
+                KIND_HIT,
+                self._slot(event.attacker),
+                self._slot(event.target),
+                flags,
+                int(event.damage),
+                int(event.target.stats.hp),
+            )
+        if isinstance(event, HealEvent):
+            return RECORD.pack(
+                step,
+                KIND_HEAL,
+                self._slot(event.source),
+                self._slot(event.target),
+                0,
+                int(event.amount),
+                int(event.target.stats.hp),
+            )
+        if isinstance(event, DodgeEvent):
+            return RECORD.pack(
+                step,
+                KIND_DODGE,
+                self._slot(event.attacker),
+                self._slot(event.target),
+                0,
+                0,
+                int(event.target.stats.hp),
+            )
+        if isinstance(event, BleedEvent):
+            return RECORD.pack(
+                step,
+                KIND_BLEED,
+                NO_COMBATANT,
+                self._slot(event.target),
+                BLEED_FLAGS.get(event.cause, 0),
+                int(event.amount),
+                int(event.target.stats.hp),
+            )
+        if isinstance(event, FellEvent):
+            return RECORD.pack(step, KIND_FELL, NO_COMBATANT, self._slot(event.target), 0, 0, 0)
+        if isinstance(event, BattleOverEvent):
+            flags = (FLAG_VICTORY if event.victory else 0) | (FLAG_DEFEAT if event.defeat else 0)
+            return RECORD.pack(step, KIND_OVER, NO_COMBATANT, NO_COMBATANT, flags, int(event.foe_kills), 0)
+        return None
+
+
+def record_battle(
+    setup: FightSetup,
+    seed: int,
+    *,
+    plugins: list[CharacterPlugin],
+    max_steps: int | None = None,
+) -> ReplayLog:
+    """Fight `setup` headlessly from `seed` and record it."""
+    rng = random.Random(seed)
+    party, reserves, foes = setup.build_battle(plugins=plugins, rng=rng)
+    engine = BattleEngine(party=party, reserves=reserves, foes=foes, rng=rng)
+    recorder = ReplayRecorder(party + reserves + foes)
+    limit = 100_000 if max_steps is None else max(0, int(max_steps))
+    while not engine.over and recorder.steps < limit:
+        recorder.record(engine.step())
+    return recorder.log(setup=setup, seed=seed)
+
+
+def verify_replay(log: ReplayLog, *, plugins: list[CharacterPlugin]) -> bool:
+    """Re-simulate `log` from its seed; True when the fresh log matches byte for byte."""
+    fresh = record_battle(log.setup, log.seed, plugins=plugins, max_steps=log.steps)
+    return fresh.records == log.records
+
+
+class ReplayPlayer:
+    """Steps through a `ReplayLog` with the `BattleEngine` interface the battle screen uses.
+
+    No rules run: each step applies the recorded HP values to the lineup from
+    `ReplayLog.build_battle()` and re-creates the engine events (with short
+    synthesized status lines) for the screen to draw.
+    """
+
+    def __init__(
+        self,
+        log: ReplayLog,
+        *,
+        party: list[Combatant],
+        reserves: list[Combatant],
+        foes: list[Combatant],
+    ) -> None:
+        self.party = party
+        self.reserves = reserves
+        self.foes = foes
+        self._combatants = party + reserves + foes
+        self._party_ids = {id(combatant) for combatant in party}
+        self._records = list(log)
+        self._cursor = 0
+        self._step = 0
+        self._over = False
+        self._foe_kills = 0
+
+    @property
+    def over(self) -> bool:
+        return self._over
+
+    @property
+    def foe_kills(self) -> int:
+        return self._foe_kills
+
+    @property
+    def stalemate_stacks(self) -> int:
+        return 0
+
+    def upcoming_turns(self, count: int = 5) -> list[Combatant]:
+        """The next recorded turns; exact, since the future is already known."""
+        turns: list[Combatant] = []
+        count = max(0, int(count))
+        for record in self._records[self._cursor :]:
+            if len(turns) >= count:
+                break
+            if record.kind == KIND_TURN:
+                combatant = self._combatant(record.actor)
+                if combatant is not None:
+                    turns.append(combatant)
+        return turns
+
+    def run(self, *, max_steps: int = 100_000) -> BattleOverEvent | None:
+        for _ in range(max(0, int(max_steps))):
+            for event in self.step():
+                if isinstance(event, BattleOverEvent):
+                    return event
+        return None
+
+    def step(self) -> list[BattleEvent]:
+        events: list[BattleEvent] = []
+        if self._over:
+            return events
+        self._step += 1
+        records = self._records
+        while self._cursor < len(records) and records[self._cursor].step <= self._step:
+            events.extend(self._play(records[self._cursor]))
+            self._cursor += 1
+        if self._cursor >= len(records) and not self._over:
+            # A log cut short (or one without a result) ends without a winner.
+            self._over = True
+            events.append(BattleOverEvent(victory=False, defeat=False, foe_kills=self._foe_kills))
+        return events
+
+    def _combatant(self, slot: int) -> Combatant | None:
+        if 0 <= slot < len(self._combatants):
+            return self._combatants[slot]
+        return None
+
+    def _play(self, record: ReplayRecord) -> list[BattleEvent]:
+        kind = record.kind
+        if kind == KIND_OVER:
+            self._over = True
+            self._foe_kills = int(record.amount)
+            return [
+                BattleOverEvent(
+                    victory=bool(record.flags & FLAG_VICTORY),
+                    defeat=bool(record.flags & FLAG_DEFEAT),
+                    foe_kills=self._foe_kills,
+                )
+            ]
+
+        actor = self._combatant(record.actor)
+        target = self._combatant(record.target)
+        if kind == KIND_TURN:
+            return [TurnEvent(actor=actor)] if actor is not None else []
+        if target is None:
+            return []
+        if kind == KIND_FELL:
+            side = "party" if id(target) in self._party_ids else "foes"
+            if side == "foes":
+                self._foe_kills += 1
+            return [StatusEvent(f"{target.name} fell!"), FellEvent(target=target, side=side)]
+        if kind == KIND_DODGE:
+            if actor is None:
+                return []
+            return [StatusEvent(f"{target.name} dodged!"), DodgeEvent(attacker=actor, target=target)]
+
+        target.stats.hp = int(record.hp)
+        if kind == KIND_HIT and actor is not None:
+            crit = bool(record.flags & FLAG_CRIT)
+            return [
+                HitEvent(
+                    attacker=actor,
+                    target=target,
+                    damage=int(record.amount),
+                    crit=crit,
+                    element_id=actor.stats.element_id,
+                ),
+                StatusEvent(f"{actor.name} hits {target.name} for {record.amount}{' (CRIT)' if crit else ''}"),
+            ]
+        if kind == KIND_HEAL:
+            events: list[BattleEvent] = [HealEvent(source=actor, target=target, amount=int(record.amount))]
+            if actor is not None:
+                events.append(StatusEvent(f"{actor.name} heals!"))
+            return events
+        if kind == KIND_BLEED:
+            cause = next((name for name, flag in BLEED_FLAGS.items() if record.flags & flag), "stalemate")
+            return [BleedEvent(target=target, amount=int(record.amount), cause=cause)]
+        return []
@@ -0,0 +1,138 @@
+"""Replay log format: packed event records plus the setup and seed.
+
+Each event is one fixed-size `RECORD` struct; `ReplayLog.to_bytes` prefixes the
+records with a header and the `FightSetup` as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import struct
+
+from collections.abc import Iterator
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import fields
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.forecast import FightSetup
+from endless_idler.combat.sim import Combatant
+
+
+REPLAY_VERSION = 1
+
+KIND_TURN = 1
+KIND_HIT = 2
+KIND_HEAL = 3
+KIND_DODGE = 4
+KIND_BLEED = 5
+KIND_FELL = 6
+KIND_OVER = 7
+
+FLAG_CRIT = 1 << 0
+FLAG_BLEED_DARK = 1 << 1
+FLAG_BLEED_FIRE = 1 << 2
+FLAG_BLEED_STALEMATE = 1 << 3
+FLAG_VICTORY = 1 << 4
+FLAG_DEFEAT = 1 << 5
+
+# Actor/target slot for events without one (passive heals, bleeds, the result).
+NO_COMBATANT = 0xFF
+
+# step, kind, actor, target, flags, amount, target HP once the step resolved
+RECORD = struct.Struct("<IBBBBii")
+# magic, version, seed, setup JSON length, records length
+_LOG_HEADER = struct.Struct("<4sBQII")
+_LOG_MAGIC = b"SGRL"
+
+BLEED_FLAGS = {
+    "dark": FLAG_BLEED_DARK,
+    "fire": FLAG_BLEED_FIRE,
+    "stalemate": FLAG_BLEED_STALEMATE,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayRecord:
+    step: int
+    kind: int
+    actor: int
+    target: int
+    flags: int
+    amount: int
+    hp: int
+
+
+def new_replay_seed(rng: random.Random | None = None) -> int:
+    return (rng or random.Random()).randrange(1 << 62)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayLog:
+    """One recorded fight: its setup, its seed and the packed event records.
+
+    Combatant slots index `party + reserves + foes` as rolled by `build_battle()`.
+    """
+
+    setup: FightSetup
+    seed: int
+    records: bytes
+
+    def build_battle(
+        self, *, plugins: list[CharacterPlugin]
+    ) -> tuple[list[Combatant], list[Combatant], list[Combatant]]:
+        """Re-roll the recorded lineups (this consumes only the lineup draws, not the fight)."""
+        return self.setup.build_battle(plugins=plugins, rng=random.Random(self.seed))
+
+    def __iter__(self) -> Iterator[ReplayRecord]:
+        for fields_ in RECORD.iter_unpack(self.records):
+            yield ReplayRecord(*fields_)
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD.size
+
+    @property
+    def steps(self) -> int:
+        if not self.records:
+            return 0
+        return RECORD.unpack_from(self.records, len(self.records) - RECORD.size)[0]
+
+    @property
+    def result(self) -> ReplayRecord | None:
+        """The closing `KIND_OVER` record, or None for a log that never finished."""
+        if not self.records:
+            return None
+        record = ReplayRecord(*RECORD.unpack_from(self.records, len(self.records) - RECORD.size))
+        return record if record.kind == KIND_OVER else None
+
+    def to_bytes(self) -> bytes:
+        setup = json.dumps(asdict(self.setup), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        header = _LOG_HEADER.pack(_LOG_MAGIC, REPLAY_VERSION, int(self.seed), len(setup), len(self.records))
+        return header + setup + bytes(self.records)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ReplayLog:
+        if len(data) < _LOG_HEADER.size:
+            raise ValueError("replay log is truncated")
+        magic, version, seed, setup_len, records_len = _LOG_HEADER.unpack_from(data)
+        if magic != _LOG_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("not a replay log")
+        start = _LOG_HEADER.size
+        if len(data) != start + setup_len + records_len or records_len % RECORD.size:
+            raise ValueError("replay log is truncated")
+        try:
+            setup = _setup_from_dict(json.loads(data[start : start + setup_len].decode("utf-8")))
+        except (UnicodeDecodeError, json.JSONDecodeError, TypeError) as exc:
+            raise ValueError("replay log has a malformed setup") from exc
+        return cls(setup=setup, seed=seed, records=bytes(data[start + setup_len :]))
+
+
+def _setup_from_dict(data: object) -> FightSetup:
+    if not isinstance(data, dict):
+        raise TypeError("setup must be an object")
+    known = {item.name for item in fields(FightSetup)}
+    values = {key: value for key, value in data.items() if key in known}
+    values["onsite"] = tuple(str(item) for item in values.get("onsite", ()))
+    values["offsite"] = tuple(str(item) for item in values.get("offsite", ()))
+    return FightSetup(**values)
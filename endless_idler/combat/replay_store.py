@@ -0,0 +1,84 @@
+"""Ring file of recent replay logs, kept beside the save file."""
+
+from __future__ import annotations
+
+import struct
+
+from pathlib import Path
+
+from endless_idler.combat.replay_log import REPLAY_VERSION
+from endless_idler.combat.replay_log import ReplayLog
+from endless_idler.save import SaveManager
+
+
+REPLAY_STORE_CAPACITY = 10
+
+# magic, version, entry count; each entry is a u32 length plus `ReplayLog.to_bytes()`
+_STORE_HEADER = struct.Struct("<4sBH")
+_STORE_ENTRY = struct.Struct("<I")
+_STORE_MAGIC = b"SGRS"
+
+
+def default_replay_path() -> Path:
+    """`idlesave.replays` beside the save file."""
+    return SaveManager().path.with_suffix(".replays")
+
+
+class ReplayStore:
+    """Ring file of the last `capacity` replay logs, oldest first."""
+
+    def __init__(self, path: Path | None = None, *, capacity: int = REPLAY_STORE_CAPACITY) -> None:
+        self._path = path or default_replay_path()
+        self._capacity = max(1, int(capacity))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> list[ReplayLog]:
+        """Every readable log; a missing or damaged file yields what could be read."""
+        try:
+            data = self._path.read_bytes()
+        except OSError:
+            return []
+        if len(data) < _STORE_HEADER.size:
+            return []
+        magic, version, count = _STORE_HEADER.unpack_from(data)
+        if magic != _STORE_MAGIC or version != REPLAY_VERSION:
+            return []
+
+        logs: list[ReplayLog] = []
+        offset = _STORE_HEADER.size
+        for _ in range(count):
+            if offset + _STORE_ENTRY.size > len(data):
+                break
+            (length,) = _STORE_ENTRY.unpack_from(data, offset)
+            offset += _STORE_ENTRY.size
+            if offset + length > len(data):
+                break
+            try:
+                logs.append(ReplayLog.from_bytes(data[offset : offset + length]))
+            except ValueError:
+                pass
+            offset += length
+        return logs
+
+    def latest(self) -> ReplayLog | None:
+        logs = self.load()
+        return logs[-1] if logs else None
+
+    def append(self, log: ReplayLog) -> None:
+        logs = self.load()[-(self._capacity - 1) :] if self._capacity > 1 else []
+        logs.append(log)
+        self._write(logs)
+
+    def _write(self, logs: list[ReplayLog]) -> None:
+        chunks = [_STORE_HEADER.pack(_STORE_MAGIC, REPLAY_VERSION, len(logs))]
+        for log in logs:
+            entry = log.to_bytes()
+            chunks.append(_STORE_ENTRY.pack(len(entry)))
+            chunks.append(entry)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_bytes(b"".join(chunks))
+        tmp_path.replace(self._path)
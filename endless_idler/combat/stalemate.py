@@ -0,0 +1,64 @@
+"""Stalemate detection and bleed for `BattleEngine`.
+
+Every `STALEMATE_CHECK_SECONDS` of simulated time the allies' HP ratio against
+the foes is compared with the last check; when it barely moved, a bleed stack
+is added. Each stack drains a share of everyone's current HP, so stalled
+battles still end.
+"""
+
+from __future__ import annotations
+
+from endless_idler.combat.events import BleedEvent
+
+
+STALEMATE_CHECK_SECONDS = 15.0
+STALEMATE_RATIO_CHANGE = 0.10
+STALEMATE_BLEED_INTERVAL_STEPS = 10
+STALEMATE_BLEED_PER_STACK = 0.01
+
+
+class BattleStalemate:
+    """`BattleEngine` mixin owning the `_stalemate_*` state."""
+
+    def _calculate_hp_ratio(self) -> float:
+        """Allies' summed max/current HP ratios against the foes' (rises as foes heal or allies fall)."""
+        party_ratio = sum(c.max_hp / max(1, c.stats.hp) for c in self.party if c.stats.hp > 0)
+        reserve_ratio = sum(c.max_hp / max(1, c.stats.hp) for c in self.reserves if c.stats.hp > 0)
+        foe_ratio = sum(c.max_hp / max(1, c.stats.hp) for c in self.foes if c.stats.hp > 0)
+        return (party_ratio + reserve_ratio) / max(0.01, foe_ratio)
+
+    def _check_stalemate(self) -> None:
+        """Add a bleed stack when the HP ratio moved less than 10% over the last 15 seconds."""
+        now = self._elapsed
+        current_ratio = self._calculate_hp_ratio()
+        if self._stalemate_hp_ratio is None:
+            self._stalemate_hp_ratio = current_ratio
+            self._stalemate_last_check_at = now
+            return
+
+        if now - self._stalemate_last_check_at >= STALEMATE_CHECK_SECONDS:
+            previous = self._stalemate_hp_ratio
+            ratio_change = abs(current_ratio - previous) / max(0.01, abs(previous))
+            if ratio_change < STALEMATE_RATIO_CHANGE:
+                self._stalemate_stacks += 1
+                self._status(f"Stalemate! Bleed x{self._stalemate_stacks}")
+            self._stalemate_hp_ratio = current_ratio
+            self._stalemate_last_check_at = now
+
+    def _apply_stalemate_bleed(self) -> None:
+        """Every 10 steps, each stack deals 1% of current HP as true damage to everyone."""
+        if self._stalemate_stacks <= 0:
+            return
+
+        self._stalemate_tick_counter += 1
+        if self._stalemate_tick_counter < STALEMATE_BLEED_INTERVAL_STEPS:
+            return
+        self._stalemate_tick_counter = 0
+
+        damage_percent = STALEMATE_BLEED_PER_STACK * self._stalemate_stacks
+        for combatant in self.party + self.reserves + self.foes:
+            if combatant.stats.hp > 0:
+                damage = max(1, int(combatant.stats.hp * damage_percent))
+                before = int(combatant.stats.hp)
+                combatant.stats.hp = max(0, combatant.stats.hp - damage)
+                self._emit(BleedEvent(target=combatant, amount=before - int(combatant.stats.hp), cause="stalemate"))
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from typing import Any
+from collections.abc import Callable
 from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field
 
 from endless_idler.combat.damage_types import DamageTypeBase
-from endless_idler.combat.damage_types import Generic
+from endless_idler.combat.damage_types import GENERIC
+from endless_idler.combat.damage_types import GENERIC_ELEMENT_CODE
+from endless_idler.combat.damage_types import element_code
+from endless_idler.combat.damage_types import load_damage_type
+from endless_idler.combat.effect_store import EffectStore
 from endless_idler.combat.stat_effect import StatEffect
 
 
@@ -44,7 +49,9 @@ class Stats:
     _base_spd: int = field(default=2, init=False)
     damage_reduction_passes: int = 1
 
-    damage_type: DamageTypeBase = field(default_factory=Generic)
+    _damage_type: DamageTypeBase = field(default=GENERIC, init=False)
+    _element_id: str = field(default="generic", init=False)
+    _element_code: int = field(default=GENERIC_ELEMENT_CODE, init=False)
 
     action_points: int = 0
     damage_taken: int = 0
@@ -84,8 +91,12 @@ class Stats:
     login_theme_drop_scope: str = field(default="matching", init=False)
     login_theme_identifier: str = field(default="", init=False)
 
-    _active_effects: list[StatEffect] = field(default_factory=list, init=False)
-    _passive_instances: list[Any] = field(default_factory=list, init=False)
+    _effects: EffectStore = field(default_factory=EffectStore, init=False)
+    # Called whenever `spd` may have changed; see `watch_speed`.
+    _spd_listener: Callable[[], None] | None = field(default=None, init=False, repr=False, compare=False)
+    _passives: tuple[Any, ...] = field(default=(), init=False)
+    # Attached passives grouped by trigger, in attach order; rebuilt by `set_passives`.
+    _passives_by_trigger: dict[Any, tuple[Any, ...]] = field(default_factory=dict, init=False)
 
     level_up_gains: dict[str, float] = field(
         default_factory=lambda: {"max_hp": 10.0, "atk": 5.0, "defense": 3.0}
@@ -199,6 +210,20 @@ class Stats:
     @spd.setter
     def spd(self, value: int) -> None:
         self._base_spd = int(value)
+        self._spd_changed()
+
+    def watch_speed(self, listener: Callable[[], None] | None) -> None:
+        """Call `listener` whenever base `spd` is set or the effects change its modifier.
+
+        One listener at a time (the turn scheduler of the running battle); None stops watching.
+        """
+        self._spd_listener = listener
+
+    def _spd_changed(self, modifier_before: float | None = None) -> None:
+        if self._spd_listener is None:
+            return
+        if modifier_before is None or self._effects.modifier("spd") != modifier_before:
+            self._spd_listener()
 
     @property
     def aggro(self) -> float:
@@ -209,49 +234,88 @@ class Stats:
         return self.base_aggro * (1 + modifier + defense_term)
 
     def _calculate_stat_modifier(self, stat_name: str) -> float:
-        total = 0.0
-        for effect in self._active_effects:
-            value = effect.stat_modifiers.get(stat_name)
-            if isinstance(value, (int, float)):
-                total += float(value)
-        return total
+        return self._effects.modifier(stat_name)
 
     def add_effect(self, effect: StatEffect) -> None:
-        self.remove_effect_by_name(effect.name)
-        self._active_effects.append(effect)
+        """Apply `effect`, replacing any effect with the same name.
+
+        The effect is read when it is added; to change its modifiers or
+        duration, add it again rather than editing it in place.
+        """
+        spd_modifier = self._effects.modifier("spd")
+        self._effects.add(effect)
+        self._spd_changed(spd_modifier)
 
     def remove_effect_by_name(self, effect_name: str) -> bool:
-        before = len(self._active_effects)
-        self._active_effects = [e for e in self._active_effects if e.name != effect_name]
-        return len(self._active_effects) < before
+        spd_modifier = self._effects.modifier("spd")
+        removed = self._effects.remove(effect_name)
+        self._spd_changed(spd_modifier)
+        return removed
 
     def remove_effect_by_source(self, source: str) -> int:
-        before = len(self._active_effects)
-        self._active_effects = [e for e in self._active_effects if e.source != source]
-        return before - len(self._active_effects)
+        spd_modifier = self._effects.modifier("spd")
+        removed = self._effects.remove_source(source)
+        self._spd_changed(spd_modifier)
+        return removed
 
     def tick_effects(self) -> None:
-        expired: list[str] = []
-        for effect in self._active_effects:
-            effect.tick()
-            if effect.is_expired():
-                expired.append(effect.name)
-        for name in expired:
-            self.remove_effect_by_name(name)
+        spd_modifier = self._effects.modifier("spd")
+        self._effects.tick()
+        self._spd_changed(spd_modifier)
+
+    def get_effect(self, effect_name: str) -> StatEffect | None:
+        return self._effects.get(effect_name)
 
     def get_active_effects(self) -> list[StatEffect]:
-        return list(self._active_effects)
+        return list(self._effects)
 
     def clear_all_effects(self) -> None:
-        self._active_effects.clear()
+        spd_modifier = self._effects.modifier("spd")
+        self._effects.clear()
+        self._spd_changed(spd_modifier)
+
+    @property
+    def damage_type(self) -> DamageTypeBase:
+        return self._damage_type
+
+    @damage_type.setter
+    def damage_type(self, value: DamageTypeBase | str) -> None:
+        # Strings resolve to the shared instance, so `damage_type is FIRE` checks hold.
+        if not isinstance(value, DamageTypeBase):
+            value = load_damage_type(value)
+        self._damage_type = value
+        self._element_id = str(value.id or value.name)
+        self._element_code = element_code(self._element_id)
+
+    @property
+    def _passive_instances(self) -> tuple[Any, ...]:
+        return self._passives
+
+    @_passive_instances.setter
+    def _passive_instances(self, passives: Iterable[Any]) -> None:
+        self.set_passives(passives)
+
+    def set_passives(self, passives: Iterable[Any]) -> None:
+        """Attach passive instances and index them by their `triggers`."""
+        self._passives = tuple(passives)
+        by_trigger: dict[Any, list[Any]] = {}
+        for passive in self._passives:
+            for trigger in dict.fromkeys(getattr(passive, "triggers", None) or ()):
+                by_trigger.setdefault(trigger, []).append(passive)
+        self._passives_by_trigger = {trigger: tuple(items) for trigger, items in by_trigger.items()}
+
+    def passives_for(self, trigger: Any) -> tuple[Any, ...]:
+        """Attached passives that listen for `trigger` (empty when none do)."""
+        return self._passives_by_trigger.get(trigger, ())
 
     @property
     def element_id(self) -> str:
-        dt = self.damage_type
-        if isinstance(dt, str):
-            return dt
-        ident = getattr(dt, "id", None) or getattr(dt, "name", None)
-        return str(ident or dt)
+        return self._element_id
+
+    @property
+    def element_code(self) -> int:
+        """Index into `damage_types.TYPE_MULTIPLIERS`."""
+        return self._element_code
 
     @property
     def ultimate_charge_max(self) -> int:
@@ -271,6 +335,8 @@ class Stats:
         base_attr = f"_base_{stat_name}"
         if hasattr(self, base_attr):
             setattr(self, base_attr, value)
+            if stat_name == "spd":
+                self._spd_changed()
 
     def get_base_stat(self, stat_name: str) -> int | float:
         base_attr = f"_base_{stat_name}"
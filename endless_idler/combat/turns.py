@@ -0,0 +1,149 @@
+"""Action-gauge turn order.
+
+Each combatant fills a `GAUGE_START` gauge at its `spd`; its base action value
+is `GAUGE_START / spd`, the time it needs for one turn. The combatant with the
+lowest pending action value acts next. `TurnScheduler` keeps those pending
+times in a heap of absolute due times, so a turn, a speed change or a removal
+is O(log n). Superseded heap entries are discarded lazily by a per-slot version.
+Each combatant's `Stats` reports its own speed changes (`Stats.watch_speed`), so
+`refresh_speeds` only touches the combatants that actually changed.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from functools import partial
+from collections.abc import Iterable
+
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.stats import GAUGE_START
+
+
+def base_action_value(spd: float) -> float:
+    return float(GAUGE_START) / max(1.0, float(spd))
+
+
+class TurnScheduler:
+    """Hands out turns to combatants in action-value order.
+
+    Ties go to the combatant that was added first (the party before the foes).
+    """
+
+    def __init__(self, combatants: Iterable[Combatant]) -> None:
+        self._combatants: list[Combatant] = []
+        self._slot_by_id: dict[int, int] = {}
+        self._due: list[float] = []
+        self._speed: list[float] = []
+        self._version: list[int] = []
+        self._active: list[bool] = []
+        # (due time, slot, version); slot doubles as the insertion-order tie-break.
+        self._heap: list[tuple[float, int, int]] = []
+        # Slots whose `spd` changed since the last `refresh_speeds`.
+        self._speed_dirty: list[int] = []
+        self._now = 0.0
+        for combatant in combatants:
+            self.add(combatant)
+
+    @property
+    def now(self) -> float:
+        """Action value elapsed since the battle started."""
+        return self._now
+
+    def add(self, combatant: Combatant) -> None:
+        if id(combatant) in self._slot_by_id:
+            return
+        slot = len(self._combatants)
+        spd = max(1.0, float(combatant.stats.spd))
+        self._combatants.append(combatant)
+        self._slot_by_id[id(combatant)] = slot
+        self._speed.append(spd)
+        self._version.append(0)
+        self._active.append(True)
+        self._due.append(self._now + base_action_value(spd))
+        self._sync_stats(slot)
+        heapq.heappush(self._heap, (self._due[slot], slot, 0))
+        combatant.stats.watch_speed(partial(self._speed_dirty.append, slot))
+
+    def remove(self, combatant: Combatant) -> None:
+        slot = self._slot_by_id.get(id(combatant))
+        if slot is None or not self._active[slot]:
+            return
+        self._active[slot] = False
+        self._version[slot] += 1
+        combatant.stats.watch_speed(None)
+
+    def update_speed(self, combatant: Combatant) -> None:
+        """Re-read `spd`, keeping the share of the gauge already filled."""
+        slot = self._slot_by_id.get(id(combatant))
+        if slot is None or not self._active[slot]:
+            return
+        spd = max(1.0, float(combatant.stats.spd))
+        old = self._speed[slot]
+        if spd == old:
+            return
+        remaining = max(0.0, self._due[slot] - self._now) * old / spd
+        self._speed[slot] = spd
+        self._due[slot] = self._now + remaining
+        self._version[slot] += 1
+        self._sync_stats(slot)
+        heapq.heappush(self._heap, (self._due[slot], slot, self._version[slot]))
+
+    def refresh_speeds(self) -> None:
+        """`update_speed` for every combatant whose `spd` changed since the last call.
+
+        Costs nothing when no speed changed.
+        """
+        if not self._speed_dirty:
+            return
+        dirty = dict.fromkeys(self._speed_dirty)
+        self._speed_dirty.clear()
+        for slot in dirty:
+            self.update_speed(self._combatants[slot])
+
+    def next_turn(self) -> Combatant | None:
+        """Advance to the next living combatant's turn, or None when nobody can act."""
+        while self._heap:
+            due, slot, version = heapq.heappop(self._heap)
+            if version != self._version[slot] or not self._active[slot]:
+                continue
+            combatant = self._combatants[slot]
+            if combatant.stats.hp <= 0:
+                self.remove(combatant)
+                continue
+            self._now = due
+            self._due[slot] = due + base_action_value(self._speed[slot])
+            self._sync_stats(slot)
+            heapq.heappush(self._heap, (self._due[slot], slot, version))
+            return combatant
+        return None
+
+    def upcoming(self, count: int) -> list[Combatant]:
+        """The next `count` turns without advancing (the same combatant can appear repeatedly)."""
+        count = max(0, int(count))
+        due = {
+            slot: self._due[slot]
+            for slot, combatant in enumerate(self._combatants)
+            if self._active[slot] and combatant.stats.hp > 0
+        }
+        preview = [(time, slot) for slot, time in due.items()]
+        heapq.heapify(preview)
+        turns: list[Combatant] = []
+        while preview and len(turns) < count:
+            time, slot = heapq.heappop(preview)
+            turns.append(self._combatants[slot])
+            heapq.heappush(preview, (time + base_action_value(self._speed[slot]), slot))
+        return turns
+
+    def action_value(self, combatant: Combatant) -> float:
+        """Action value left until `combatant` acts (0 when it is not scheduled)."""
+        slot = self._slot_by_id.get(id(combatant))
+        if slot is None or not self._active[slot]:
+            return 0.0
+        return max(0.0, self._due[slot] - self._now)
+
+    def _sync_stats(self, slot: int) -> None:
+        stats = self._combatants[slot].stats
+        stats.action_gauge = GAUGE_START
+        stats.base_action_value = base_action_value(self._speed[slot])
+        stats.action_value = max(0.0, self._due[slot] - self._now)
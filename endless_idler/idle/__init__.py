@@ -0,0 +1,17 @@
+"""Qt-free idle simulation core shared by the idle screen and headless tools."""
+
+from endless_idler.idle.state import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.state import REBIRTH_MIN_LEVEL
+from endless_idler.idle.state import IdleChange
+from endless_idler.idle.state import IdleSimulation
+from endless_idler.idle.worker import IdleSimulationWorker
+from endless_idler.idle.worker import IdleSnapshot
+
+__all__ = [
+    "IDLE_TICK_INTERVAL_SECONDS",
+    "IdleChange",
+    "IdleSimulation",
+    "IdleSimulationWorker",
+    "IdleSnapshot",
+    "REBIRTH_MIN_LEVEL",
+]
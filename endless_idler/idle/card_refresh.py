@@ -0,0 +1,155 @@
+"""Qt-free bookkeeping behind the idle screen's incremental card refresh.
+
+`IdleCardRefresher` compares each new worker snapshot against the last one it
+saw and pushes only what changed into the cards. Derived `Stats` are rebuilt
+for a card only when its level, stats or stack changed, or when a reserve's
+did (through the offsite stat share). The cards are duck-typed, so tests can
+drive the refresh without Qt.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Protocol
+
+from endless_idler.combat.party_stats import OffsiteShareAggregator
+from endless_idler.combat.party_stats import build_scaled_character_stats
+from endless_idler.combat.sim import OFFSITE_STAT_SHARE
+from endless_idler.combat.stats import Stats
+from endless_idler.idle.state import IdleChange
+from endless_idler.idle.worker import IdleSnapshot
+
+
+# Only the first six distinct reserves feed the displayed stat share.
+RESERVE_SHARE_LIMIT = 6
+
+_DERIVED = IdleChange.LEVEL | IdleChange.STATS | IdleChange.STACK
+
+
+class OnsiteCard(Protocol):
+    @property
+    def char_id(self) -> str: ...
+
+    def snapshot(self) -> tuple[Mapping[str, object], Stats] | None: ...
+
+    def apply_changes(
+        self,
+        data: Mapping[str, object],
+        changes: int,
+        *,
+        stats: Stats | None = None,
+        maxima: dict[str, float] | None = None,
+    ) -> None: ...
+
+
+class OffsiteCard(Protocol):
+    @property
+    def char_id(self) -> str: ...
+
+    def update_display(self, changes: int = IdleChange.ALL) -> None: ...
+
+
+class IdleCardRefresher:
+    """Tracks the last snapshot serial and the derived Stats shown on each onsite card."""
+
+    def __init__(
+        self,
+        *,
+        plugins_by_id: Mapping[str, object],
+        party_level: int,
+        reserve_ids: Sequence[str],
+        stat_maxima: Callable[[list[Stats]], dict[str, float]],
+    ) -> None:
+        self._plugins_by_id = plugins_by_id
+        self._party_level = max(1, int(party_level))
+        self._reserve_ids: list[str] = list(dict.fromkeys(reserve_ids))[:RESERVE_SHARE_LIMIT]
+        self._stat_maxima = stat_maxima
+        self._seen_serial = 0
+        self._card_stats: dict[str, Stats] = {}
+        self._reserve_share = OffsiteShareAggregator(share=OFFSITE_STAT_SHARE)
+
+    @property
+    def card_stats(self) -> Mapping[str, Stats]:
+        return self._card_stats
+
+    def refresh(
+        self,
+        snapshot: IdleSnapshot,
+        *,
+        onsite_cards: Sequence[OnsiteCard],
+        offsite_cards: Sequence[OffsiteCard],
+    ) -> None:
+        """Repaint only what changed since the last refreshed snapshot."""
+        if snapshot.serial == self._seen_serial:
+            return
+        changes = snapshot.changes_since(self._seen_serial)
+        self._seen_serial = snapshot.serial
+        if not changes:
+            return
+
+        reserves_changed = False
+        for char_id in self._reserve_ids:
+            if not changes.get(char_id, IdleChange.NONE) & _DERIVED:
+                continue
+            stats = self._build_reserve_stats(snapshot, char_id)
+            if stats is None:
+                self._reserve_share.remove_reserve(char_id)
+            else:
+                self._reserve_share.set_reserve(char_id, stats)
+            reserves_changed = True
+
+        rebuilt: dict[str, Stats] = {}
+        for card in onsite_cards:
+            change = changes.get(card.char_id, IdleChange.NONE)
+            if not (reserves_changed or change & _DERIVED or card.char_id not in self._card_stats):
+                continue
+            card_snapshot = card.snapshot()
+            if card_snapshot is None:
+                continue
+            _data, stats = card_snapshot
+            self._reserve_share.apply(stats)
+            self._card_stats[card.char_id] = stats
+            rebuilt[card.char_id] = stats
+
+        maxima = self._stat_maxima(list(self._card_stats.values())) if rebuilt else None
+        for card in onsite_cards:
+            change = changes.get(card.char_id, IdleChange.NONE)
+            stats = rebuilt.get(card.char_id)
+            if not change and stats is None and maxima is None:
+                continue
+            data = snapshot.get_char_data(card.char_id)
+            if data is None:
+                continue
+            card.apply_changes(data, change | (_DERIVED if stats is not None else 0), stats=stats, maxima=maxima)
+
+        for card in offsite_cards:
+            change = changes.get(card.char_id, IdleChange.NONE)
+            if change:
+                card.update_display(change)
+
+    def _build_reserve_stats(self, snapshot: IdleSnapshot, char_id: str) -> Stats | None:
+        plugin = self._plugins_by_id.get(char_id)
+        data = snapshot.get_char_data(char_id)
+        if plugin is None or not isinstance(data, Mapping):
+            return None
+        base_stats = data.get("base_stats")
+        if not isinstance(base_stats, Mapping):
+            return None
+        stacks = max(1, int(data.get("stack", 1)))
+        stars = max(1, int(getattr(plugin, "stars", 1) or 1))
+        progress: dict[str, float | int] = {
+            "level": max(1, int(data.get("level", 1))),
+            "exp": float(max(0.0, float(data.get("exp", 0.0)))),
+            "exp_multiplier": float(max(0.0, float(data.get("exp_multiplier", 1.0)))),
+            "max_hp_level_bonus_version": max(0, int(data.get("max_hp_level_bonus_version", 0))),
+        }
+        return build_scaled_character_stats(
+            plugin=plugin,
+            party_level=self._party_level,
+            stars=stars,
+            stacks=stacks,
+            progress=progress,
+            saved_base_stats=dict(base_stats),
+        )
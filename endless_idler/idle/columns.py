@@ -0,0 +1,158 @@
+"""Columnar (struct-of-arrays) storage for per-character idle state.
+
+Hot numeric fields live in contiguous typed arrays (`array("d")` for float64,
+`array("q")` for int64) indexed by a per-character slot, so the idle loop reads
+plain numbers instead of re-parsing loosely typed dict values every tick.
+`IdleCharView` exposes one slot through the old dict-style interface.
+
+The columns stay on the stdlib rather than NumPy: the idle loop has to run
+without the optional `sim` extra, and at party sizes (under ten slots) a
+NumPy expression costs more per call than the plain loop it would replace.
+Both give bit-identical float64 results, so the per-tick and batched paths
+agree either way.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from collections.abc import MutableMapping
+
+
+FLOAT_COLUMNS: tuple[str, ...] = (
+    "exp",
+    "next_exp",
+    "hp",
+    "max_hp",
+    "exp_multiplier",
+    "req_multiplier",
+    "death_exp_debuff_until",
+    "combat_scale",
+)
+
+INT_COLUMNS: tuple[str, ...] = (
+    "level",
+    "death_exp_debuff_stacks",
+    "next_vitality_gain_level",
+    "next_mitigation_gain_level",
+    "stack",
+    "rebirths",
+    "max_hp_level_bonus_version",
+)
+
+OBJECT_COLUMNS: tuple[str, ...] = (
+    "base_stats",
+    "initial_base_stats",
+    "base_aggro",
+    "damage_reduction_passes",
+)
+
+_FLOAT_KEYS = frozenset(FLOAT_COLUMNS)
+_INT_KEYS = frozenset(INT_COLUMNS)
+
+
+class IdleColumns:
+    def __init__(self) -> None:
+        self.char_ids: list[str] = []
+        self.slot_by_id: dict[str, int] = {}
+
+        self.exp = array("d")
+        self.next_exp = array("d")
+        self.hp = array("d")
+        self.max_hp = array("d")
+        self.exp_multiplier = array("d")
+        self.req_multiplier = array("d")
+        self.death_exp_debuff_until = array("d")
+        self.combat_scale = array("d")
+
+        self.level = array("q")
+        self.death_exp_debuff_stacks = array("q")
+        self.next_vitality_gain_level = array("q")
+        self.next_mitigation_gain_level = array("q")
+        self.stack = array("q")
+        self.rebirths = array("q")
+        self.max_hp_level_bonus_version = array("q")
+
+        self.base_stats: list[dict[str, float]] = []
+        self.initial_base_stats: list[dict[str, float]] = []
+        self.base_aggro: list[object] = []
+        self.damage_reduction_passes: list[object] = []
+
+        self.columns: dict[str, array | list] = {
+            name: getattr(self, name) for name in (*FLOAT_COLUMNS, *INT_COLUMNS, *OBJECT_COLUMNS)
+        }
+
+    def __len__(self) -> int:
+        return len(self.char_ids)
+
+    def __contains__(self, char_id: object) -> bool:
+        return char_id in self.slot_by_id
+
+    def add(self, char_id: str, **values: object) -> int:
+        if char_id in self.slot_by_id:
+            raise ValueError(f"duplicate idle character: {char_id!r}")
+
+        slot = len(self.char_ids)
+        self.char_ids.append(char_id)
+        self.slot_by_id[char_id] = slot
+        for name in FLOAT_COLUMNS:
+            self.columns[name].append(float(values.get(name, 0.0)))  # type: ignore[arg-type]
+        for name in INT_COLUMNS:
+            self.columns[name].append(int(values.get(name, 0)))  # type: ignore[arg-type]
+        for name in OBJECT_COLUMNS:
+            self.columns[name].append(values.get(name))
+        return slot
+
+    def slot(self, char_id: str) -> int | None:
+        return self.slot_by_id.get(char_id)
+
+    def view(self, char_id: str) -> IdleCharView | None:
+        slot = self.slot_by_id.get(char_id)
+        if slot is None:
+            return None
+        return IdleCharView(self, slot)
+
+
+class IdleCharView(MutableMapping):
+    """Dict-style view of one character's slot in `IdleColumns`.
+
+    Reads and writes go straight to the backing columns; the key set is fixed.
+    """
+
+    __slots__ = ("_columns", "_slot")
+
+    def __init__(self, columns: IdleColumns, slot: int) -> None:
+        self._columns = columns
+        self._slot = slot
+
+    @property
+    def slot(self) -> int:
+        return self._slot
+
+    def __getitem__(self, key: str) -> object:
+        column = self._columns.columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        return column[self._slot]
+
+    def __setitem__(self, key: str, value: object) -> None:
+        column = self._columns.columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        if key in _FLOAT_KEYS:
+            value = float(value)  # type: ignore[arg-type]
+        elif key in _INT_KEYS:
+            value = int(value)  # type: ignore[arg-type]
+        column[self._slot] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("idle character fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns.columns)
+
+    def __len__(self) -> int:
+        return len(self._columns.columns)
+
+    def __repr__(self) -> str:
+        return f"IdleCharView({self._columns.char_ids[self._slot]!r})"
@@ -0,0 +1,45 @@
+"""Constants and small types shared by the idle simulation modules."""
+
+from __future__ import annotations
+
+from enum import IntFlag
+from dataclasses import dataclass
+
+
+LOSS_EXP_MULTIPLIER = 0.5
+WIN_EXP_MULTIPLIER = 4.0
+OFFSITE_EXP_SHARE_PER_CHAR = 0.01
+DEATH_EXP_DEBUFF_DURATION_SECONDS = 60 * 60
+DEATH_EXP_DEBUFF_PER_STACK = 0.05
+SHARED_EXP_ONSITE_MULTIPLIER = 0.75
+SHARED_EXP_OFFSITE_MULTIPLIER = 1.5
+IDLE_TICK_INTERVAL_SECONDS = 0.1
+REBIRTH_MIN_LEVEL = 50
+
+
+class IdleChange(IntFlag):
+    """Fields of one character's idle state that changed since `take_changes`."""
+
+    NONE = 0
+    EXP = 1
+    HP = 2
+    LEVEL = 4
+    STATS = 8
+    STACK = 16
+    ALL = EXP | HP | LEVEL | STATS | STACK
+
+
+# Plain ints for the per-tick loops.
+CHANGE_EXP = int(IdleChange.EXP)
+CHANGE_HP = int(IdleChange.HP)
+CHANGE_LEVEL_UP = int(IdleChange.EXP | IdleChange.HP | IdleChange.LEVEL | IdleChange.STATS)
+
+
+@dataclass(slots=True)
+class IdleTickContext:
+    """Values shared by every character within one tick, computed once per tick."""
+
+    now: float
+    run_multiplier: float
+    # Death-debuff EXP multiplier per column slot (1.0 when no debuff is active).
+    debuff_multipliers: list[float]
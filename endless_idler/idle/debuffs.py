@@ -0,0 +1,56 @@
+"""Death-debuff bookkeeping for the idle simulation.
+
+Active debuffs sit in a min-heap keyed by expiry time, so each tick only peeks
+at the earliest one instead of scanning every character.
+"""
+
+from __future__ import annotations
+
+import math
+import heapq
+
+from endless_idler.idle.common import DEATH_EXP_DEBUFF_PER_STACK
+from endless_idler.idle.common import IDLE_TICK_INTERVAL_SECONDS
+
+
+class IdleDebuffSchedule:
+    """`IdleSimulation` mixin owning `_debuff_multipliers` and the `_debuff_expiries` heap."""
+
+    def _schedule_debuff(self, slot: int) -> None:
+        """Cache this slot's debuff multiplier and queue its expiry."""
+        cols = self._columns
+        until = cols.death_exp_debuff_until[slot]
+        stacks = cols.death_exp_debuff_stacks[slot]
+        if not until:
+            self._debuff_multipliers[slot] = 1.0
+            return
+        self._debuff_multipliers[slot] = max(0.0, 1.0 - DEATH_EXP_DEBUFF_PER_STACK * stacks) if stacks > 0 else 1.0
+        heapq.heappush(self._debuff_expiries, (until, slot))
+
+    def _expire_debuffs(self, now: float) -> None:
+        expiries = self._debuff_expiries
+        if not expiries or expiries[0][0] > now:
+            return
+        cols = self._columns
+        while expiries and expiries[0][0] <= now:
+            until, slot = heapq.heappop(expiries)
+            if cols.death_exp_debuff_until[slot] != until:
+                continue
+            cols.death_exp_debuff_stacks[slot] = 0
+            cols.death_exp_debuff_until[slot] = 0.0
+            self._debuff_multipliers[slot] = 1.0
+            self._gain_rates = None
+
+    def _ticks_before_expiry(self, *, start: float, first: int, limit: int) -> int:
+        """Ticks (capped at `limit`) before the next scheduled death-debuff expiry."""
+        if not self._debuff_expiries or limit <= 0:
+            return limit
+        until = self._debuff_expiries[0][0]
+
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        ticks = max(0, min(limit, math.ceil((until - start) / dt) - first))
+        while ticks > 0 and start + (first + ticks - 1) * dt >= until:
+            ticks -= 1
+        while ticks < limit and start + (first + ticks) * dt < until:
+            ticks += 1
+        return ticks
@@ -0,0 +1,57 @@
+"""Save-payload exports of the idle simulation's progress and stats."""
+
+from __future__ import annotations
+
+
+class IdleExports:
+    """`IdleSimulation` mixin that turns the columns into plain save dicts."""
+
+    def export_progress(self) -> dict[str, dict[str, float | int]]:
+        cols = self._columns
+        payload: dict[str, dict[str, float | int]] = {}
+        for slot, char_id in enumerate(cols.char_ids):
+            payload[char_id] = {
+                "level": max(1, cols.level[slot]),
+                "exp": max(0.0, cols.exp[slot]),
+                "next_exp": max(1.0, cols.next_exp[slot]),
+                "exp_multiplier": max(0.0, cols.exp_multiplier[slot]),
+                "req_multiplier": max(0.0, cols.req_multiplier[slot]),
+                "rebirths": max(0, cols.rebirths[slot]),
+                "death_exp_debuff_stacks": max(0, cols.death_exp_debuff_stacks[slot]),
+                "death_exp_debuff_until": max(0.0, cols.death_exp_debuff_until[slot]),
+                "next_vitality_gain_level": max(0, cols.next_vitality_gain_level[slot]),
+                "next_mitigation_gain_level": max(0, cols.next_mitigation_gain_level[slot]),
+                "max_hp_level_bonus_version": max(0, cols.max_hp_level_bonus_version[slot]),
+            }
+        return payload
+
+    def export_character_stats(self) -> dict[str, dict[str, float]]:
+        cols = self._columns
+        return {
+            char_id: _sanitized_stats(stats)
+            for char_id, stats in zip(cols.char_ids, cols.base_stats, strict=False)
+            if isinstance(stats, dict)
+        }
+
+    def export_initial_stats(self) -> dict[str, dict[str, float]]:
+        cols = self._columns
+        return {
+            char_id: _sanitized_stats(stats)
+            for char_id, stats in zip(cols.char_ids, cols.initial_base_stats, strict=False)
+            if isinstance(stats, dict)
+        }
+
+
+def _sanitized_stats(stats: dict[str, float]) -> dict[str, float]:
+    sanitized: dict[str, float] = {}
+    for key, raw in stats.items():
+        if not isinstance(key, str):
+            continue
+        name = key.strip()
+        if not name:
+            continue
+        try:
+            sanitized[name] = float(raw)
+        except (TypeError, ValueError):
+            continue
+    return sanitized
@@ -0,0 +1,133 @@
+"""Closed-form idle catch-up.
+
+`fast_forward` applies progress one segment at a time. A segment ends at the
+next level-up, run-buff expiry or death-debuff expiry, so every gain rate is
+constant inside it and EXP and HP can be advanced in one step.
+"""
+
+from __future__ import annotations
+
+import math
+
+from endless_idler.idle.common import CHANGE_EXP
+from endless_idler.idle.common import CHANGE_HP
+from endless_idler.idle.common import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.tick_math import advance_hp
+from endless_idler.idle.tick_math import ticks_while_positive
+
+
+class IdleFastForward:
+    """`IdleSimulation` mixin for catching up on long offline gaps."""
+
+    def fast_forward(self, seconds: float, *, start_time: float | None = None) -> int:
+        """Advance the simulation by `seconds` of wall-clock time in closed form.
+
+        Instead of running one `process_tick` per 100 ms, progress is applied one
+        segment at a time. A segment ends at the next level-up, run-buff expiry or
+        death-debuff expiry, so EXP gain rates are constant inside it. `start_time`
+        is the wall-clock time of the first simulated tick's predecessor and
+        defaults to `seconds` before now (i.e. catching up on missed time).
+
+        Returns the number of ticks simulated.
+        """
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        if dt <= 0:
+            return 0
+        return self.fast_forward_ticks(int(max(0.0, float(seconds)) / dt), start_time=start_time)
+
+    def fast_forward_ticks(self, ticks: int, *, start_time: float | None = None) -> int:
+        """`fast_forward` by a whole number of ticks; `start_time` defaults to `ticks` before now."""
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        total_ticks = max(0, int(ticks))
+        if dt <= 0 or total_ticks <= 0:
+            return 0
+
+        start = float(self._time()) - total_ticks * dt if start_time is None else float(start_time)
+        done = 0
+        while done < total_ticks:
+            done += self._fast_forward_segment(start=start, first=done + 1, limit=total_ticks - done)
+
+        self._notify_ticks(self._tick_count)
+        return total_ticks
+
+    def _fast_forward_segment(self, *, start: float, first: int, limit: int) -> int:
+        """Apply up to `limit` ticks, stamped `start + (first + i) * dt`, with constant gain rates.
+
+        Run buffs and death debuffs end segments on the same ticks as `process_ticks`.
+        """
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        segment = int(limit)
+
+        if self._advance_run_buffs:
+            for seconds_left in (self._exp_bonus_seconds, self._exp_penalty_seconds):
+                if seconds_left > 0.0:
+                    segment = min(segment, ticks_while_positive(seconds_left, dt, segment))
+
+        context = self._begin_tick(start + first * dt)
+        # Due debuffs were just expired, so the next expiry is at least one tick away.
+        segment = max(1, self._ticks_before_expiry(start=start, first=first, limit=segment))
+
+        onsite_mult = 1.0 - (self._shared_exp_percentage / 100.0)
+        base_gains = self._base_gains(self._onsite_slots, context)
+        onsite_gains = [base_gain * onsite_mult for base_gain in base_gains]
+        total_onsite_base_gain = sum(base_gains)
+        total_onsite_shared_gain = sum(base - onsite for base, onsite in zip(base_gains, onsite_gains))
+        for slot, gain in zip(self._onsite_slots, onsite_gains):
+            segment = self._ticks_until_level_up(slot, gain=gain, limit=segment)
+
+        offsite_gains: list[float] = []
+        if self._offsite_ids and total_onsite_shared_gain > 0:
+            offsite_gain_per_char = total_onsite_shared_gain / len(self._offsite_ids)
+            normal_offsite_gain = total_onsite_base_gain * self._offsite_exp_share
+            debuff = context.debuff_multipliers
+            for slot in self._offsite_slots:
+                gain = (offsite_gain_per_char + normal_offsite_gain) * debuff[slot]
+                offsite_gains.append(gain)
+                segment = self._ticks_until_level_up(slot, gain=gain, limit=segment)
+
+        segment = max(1, segment)
+        start_tick = self._tick_count
+        self._tick_count += segment
+        self._now = start + (first + segment - 1) * dt
+
+        cols = self._columns
+        changes = self._changes
+        for slot, gain in zip([*self._onsite_slots, *self._offsite_slots], [*onsite_gains, *offsite_gains]):
+            changes[slot] |= (CHANGE_EXP if gain else 0) | CHANGE_HP
+
+        regain = 0.1 if self._shared_exp_percentage == 0 else 0.5
+        for slot, gain in zip(self._onsite_slots, onsite_gains):
+            cols.exp[slot] += gain * segment
+            drain = 0.0
+            ticks_per_drain = 1
+            if self._risk_reward_level > 0:
+                ticks_per_drain, drain = self._risk_reward_drain(slot)
+            cols.hp[slot] = advance_hp(
+                hp=cols.hp[slot],
+                max_hp=cols.max_hp[slot],
+                regain=regain,
+                ticks=segment,
+                drain=drain,
+                ticks_per_drain=ticks_per_drain,
+                start_tick=start_tick,
+            )
+
+        for slot, gain in zip(self._offsite_slots, offsite_gains):
+            cols.exp[slot] += gain * segment
+            cols.hp[slot] = advance_hp(hp=cols.hp[slot], max_hp=cols.max_hp[slot], regain=0.5, ticks=segment)
+
+        for slot in [*self._onsite_slots, *self._offsite_slots]:
+            if cols.exp[slot] >= cols.next_exp[slot]:
+                self._level_up(slot)
+
+        self._tick_down_run_buffs(segment)
+        return segment
+
+    def _ticks_until_level_up(self, slot: int, *, gain: float, limit: int) -> int:
+        """Ticks (capped at `limit`) until this character levels up."""
+        ticks = int(limit)
+        if gain > 0:
+            cols = self._columns
+            needed = cols.next_exp[slot] - cols.exp[slot]
+            ticks = min(ticks, max(1, math.ceil(needed / gain)))
+        return ticks
@@ -0,0 +1,220 @@
+"""EXP gain rates, level-ups and rebirths for the idle simulation."""
+
+from __future__ import annotations
+
+from endless_idler.idle.common import CHANGE_EXP
+from endless_idler.idle.common import CHANGE_LEVEL_UP
+from endless_idler.idle.common import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.common import LOSS_EXP_MULTIPLIER
+from endless_idler.idle.common import REBIRTH_MIN_LEVEL
+from endless_idler.idle.common import WIN_EXP_MULTIPLIER
+from endless_idler.idle.common import IdleChange
+
+
+class IdleLeveling:
+    """`IdleSimulation` mixin for displayed gain rates, EXP grants, level-up stat growth and rebirths."""
+
+    def get_exp_gain_per_second(self, char_id: str) -> float:
+        per_tick = self.get_exp_gain_per_tick(char_id)
+        if IDLE_TICK_INTERVAL_SECONDS <= 0:
+            return 0.0
+        return per_tick / IDLE_TICK_INTERVAL_SECONDS
+
+    def get_exp_gain_per_tick(self, char_id: str) -> float:
+        slot = self._columns.slot(char_id)
+        if slot is None:
+            return 0.0
+        return self._gain_rate_table()[slot]
+
+    def _gain_rate_table(self) -> list[float]:
+        """Per-slot EXP gain per tick, rebuilt only after an input changed.
+
+        Rebirths, debuff expiries and the shared-EXP / risk-reward setters drop the
+        table; a run-buff expiry is caught by comparing the run multiplier.
+        """
+        context = self._current_context()
+        rates = self._gain_rates
+        if rates is not None and context.run_multiplier == self._gain_rates_run_multiplier:
+            return rates
+
+        rates = [0.0] * len(self._columns)
+        shared_exp_pct = self._shared_exp_percentage / 100.0
+        onsite_mult = 1.0 - shared_exp_pct
+        base_gains = self._base_gains(self._onsite_slots, context)
+
+        if self._offsite_slots:
+            total_onsite_base_gain = sum(base_gains)
+            total_onsite_shared_gain = sum(base_gain * shared_exp_pct for base_gain in base_gains)
+            offsite_gain_per_char = total_onsite_shared_gain / len(self._offsite_ids)
+            normal_offsite_gain = total_onsite_base_gain * self._offsite_exp_share
+            total_gain = offsite_gain_per_char + normal_offsite_gain
+            debuff = context.debuff_multipliers
+            for slot in self._offsite_slots:
+                rates[slot] = total_gain * debuff[slot]
+
+        for slot, base_gain in zip(self._onsite_slots, base_gains):
+            rates[slot] = base_gain * onsite_mult
+
+        self._gain_rates = rates
+        self._gain_rates_run_multiplier = context.run_multiplier
+        return rates
+
+    def _current_exp_multiplier(self) -> float:
+        multiplier = 1.0
+        if self._exp_bonus_seconds > 0.0:
+            multiplier *= WIN_EXP_MULTIPLIER
+        if self._exp_penalty_seconds > 0.0:
+            multiplier *= LOSS_EXP_MULTIPLIER
+        return multiplier
+
+    def export_run_buff_seconds(self) -> tuple[float, float]:
+        return (float(max(0.0, self._exp_bonus_seconds)), float(max(0.0, self._exp_penalty_seconds)))
+
+    def grant_exp(self, char_id: str, amount: float) -> int:
+        """Add `amount` EXP to one character and apply every level it covers; returns levels gained."""
+        slot = self._columns.slot(char_id)
+        if slot is None or amount <= 0:
+            return 0
+        cols = self._columns
+        old_level = cols.level[slot]
+        cols.exp[slot] += float(amount)
+        self._changes[slot] |= CHANGE_EXP
+        if cols.exp[slot] >= cols.next_exp[slot]:
+            self._level_up(slot)
+        return cols.level[slot] - old_level
+
+    def _level_up(self, slot: int) -> None:
+        """Apply every level the slot's EXP covers, carrying the leftover EXP forward.
+
+        Stat growth for all gained levels is applied in one pass: a single weighted
+        draw for the upgrade points, one sparse-growth catch-up, one max-HP update
+        and one offsite-share refresh.
+        """
+        cols = self._columns
+        req_multiplier = cols.req_multiplier[slot]
+        exp = cols.exp[slot]
+        next_exp = cols.next_exp[slot]
+        start_level = cols.level[slot]
+        level = start_level
+        points = 0
+        while exp >= next_exp:
+            exp -= next_exp
+            level += 1
+            points += 1 + (level // 10)
+            tax = 1.5 ** ((level - 50) // 5) if level >= 50 else 1.0
+            next_exp = (level * 30 * req_multiplier * tax) * self._rng.uniform(0.95, 1.05)
+        if level == start_level:
+            return
+
+        cols.level[slot] = level
+        cols.exp[slot] = exp
+        cols.next_exp[slot] = next_exp
+
+        base_stats = cols.base_stats[slot]
+        self._apply_weighted_stat_upgrades(char_id=cols.char_ids[slot], base_stats=base_stats, points=points)
+        self._apply_sparse_growth(slot, base_stats=base_stats)
+        base_stats["max_hp"] = float(base_stats.get("max_hp", 1000.0)) + 10.0 * (level - start_level)
+
+        intrinsic_hp = float(base_stats.get("max_hp", 1000.0))
+        max_hp = float(max(1, int(intrinsic_hp * cols.combat_scale[slot])))
+        cols.max_hp[slot] = max_hp
+        cols.hp[slot] = max_hp
+        self._changes[slot] |= CHANGE_LEVEL_UP
+
+        self._base_stats_changed(slot)
+        self._notify_level_up(cols.char_ids[slot], level)
+
+    def _apply_weighted_stat_upgrades(self, *, char_id: str, base_stats: dict[str, float], points: int) -> None:
+        stat_keys = (
+            "atk",
+            "defense",
+            "crit_rate",
+            "crit_damage",
+            "dodge_odds",
+            "regain",
+        )
+
+        weights: list[float] = []
+        for key in stat_keys:
+            value = float(base_stats.get(key, 0.1))
+            if key in {"crit_rate", "dodge_odds", "mitigation"}:
+                weight = value * 100.0
+            elif key == "crit_damage":
+                weight = value * 10.0
+            else:
+                weight = value
+
+            if char_id == "luna" and key == "dodge_odds":
+                weight *= 5.0
+
+            weights.append(max(0.1, float(weight)))
+
+        for stat_name in self._rng.choices(list(stat_keys), weights=weights, k=points):
+            current = float(base_stats.get(stat_name, 1.0))
+            base_stats[stat_name] = current * 1.001
+
+    def _ensure_sparse_growth_schedule(self, slot: int) -> None:
+        cols = self._columns
+        level = max(1, cols.level[slot])
+
+        if max(0, cols.next_vitality_gain_level[slot]) <= level:
+            cols.next_vitality_gain_level[slot] = level + self._rng.randint(10, 15)
+
+        if max(0, cols.next_mitigation_gain_level[slot]) <= level:
+            cols.next_mitigation_gain_level[slot] = level + self._rng.randint(10, 15)
+
+    def _apply_sparse_growth(self, slot: int, *, base_stats: dict[str, float]) -> None:
+        cols = self._columns
+        level = max(1, cols.level[slot])
+        self._ensure_sparse_growth_schedule(slot)
+
+        for stat_key, schedule in (
+            ("vitality", cols.next_vitality_gain_level),
+            ("mitigation", cols.next_mitigation_gain_level),
+        ):
+            next_gain_level = max(0, schedule[slot])
+            if next_gain_level <= 0:
+                next_gain_level = level + self._rng.randint(10, 15)
+
+            while level >= next_gain_level:
+                current = float(base_stats.get(stat_key, 1.0))
+                base_stats[stat_key] = current + 0.001 * self._rng.uniform(0.5, 1.5)
+                next_gain_level += self._rng.randint(10, 15)
+
+            schedule[slot] = int(next_gain_level)
+
+    def rebirth_character(self, char_id: str) -> bool:
+        cols = self._columns
+        slot = cols.slot(char_id)
+        if slot is None:
+            return False
+
+        old_level = cols.level[slot]
+        if old_level < REBIRTH_MIN_LEVEL:
+            return False
+
+        cols.level[slot] = 1
+        cols.exp[slot] = 0.0
+        cols.next_vitality_gain_level[slot] = 0
+        cols.next_mitigation_gain_level[slot] = 0
+
+        initial_base_stats = cols.initial_base_stats[slot]
+        if initial_base_stats:
+            cols.base_stats[slot] = dict(initial_base_stats)
+
+        intrinsic_hp = float(cols.base_stats[slot].get("max_hp", 1000.0))
+        max_hp = float(max(1, int(intrinsic_hp * cols.combat_scale[slot])))
+        cols.max_hp[slot] = max_hp
+        cols.hp[slot] = max_hp
+        self._ensure_sparse_growth_schedule(slot)
+
+        bonus = 0.25 * (1 + 0.01 * (old_level - 50))
+        cols.exp_multiplier[slot] += bonus
+        cols.req_multiplier[slot] += 0.05
+        cols.rebirths[slot] += 1
+        self._changes[slot] |= int(IdleChange.ALL)
+        self._gain_rates = None
+
+        cols.next_exp[slot] = (1 * 30 * cols.req_multiplier[slot]) * self._rng.uniform(0.95, 1.05)
+        self._base_stats_changed(slot)
+        return True
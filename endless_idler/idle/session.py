@@ -0,0 +1,48 @@
+"""Where the last idle session left off, and how much offline time it may be credited.
+
+The idle screen stamps `RunSave.idle_last_tick_at` (with the party it was
+simulating) on every autosave, so time with the app closed counts when idle is
+entered again. Any screen that takes over the characters clears the stamp:
+otherwise the catch-up would credit that time a second time, or credit it to
+a different party.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from endless_idler.save import RunSave
+
+
+def stamp_idle_session(
+    save: RunSave,
+    *,
+    last_tick_at: float,
+    onsite: Sequence[str],
+    offsite: Sequence[str],
+) -> None:
+    """Record that `onsite`/`offsite` were idling up to `last_tick_at`."""
+    save.idle_last_tick_at = float(max(0.0, last_tick_at))
+    save.idle_last_tick_onsite = [str(item) for item in onsite if item]
+    save.idle_last_tick_offsite = [str(item) for item in offsite if item]
+
+
+def clear_idle_session(save: RunSave) -> None:
+    """Forget the stamp; the next idle session starts without catch-up."""
+    save.idle_last_tick_at = 0.0
+    save.idle_last_tick_onsite = []
+    save.idle_last_tick_offsite = []
+
+
+def idle_resume_at(save: RunSave, *, onsite: Sequence[str], offsite: Sequence[str], now: float) -> float:
+    """Time the new idle session resumes from: the stamp, or `now` when there is nothing to catch up.
+
+    Catch-up is only granted to the exact party that was saved with the stamp.
+    """
+    last_tick_at = float(max(0.0, getattr(save, "idle_last_tick_at", 0.0)))
+    if not 0.0 < last_tick_at < now:
+        return now
+    party = ([str(item) for item in onsite if item], [str(item) for item in offsite if item])
+    if party != (list(save.idle_last_tick_onsite), list(save.idle_last_tick_offsite)):
+        return now
+    return last_tick_at
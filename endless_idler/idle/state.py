@@ -0,0 +1,297 @@
+"""Qt-free idle simulation core.
+
+`IdleSimulation` holds every idle character's progress and advances it tick by
+tick (`process_tick`), in batches (`process_ticks`) or in closed form
+(`fast_forward`). It imports nothing from PySide6, so headless tools can run it;
+the idle screen runs it on `IdleSimulationWorker`'s thread, and the Qt wrapper
+in `endless_idler.ui.idle.idle_state` serves GUI-thread callers.
+
+The behaviour is split across mixins by concern: the tick loop
+(`endless_idler.idle.ticks`), the closed-form catch-up (`fast_forward`), EXP and
+level-ups (`leveling`), the death-debuff heap (`debuffs`) and save exports
+(`exports`). This module owns the roster and the reserve stat share.
+"""
+
+from __future__ import annotations
+
+import time
+import random
+
+from collections.abc import Callable
+from collections.abc import Mapping
+
+from endless_idler.combat.party_stats import OffsiteShareAggregator
+from endless_idler.combat.party_stats import build_scaled_character_stats
+from endless_idler.combat.party_stats import party_scaling
+from endless_idler.combat.sim import OFFSITE_STAT_SHARE
+from endless_idler.combat.stats import Stats
+from endless_idler.idle.columns import IdleColumns
+from endless_idler.idle.common import CHANGE_HP
+from endless_idler.idle.common import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.common import OFFSITE_EXP_SHARE_PER_CHAR
+from endless_idler.idle.common import REBIRTH_MIN_LEVEL
+from endless_idler.idle.common import IdleChange
+from endless_idler.idle.common import IdleTickContext
+from endless_idler.idle.debuffs import IdleDebuffSchedule
+from endless_idler.idle.exports import IdleExports
+from endless_idler.idle.fast_forward import IdleFastForward
+from endless_idler.idle.leveling import IdleLeveling
+from endless_idler.idle.tick_math import advance_hp
+from endless_idler.idle.ticks import IdleTickLoop
+from endless_idler.save_codec import as_float
+from endless_idler.save_codec import as_int
+
+
+__all__ = [
+    "IDLE_TICK_INTERVAL_SECONDS",
+    "REBIRTH_MIN_LEVEL",
+    "IdleChange",
+    "IdleSimulation",
+    "IdleTickContext",
+    "advance_hp",
+]
+
+
+class IdleSimulation(IdleTickLoop, IdleFastForward, IdleLeveling, IdleDebuffSchedule, IdleExports):
+    def __init__(
+        self,
+        *,
+        char_ids: list[str],
+        offsite_ids: list[str] | None = None,
+        party_level: int,
+        stacks: dict[str, int],
+        plugins_by_id: dict[str, object],
+        rng: random.Random,
+        progress_by_id: dict[str, dict[str, float | int]] | None = None,
+        stats_by_id: dict[str, dict[str, float]] | None = None,
+        initial_stats_by_id: dict[str, dict[str, float]] | None = None,
+        exp_bonus_seconds: float = 0.0,
+        exp_penalty_seconds: float = 0.0,
+        exp_gain_scale: float = 1.0,
+        advance_run_buffs: bool = True,
+        shared_exp_percentage: int = 0,
+        risk_reward_level: int = 0,
+        started_at: float | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._char_ids = char_ids
+        self._offsite_ids: list[str] = [str(item) for item in (offsite_ids or []) if item]
+        self._party_level = party_level
+        self._stacks = stacks
+        self._plugins_by_id = plugins_by_id
+        self._rng = rng
+        self._progress_by_id = progress_by_id or {}
+        self._stats_by_id = stats_by_id or {}
+        self._initial_stats_by_id = initial_stats_by_id or {}
+        self._exp_bonus_seconds = float(max(0.0, exp_bonus_seconds))
+        self._exp_penalty_seconds = float(max(0.0, exp_penalty_seconds))
+        self._exp_gain_scale = float(max(0.0, exp_gain_scale))
+        self._advance_run_buffs = bool(advance_run_buffs)
+        self._time = clock if clock is not None else time.time
+        self._offsite_exp_share = OFFSITE_EXP_SHARE_PER_CHAR
+
+        self._tick_count = 0
+        self._shared_exp_percentage = max(0, min(95, int(shared_exp_percentage)))
+        self._risk_reward_level = max(0, min(150, int(risk_reward_level)))
+
+        now = float(self._time() if started_at is None else started_at)
+        self._columns = IdleColumns()
+        for char_id in list(dict.fromkeys([*char_ids, *self._offsite_ids])):
+            plugin = plugins_by_id.get(char_id)
+            if not plugin:
+                continue
+            self._add_character(char_id, plugin=plugin, now=now)
+
+        slot_by_id = self._columns.slot_by_id
+        self._onsite_slots: list[int] = [slot_by_id[item] for item in self._char_ids if item in slot_by_id]
+        self._offsite_slots: list[int] = [slot_by_id[item] for item in self._offsite_ids if item in slot_by_id]
+        self._onsite_slot_set = frozenset(self._onsite_slots)
+        self._offsite_slot_set = frozenset(self._offsite_slots)
+        self._changes: list[int] = [int(IdleChange.ALL)] * len(self._columns)
+
+        # Simulated clock: the timestamp of the latest tick.
+        self._now = now
+        self._debuff_multipliers: list[float] = [1.0] * len(self._columns)
+        self._debuff_expiries: list[tuple[float, int]] = []
+        for slot in range(len(self._columns)):
+            self._schedule_debuff(slot)
+
+        # Per-slot EXP gain per tick as shown to the player; rebuilt lazily on invalidation.
+        self._gain_rates: list[float] | None = None
+        self._gain_rates_run_multiplier = 1.0
+
+        self._offsite_share = OffsiteShareAggregator(share=OFFSITE_STAT_SHARE)
+        if self._onsite_slots:
+            for slot in self._offsite_slots:
+                self._refresh_reserve_share(slot)
+        self._apply_offsite_stat_share_to_onsite_hp()
+
+    def _add_character(self, char_id: str, *, plugin: object, now: float) -> None:
+        stack = max(1, int(self._stacks.get(char_id, 1)))
+        stars = max(1, int(getattr(plugin, "stars", 1) or 1))
+        plugin_base_stats = getattr(plugin, "base_stats", None)
+        base_stats: dict[str, float] = dict(plugin_base_stats) if isinstance(plugin_base_stats, dict) else {}
+        saved_stats = self._stats_by_id.get(char_id)
+        if isinstance(saved_stats, dict):
+            for key, raw in saved_stats.items():
+                if key in base_stats:
+                    try:
+                        base_stats[key] = float(raw)  # type: ignore[arg-type]
+                    except (TypeError, ValueError):
+                        continue
+
+        initial_base_stats: dict[str, float]
+        saved_initial = self._initial_stats_by_id.get(char_id)
+        if isinstance(saved_initial, dict) and saved_initial:
+            initial_base_stats = dict(saved_initial)
+        else:
+            initial_base_stats = dict(base_stats)
+
+        saved = self._progress_by_id.get(char_id)
+        saved = saved if isinstance(saved, dict) else {}
+        level = max(1, as_int(saved.get("level", 1), default=1))
+        death_exp_debuff_stacks = max(0, as_int(saved.get("death_exp_debuff_stacks", 0), default=0))
+        death_exp_debuff_until = max(0.0, as_float(saved.get("death_exp_debuff_until", 0.0), default=0.0))
+        max_hp_level_bonus_version = max(0, as_int(saved.get("max_hp_level_bonus_version", 0), default=0))
+
+        if death_exp_debuff_until and now >= death_exp_debuff_until:
+            death_exp_debuff_stacks = 0
+            death_exp_debuff_until = 0.0
+
+        if max_hp_level_bonus_version < 1:
+            intrinsic_hp = float(base_stats.get("max_hp", 1000.0))
+            base_stats["max_hp"] = intrinsic_hp + max(0, level - 1) * 10.0
+            max_hp_level_bonus_version = 1
+
+        scale = party_scaling(party_level=self._party_level, stars=stars, stacks=stack)
+        max_hp = max(1, int(float(base_stats.get("max_hp", 1000.0)) * scale))
+        slot = self._columns.add(
+            char_id,
+            level=level,
+            exp=max(0.0, as_float(saved.get("exp", 0.0), default=0.0)),
+            next_exp=max(1.0, as_float(saved.get("next_exp", 30.0), default=30.0)),
+            death_exp_debuff_stacks=death_exp_debuff_stacks,
+            death_exp_debuff_until=death_exp_debuff_until,
+            next_vitality_gain_level=max(0, as_int(saved.get("next_vitality_gain_level", 0), default=0)),
+            next_mitigation_gain_level=max(0, as_int(saved.get("next_mitigation_gain_level", 0), default=0)),
+            hp=max_hp,
+            max_hp=max_hp,
+            combat_scale=scale,
+            base_stats=base_stats,
+            initial_base_stats=initial_base_stats,
+            stack=stack,
+            base_aggro=getattr(plugin, "base_aggro", None),
+            damage_reduction_passes=getattr(plugin, "damage_reduction_passes", None),
+            exp_multiplier=max(0.0, as_float(saved.get("exp_multiplier", 1.0), default=1.0)),
+            req_multiplier=max(0.0, as_float(saved.get("req_multiplier", 1.0), default=1.0)),
+            rebirths=max(0, as_int(saved.get("rebirths", 0), default=0)),
+            max_hp_level_bonus_version=max_hp_level_bonus_version,
+        )
+        self._ensure_sparse_growth_schedule(slot)
+
+    def _build_slot_stats(self, slot: int) -> Stats | None:
+        cols = self._columns
+        plugin = self._plugins_by_id.get(cols.char_ids[slot])
+        if plugin is None:
+            return None
+        stars = max(1, int(getattr(plugin, "stars", 1) or 1))
+        progress: dict[str, float | int] = {
+            "level": cols.level[slot],
+            "exp": cols.exp[slot],
+            "exp_multiplier": cols.exp_multiplier[slot],
+            "max_hp_level_bonus_version": cols.max_hp_level_bonus_version[slot],
+        }
+        return build_scaled_character_stats(
+            plugin=plugin,
+            party_level=self._party_level,
+            stars=stars,
+            stacks=cols.stack[slot],
+            progress=progress,
+            saved_base_stats=cols.base_stats[slot],
+        )
+
+    def _apply_offsite_stat_share_to_onsite_hp(self, slots: list[int] | None = None) -> None:
+        """Recompute onsite max HP from each character's own base plus the reserve share.
+
+        HP keeps its ratio to max HP. Only `slots` are touched when given.
+        """
+        if not self._onsite_slots:
+            return
+        if not self._offsite_share:
+            return
+
+        cols = self._columns
+        bonus = int(self._offsite_share.bonus("max_hp"))
+        for slot in self._onsite_slots if slots is None else slots:
+            old_max_hp = max(1.0, cols.max_hp[slot])
+            ratio = max(0.0, cols.hp[slot]) / old_max_hp
+            own_max_hp = int(float(cols.base_stats[slot].get("max_hp", 1000.0)) * cols.combat_scale[slot])
+            max_hp = float(max(1, own_max_hp + bonus))
+            hp = max(0.0, min(max_hp, ratio * max_hp))
+            if max_hp != cols.max_hp[slot] or hp != cols.hp[slot]:
+                self._changes[slot] |= CHANGE_HP
+            cols.max_hp[slot] = max_hp
+            cols.hp[slot] = hp
+
+    def _refresh_reserve_share(self, slot: int) -> None:
+        stats = self._build_slot_stats(slot)
+        if stats is not None:
+            self._offsite_share.set_reserve(self._columns.char_ids[slot], stats)
+
+    def _base_stats_changed(self, slot: int) -> None:
+        if slot in self._offsite_slot_set:
+            self._refresh_reserve_share(slot)
+            self._apply_offsite_stat_share_to_onsite_hp()
+            for onsite_slot in self._onsite_slots:
+                self._changes[onsite_slot] |= int(IdleChange.STATS)
+        elif slot in self._onsite_slot_set:
+            self._apply_offsite_stat_share_to_onsite_hp([slot])
+
+    def _notify_ticks(self, tick_count: int) -> None:
+        """Called with the new tick count after each tick or batch; a hook for subclasses."""
+
+    def _notify_level_up(self, char_id: str, level: int) -> None:
+        """Called with the new level after a level-up (which may span several levels).
+
+        `get_tick_count()` is the tick it happened on.
+        """
+
+    def get_char_data(self, char_id: str) -> Mapping[str, object] | None:
+        """Dict-style view of a character's idle state (backed by the columns)."""
+        return self._columns.view(char_id)
+
+    def get_party_level(self) -> int:
+        return max(1, int(self._party_level))
+
+    def get_tick_count(self) -> int:
+        return self._tick_count
+
+    def take_changes(self) -> dict[str, IdleChange]:
+        """Return and clear the per-character change masks gathered since the last call."""
+        changes = self._changes
+        payload = {
+            char_id: IdleChange(mask)
+            for char_id, mask in zip(self._columns.char_ids, changes, strict=False)
+            if mask
+        }
+        self._changes = [0] * len(changes)
+        return payload
+
+    def _mark_all(self, change: IdleChange) -> None:
+        self._changes = [mask | int(change) for mask in self._changes]
+
+    def set_shared_exp_percentage(self, percentage: int) -> None:
+        self._shared_exp_percentage = max(0, min(95, int(percentage)))
+        self._gain_rates = None
+        self._mark_all(IdleChange.EXP)
+
+    def get_shared_exp_percentage(self) -> int:
+        return self._shared_exp_percentage
+
+    def set_risk_reward_level(self, level: int) -> None:
+        self._risk_reward_level = max(0, min(150, int(level)))
+        self._gain_rates = None
+        self._mark_all(IdleChange.EXP)
+
+    def get_risk_reward_level(self) -> int:
+        return self._risk_reward_level
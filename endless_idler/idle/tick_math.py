@@ -0,0 +1,103 @@
+"""Pure per-tick arithmetic shared by the batched and closed-form idle paths.
+
+The stepping helpers repeat `process_tick`'s float operations exactly, so
+batched results stay bit-identical; `advance_hp` is the closed form.
+"""
+
+from __future__ import annotations
+
+
+def ticks_while_positive(seconds: float, dt: float, limit: int) -> int:
+    """How many ticks (capped at `limit`) start with `seconds` still above zero."""
+    ticks = 0
+    while ticks < limit and seconds > 0.0:
+        seconds = max(0.0, seconds - dt)
+        ticks += 1
+    return ticks
+
+
+def quiet_exp_ticks(exp: float, next_exp: float, gain: float, limit: int) -> tuple[int, float]:
+    """Add `gain` per tick until the next tick would level up; returns (ticks, exp)."""
+    if gain == 0:
+        return (limit, exp) if exp < next_exp else (0, exp)
+
+    ticks = 0
+    while ticks < limit:
+        value = exp + gain
+        if value >= next_exp:
+            break
+        exp = value
+        ticks += 1
+    return ticks, exp
+
+
+def step_hp(
+    hp: float,
+    max_hp: float,
+    regain: float,
+    ticks: int,
+    *,
+    drain: float = 0.0,
+    ticks_per_drain: int = 1,
+    start_tick: int = 0,
+) -> float:
+    """Tick-by-tick HP regen/drain with the exact arithmetic of `process_tick`.
+
+    Stretches between drain ticks stop early once HP reaches `max_hp`.
+    """
+    period = max(1, int(ticks_per_drain))
+    tick = int(start_tick)
+    end = tick + max(0, int(ticks))
+    while tick < end:
+        next_drain = (tick // period + 1) * period if drain > 0 else end + 1
+        stop = min(end, next_drain)
+        for _ in range(stop - tick):
+            if hp >= max_hp:
+                hp = max_hp
+                break
+            hp = min(max_hp, hp + regain)
+        tick = stop
+        if tick == next_drain:
+            hp = max(0.0, hp - drain)
+    return hp
+
+
+def advance_hp(
+    *,
+    hp: float,
+    max_hp: float,
+    regain: float,
+    ticks: int,
+    drain: float = 0.0,
+    ticks_per_drain: int = 1,
+    start_tick: int = 0,
+) -> float:
+    """Closed-form HP after `ticks` idle ticks.
+
+    Matches running `hp = min(max_hp, hp + regain)` every tick and, when `drain`
+    is set, `hp = max(0, hp - drain)` on every tick number divisible by
+    `ticks_per_drain` (counting from `start_tick + 1`).
+    """
+    ticks = max(0, int(ticks))
+    if ticks <= 0:
+        return hp
+    if drain <= 0:
+        return min(max_hp, hp + regain * ticks)
+
+    period = max(1, int(ticks_per_drain))
+    first = period - (int(start_tick) % period)
+    if ticks < first:
+        return min(max_hp, hp + regain * ticks)
+
+    hp = max(0.0, min(max_hp, hp + regain * first) - drain)
+    periods, rest = divmod(ticks - first, period)
+    if periods > 0:
+        period_gain = regain * period
+        net = period_gain - drain
+        if net < 0:
+            # Only the first period can still touch the max HP cap; after that HP only falls.
+            hp = max(0.0, min(max_hp, hp + period_gain) - drain)
+            hp = max(0.0, hp + net * (periods - 1))
+        else:
+            hp = max(0.0, min(max_hp - drain, hp + net * periods))
+    return min(max_hp, hp + regain * rest)
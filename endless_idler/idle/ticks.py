@@ -0,0 +1,254 @@
+"""Per-tick idle loop: single ticks and bit-identical batches of ticks.
+
+`process_ticks` steps the quiet stretches between level-ups, debuff expiries
+and run-buff changes in tight loops and sends only the boundary ticks through
+the full `_run_tick` path.
+"""
+
+from __future__ import annotations
+
+import math
+
+from endless_idler.idle.common import CHANGE_EXP
+from endless_idler.idle.common import CHANGE_HP
+from endless_idler.idle.common import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.common import IdleTickContext
+from endless_idler.idle.tick_math import quiet_exp_ticks
+from endless_idler.idle.tick_math import step_hp
+from endless_idler.idle.tick_math import ticks_while_positive
+
+
+class IdleTickLoop:
+    """`IdleSimulation` mixin that runs ticks and builds the per-tick context."""
+
+    def process_tick(self) -> None:
+        self._tick_count += 1
+        self._notify_ticks(self._tick_count)
+        self._run_tick(now=float(self._time()))
+
+    def process_ticks(self, count: int, *, start_time: float | None = None) -> int:
+        """Run `count` ticks in one call, with the same result as `count` `process_tick` calls.
+
+        Tick k (1-based) is stamped `start_time + k * dt`; `start_time` defaults to
+        `count` ticks before now. Stretches of ticks between level-ups, death-debuff
+        expiries and run-buff changes are stepped in a tight loop; only the boundary
+        ticks go through the full per-tick path. `_notify_ticks` is called once with
+        the final tick count.
+
+        Returns the number of ticks run.
+        """
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        count = max(0, int(count))
+        if count <= 0:
+            return 0
+
+        start = float(self._time()) - count * dt if start_time is None else float(start_time)
+        done = 0
+        while done < count:
+            done += self._run_quiet_ticks(start=start, first=done + 1, limit=count - done)
+            if done < count:
+                done += 1
+                self._tick_count += 1
+                self._run_tick(now=start + done * dt)
+
+        self._notify_ticks(self._tick_count)
+        return count
+
+    def _run_tick(self, *, now: float) -> None:
+        cols = self._columns
+        exp = cols.exp
+        next_exp = cols.next_exp
+        hp = cols.hp
+        max_hp = cols.max_hp
+        changes = self._changes
+
+        context = self._begin_tick(now)
+        debuff = context.debuff_multipliers
+        onsite_mult = 1.0 - (self._shared_exp_percentage / 100.0)
+        base_gains = self._base_gains(self._onsite_slots, context)
+        total_onsite_base_gain = 0.0
+        total_onsite_shared_gain = 0.0
+
+        regain = 0.1 if self._shared_exp_percentage == 0 else 0.5
+        for slot, base_gain in zip(self._onsite_slots, base_gains):
+            total_onsite_base_gain += base_gain
+            onsite_gain = base_gain * onsite_mult
+            exp[slot] += onsite_gain
+            total_onsite_shared_gain += (base_gain - onsite_gain)
+
+            old_hp = hp[slot]
+            hp[slot] = min(max_hp[slot], hp[slot] + regain)
+
+            if self._risk_reward_level > 0:
+                ticks_per_drain, drain = self._risk_reward_drain(slot)
+                if self._tick_count % ticks_per_drain == 0:
+                    hp[slot] = max(0.0, hp[slot] - drain)
+
+            if onsite_gain:
+                changes[slot] |= CHANGE_EXP
+            if hp[slot] != old_hp:
+                changes[slot] |= CHANGE_HP
+
+            if exp[slot] >= next_exp[slot]:
+                self._level_up(slot)
+
+        if self._offsite_ids and total_onsite_shared_gain > 0:
+            offsite_gain_per_char = total_onsite_shared_gain / len(self._offsite_ids)
+            normal_offsite_gain = total_onsite_base_gain * self._offsite_exp_share
+            total_gain = offsite_gain_per_char + normal_offsite_gain
+
+            for slot in self._offsite_slots:
+                gain = total_gain * debuff[slot]
+                exp[slot] += gain
+                old_hp = hp[slot]
+                hp[slot] = min(max_hp[slot], hp[slot] + 0.5)
+                if gain:
+                    changes[slot] |= CHANGE_EXP
+                if hp[slot] != old_hp:
+                    changes[slot] |= CHANGE_HP
+                if exp[slot] >= next_exp[slot]:
+                    self._level_up(slot)
+
+        if self._advance_run_buffs:
+            dt = float(max(0.0, IDLE_TICK_INTERVAL_SECONDS))
+            if dt > 0.0:
+                self._exp_bonus_seconds = max(0.0, self._exp_bonus_seconds - dt)
+                self._exp_penalty_seconds = max(0.0, self._exp_penalty_seconds - dt)
+
+    def _run_quiet_ticks(self, *, start: float, first: int, limit: int) -> int:
+        """Step up to `limit` ticks that hold no level-up or gain change; returns the count.
+
+        The ticks are stamped `start + (first + i) * dt`. Every value is advanced with
+        the same per-tick arithmetic as `_run_tick`, so results stay bit-identical.
+        """
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        cols = self._columns
+        first_time = start + first * dt
+
+        if self._advance_run_buffs and dt > 0.0:
+            for seconds_left in (self._exp_bonus_seconds, self._exp_penalty_seconds):
+                if seconds_left > 0.0:
+                    limit = min(limit, ticks_while_positive(seconds_left, dt, limit))
+
+        context = self._begin_tick(first_time)
+        limit = self._ticks_before_expiry(start=start, first=first, limit=limit)
+        if limit <= 0:
+            return 0
+
+        onsite_mult = 1.0 - (self._shared_exp_percentage / 100.0)
+        base_gains = self._base_gains(self._onsite_slots, context)
+        total_onsite_base_gain = 0.0
+        total_onsite_shared_gain = 0.0
+        gains: list[tuple[int, float]] = []
+        for slot, base_gain in zip(self._onsite_slots, base_gains):
+            total_onsite_base_gain += base_gain
+            onsite_gain = base_gain * onsite_mult
+            total_onsite_shared_gain += (base_gain - onsite_gain)
+            gains.append((slot, onsite_gain))
+
+        offsite_active = bool(self._offsite_ids) and total_onsite_shared_gain > 0
+        if offsite_active:
+            offsite_gain_per_char = total_onsite_shared_gain / len(self._offsite_ids)
+            normal_offsite_gain = total_onsite_base_gain * self._offsite_exp_share
+            total_gain = offsite_gain_per_char + normal_offsite_gain
+            debuff = context.debuff_multipliers
+            gains.extend((slot, total_gain * debuff[slot]) for slot in self._offsite_slots)
+
+        # Visit the characters closest to levelling first so `limit` shrinks early.
+        exp = cols.exp
+        next_exp = cols.next_exp
+        gains.sort(key=lambda item: (next_exp[item[0]] - exp[item[0]]) / item[1] if item[1] > 0 else math.inf)
+        stepped: list[tuple[int, float, int, float]] = []
+        for slot, gain in gains:
+            ticks, value = quiet_exp_ticks(exp[slot], next_exp[slot], gain, limit)
+            limit = min(limit, ticks)
+            stepped.append((slot, gain, ticks, value))
+        if limit <= 0:
+            return 0
+
+        changes = self._changes
+        for slot, gain, ticks, value in stepped:
+            if ticks != limit:
+                ticks, value = quiet_exp_ticks(exp[slot], next_exp[slot], gain, limit)
+            exp[slot] = value
+            if gain:
+                changes[slot] |= CHANGE_EXP
+
+        hp = cols.hp
+        max_hp = cols.max_hp
+        old_hp = [hp[slot] for slot in self._onsite_slots]
+        if offsite_active:
+            old_hp.extend(hp[slot] for slot in self._offsite_slots)
+        start_tick = self._tick_count
+        regain = 0.1 if self._shared_exp_percentage == 0 else 0.5
+        for slot in self._onsite_slots:
+            drain = 0.0
+            ticks_per_drain = 1
+            if self._risk_reward_level > 0:
+                ticks_per_drain, drain = self._risk_reward_drain(slot)
+            hp[slot] = step_hp(
+                hp[slot],
+                max_hp[slot],
+                regain,
+                limit,
+                drain=drain,
+                ticks_per_drain=ticks_per_drain,
+                start_tick=start_tick,
+            )
+        if offsite_active:
+            for slot in self._offsite_slots:
+                hp[slot] = step_hp(hp[slot], max_hp[slot], 0.5, limit)
+        for slot, before in zip([*self._onsite_slots, *self._offsite_slots], old_hp):
+            if hp[slot] != before:
+                changes[slot] |= CHANGE_HP
+
+        self._tick_down_run_buffs(limit)
+
+        self._tick_count += limit
+        self._now = start + (first + limit - 1) * dt
+        return limit
+
+    def _tick_down_run_buffs(self, ticks: int) -> None:
+        """Count the run buffs down by `ticks` ticks with the per-tick arithmetic of `_run_tick`."""
+        dt = float(IDLE_TICK_INTERVAL_SECONDS)
+        if not self._advance_run_buffs or dt <= 0.0:
+            return
+        for _ in range(ticks):
+            if self._exp_bonus_seconds <= 0.0 and self._exp_penalty_seconds <= 0.0:
+                break
+            self._exp_bonus_seconds = max(0.0, self._exp_bonus_seconds - dt)
+            self._exp_penalty_seconds = max(0.0, self._exp_penalty_seconds - dt)
+
+    def _base_gains(self, slots: list[int], context: IdleTickContext) -> list[float]:
+        """Per-tick EXP each onsite slot earns before the shared-EXP split."""
+        exp_multiplier = self._columns.exp_multiplier
+        risk_factor = (self._risk_reward_level + 1) if self._risk_reward_level > 0 else 1
+        run_multiplier = context.run_multiplier
+        scale = self._exp_gain_scale
+        debuff = context.debuff_multipliers
+        return [exp_multiplier[slot] * risk_factor * run_multiplier * debuff[slot] * scale for slot in slots]
+
+    def _begin_tick(self, now: float) -> IdleTickContext:
+        """Advance the simulated clock to `now`, expire due debuffs and snapshot the multipliers."""
+        self._now = now
+        self._expire_debuffs(now)
+        return IdleTickContext(
+            now=now,
+            run_multiplier=self._current_exp_multiplier(),
+            debuff_multipliers=self._debuff_multipliers,
+        )
+
+    def _current_context(self) -> IdleTickContext:
+        """The context of the latest tick, without advancing the clock."""
+        return IdleTickContext(
+            now=self._now,
+            run_multiplier=self._current_exp_multiplier(),
+            debuff_multipliers=self._debuff_multipliers,
+        )
+
+    def _risk_reward_drain(self, slot: int) -> tuple[int, float]:
+        char_level = max(1, self._columns.level[slot])
+        speed_modifier = 0.5 * (1 - (0.00001 * (char_level * self._risk_reward_level)))
+        speed_modifier = max(0.1, speed_modifier)
+        ticks_per_drain = max(1, int(speed_modifier / IDLE_TICK_INTERVAL_SECONDS))
+        return ticks_per_drain, 5.5 * self._risk_reward_level
@@ -0,0 +1,299 @@
+"""Background-thread runner for `IdleSimulation`.
+
+The worker owns the idle state: it steps the simulation on its own thread and,
+after every step, swaps in a new immutable `IdleSnapshot`. Readers only grab the
+current snapshot reference (a single attribute read), so widget work never
+delays a tick and a slow tick never blocks a repaint. Commands that mutate the
+state and save exports take the worker lock, so an export always describes one
+consistent tick.
+"""
+
+from __future__ import annotations
+
+import time
+import threading
+
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from endless_idler.idle.state import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.state import IdleChange
+from endless_idler.idle.state import IdleSimulation
+
+
+IDLE_MAX_BATCH_TICKS = int(60 * 60 / IDLE_TICK_INTERVAL_SECONDS)
+
+_CHANGE_FLAGS: tuple[IdleChange, ...] = (
+    IdleChange.EXP,
+    IdleChange.HP,
+    IdleChange.LEVEL,
+    IdleChange.STATS,
+    IdleChange.STACK,
+)
+
+_CHAR_KEYS: tuple[str, ...] = (
+    "level",
+    "exp",
+    "next_exp",
+    "hp",
+    "max_hp",
+    "stack",
+    "exp_multiplier",
+    "max_hp_level_bonus_version",
+    "base_stats",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IdleCharSnapshot(Mapping):
+    """One character's idle values at a published tick (read-only mapping)."""
+
+    char_id: str
+    level: int
+    exp: float
+    next_exp: float
+    hp: float
+    max_hp: float
+    stack: int
+    exp_multiplier: float
+    max_hp_level_bonus_version: int
+    base_stats: Mapping[str, float]
+    exp_gain_per_second: float
+    # Snapshot serial of the last change for each flag in `_CHANGE_FLAGS`.
+    changed_at: tuple[int, ...]
+
+    def __getitem__(self, key: str) -> object:
+        if key not in _CHAR_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CHAR_KEYS)
+
+    def __len__(self) -> int:
+        return len(_CHAR_KEYS)
+
+
+@dataclass(frozen=True, slots=True)
+class IdleSnapshot:
+    serial: int
+    tick_count: int
+    party_level: int
+    shared_exp_percentage: int
+    risk_reward_level: int
+    chars: Mapping[str, IdleCharSnapshot]
+
+    def get_char_data(self, char_id: str) -> IdleCharSnapshot | None:
+        return self.chars.get(char_id)
+
+    def get_exp_gain_per_second(self, char_id: str) -> float:
+        char = self.chars.get(char_id)
+        return char.exp_gain_per_second if char is not None else 0.0
+
+    def get_party_level(self) -> int:
+        return self.party_level
+
+    def changes_since(self, serial: int) -> dict[str, IdleChange]:
+        """Per-character change masks for everything published after `serial`."""
+        changes: dict[str, IdleChange] = {}
+        for char_id, char in self.chars.items():
+            mask = IdleChange.NONE
+            for flag, changed_at in zip(_CHANGE_FLAGS, char.changed_at, strict=False):
+                if changed_at > serial:
+                    mask |= flag
+            if mask:
+                changes[char_id] = mask
+        return changes
+
+
+@dataclass(frozen=True, slots=True)
+class IdleExport:
+    progress: dict[str, dict[str, float | int]]
+    character_stats: dict[str, dict[str, float]]
+    initial_stats: dict[str, dict[str, float]]
+    exp_bonus_seconds: float
+    exp_penalty_seconds: float
+    shared_exp_percentage: int
+    risk_reward_level: int
+
+
+class IdleSimulationWorker:
+    """Steps an `IdleSimulation` on a daemon thread from a fixed-timestep accumulator.
+
+    Exposes `get_char_data` / `get_exp_gain_per_second` / `get_party_level` from
+    the latest snapshot, so idle cards can use it in place of the state itself.
+    """
+
+    def __init__(
+        self,
+        state: IdleSimulation,
+        *,
+        step_seconds: float = IDLE_TICK_INTERVAL_SECONDS,
+        catch_up_seconds: float = 0.0,
+        catch_up_start: float | None = None,
+    ) -> None:
+        self._state = state
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._step_seconds = float(max(IDLE_TICK_INTERVAL_SECONDS, step_seconds))
+        self._catch_up_seconds = float(max(0.0, catch_up_seconds))
+        self._catch_up_start = catch_up_start
+        self._last_step_at = time.monotonic()
+        self._accumulator = 0.0
+        self._serial = 0
+        self._change_serials: dict[str, list[int]] = {}
+        self._snapshot: IdleSnapshot | None = None
+        with self._lock:
+            self._publish()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._last_step_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="idle-simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and simulate whatever time is still owed."""
+        self._stop.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None:
+            thread.join(timeout=5.0)
+        self.step()
+
+    def set_step_seconds(self, seconds: float) -> None:
+        self._step_seconds = float(max(IDLE_TICK_INTERVAL_SECONDS, seconds))
+
+    def _run(self) -> None:
+        if self._catch_up_seconds > 0.0:
+            with self._lock:
+                self._state.fast_forward(self._catch_up_seconds, start_time=self._catch_up_start)
+                self._catch_up_seconds = 0.0
+                self._publish()
+        while not self._stop.wait(self._step_seconds):
+            self.step()
+
+    def step(self) -> int:
+        """Run every whole tick owed since the previous step; returns the tick count."""
+        with self._lock:
+            now = time.monotonic()
+            self._accumulator += max(0.0, now - self._last_step_at)
+            self._last_step_at = now
+            if IDLE_TICK_INTERVAL_SECONDS <= 0:
+                return 0
+
+            ticks = int(self._accumulator / IDLE_TICK_INTERVAL_SECONDS)
+            if ticks <= 0:
+                return 0
+            self._accumulator -= ticks * IDLE_TICK_INTERVAL_SECONDS
+            if ticks > IDLE_MAX_BATCH_TICKS:
+                # Long gaps (e.g. the machine slept) use the closed-form catch-up.
+                self._state.fast_forward(ticks * IDLE_TICK_INTERVAL_SECONDS)
+            else:
+                self._state.process_ticks(ticks)
+            self._publish()
+            return ticks
+
+    def _publish(self) -> None:
+        """Build and swap in the next snapshot; the caller holds `_lock`."""
+        state = self._state
+        previous = self._snapshot.chars if self._snapshot is not None else {}
+        changes = state.take_changes()
+        self._serial += 1
+        serial = self._serial
+
+        chars = dict(previous)
+        for char_id, mask in changes.items():
+            data = state.get_char_data(char_id)
+            if data is None:
+                continue
+            serials = self._change_serials.setdefault(char_id, [0] * len(_CHANGE_FLAGS))
+            for index, flag in enumerate(_CHANGE_FLAGS):
+                if mask & flag:
+                    serials[index] = serial
+
+            old = previous.get(char_id)
+            base_stats = old.base_stats if old is not None else None
+            if base_stats is None or mask & (IdleChange.STATS | IdleChange.LEVEL):
+                base_stats = MappingProxyType(dict(data["base_stats"]))  # type: ignore[arg-type]
+
+            chars[char_id] = IdleCharSnapshot(
+                char_id=char_id,
+                level=int(data["level"]),  # type: ignore[arg-type]
+                exp=float(data["exp"]),  # type: ignore[arg-type]
+                next_exp=float(data["next_exp"]),  # type: ignore[arg-type]
+                hp=float(data["hp"]),  # type: ignore[arg-type]
+                max_hp=float(data["max_hp"]),  # type: ignore[arg-type]
+                stack=int(data["stack"]),  # type: ignore[arg-type]
+                exp_multiplier=float(data["exp_multiplier"]),  # type: ignore[arg-type]
+                max_hp_level_bonus_version=int(data["max_hp_level_bonus_version"]),  # type: ignore[arg-type]
+                base_stats=base_stats,
+                exp_gain_per_second=state.get_exp_gain_per_second(char_id),
+                changed_at=tuple(serials),
+            )
+
+        self._snapshot = IdleSnapshot(
+            serial=serial,
+            tick_count=state.get_tick_count(),
+            party_level=state.get_party_level(),
+            shared_exp_percentage=state.get_shared_exp_percentage(),
+            risk_reward_level=state.get_risk_reward_level(),
+            chars=MappingProxyType(chars),
+        )
+
+    def snapshot(self) -> IdleSnapshot:
+        snapshot = self._snapshot
+        assert snapshot is not None
+        return snapshot
+
+    def get_char_data(self, char_id: str) -> IdleCharSnapshot | None:
+        return self.snapshot().get_char_data(char_id)
+
+    def get_exp_gain_per_second(self, char_id: str) -> float:
+        return self.snapshot().get_exp_gain_per_second(char_id)
+
+    def get_party_level(self) -> int:
+        return self.snapshot().get_party_level()
+
+    def get_shared_exp_percentage(self) -> int:
+        return self.snapshot().shared_exp_percentage
+
+    def get_risk_reward_level(self) -> int:
+        return self.snapshot().risk_reward_level
+
+    def rebirth_character(self, char_id: str) -> bool:
+        with self._lock:
+            reborn = self._state.rebirth_character(char_id)
+            if reborn:
+                self._publish()
+            return reborn
+
+    def set_shared_exp_percentage(self, percentage: int) -> None:
+        with self._lock:
+            self._state.set_shared_exp_percentage(percentage)
+            self._publish()
+
+    def set_risk_reward_level(self, level: int) -> None:
+        with self._lock:
+            self._state.set_risk_reward_level(level)
+            self._publish()
+
+    def export_state(self) -> IdleExport:
+        """Save-ready exports, all taken at the same tick."""
+        with self._lock:
+            state = self._state
+            bonus_seconds, penalty_seconds = state.export_run_buff_seconds()
+            return IdleExport(
+                progress=state.export_progress(),
+                character_stats=state.export_character_stats(),
+                initial_stats=state.export_initial_stats(),
+                exp_bonus_seconds=bonus_seconds,
+                exp_penalty_seconds=penalty_seconds,
+                shared_exp_percentage=state.get_shared_exp_percentage(),
+                risk_reward_level=state.get_risk_reward_level(),
+            )
@@ -17,12 +17,10 @@ Example Usage:
     
     @register_passive
     class MyPassive(Passive):
-        def __init__(self):
-            super().__init__()
-            self.id = "my_passive"
-            self.display_name = "My Passive"
-            self.description = "Triggers at turn start"
-            self.triggers = [PassiveTrigger.TURN_START]
+        id = "my_passive"
+        display_name = "My Passive"
+        description = "Triggers at turn start"
+        triggers = frozenset({PassiveTrigger.TURN_START})
         
         def can_trigger(self, context: TriggerContext) -> bool:
             return True
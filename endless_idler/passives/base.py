@@ -4,7 +4,7 @@ This module provides the foundational interfaces that all passive
 ability implementations must follow.
 """
 
-from typing import Any, Protocol
+from typing import Any, ClassVar, Collection, Protocol
 from abc import ABC, abstractmethod
 
 from endless_idler.passives.triggers import PassiveTrigger, TriggerContext
@@ -20,13 +20,13 @@ class PassiveBase(Protocol):
         id: Unique identifier for this passive (e.g., "radiant_aegis")
         display_name: Human-readable name shown in UI
         description: Full description of what the passive does
-        triggers: List of trigger points this passive responds to
+        triggers: Trigger points this passive responds to
     """
     
     id: str
     display_name: str
     description: str
-    triggers: list[PassiveTrigger]
+    triggers: Collection[PassiveTrigger]
     
     def can_trigger(self, context: TriggerContext) -> bool:
         """Check if this passive's conditions are met for activation.
@@ -61,16 +61,17 @@ class Passive(ABC):
     """Abstract base class providing default passive implementation.
     
     Inherit from this class to create concrete passive abilities.
-    Override can_trigger() and execute() to define behavior.
+    Declare the metadata as class attributes and override can_trigger()
+    and execute() to define behavior. One instance is shared by every
+    owner (see `load_passive`), so never store per-owner data on the
+    instance.
     
     Example:
         class MyPassive(Passive):
-            def __init__(self):
-                super().__init__()
-                self.id = "my_passive"
-                self.display_name = "My Passive"
-                self.description = "Does something cool"
-                self.triggers = [PassiveTrigger.TURN_START]
+            id = "my_passive"
+            display_name = "My Passive"
+            description = "Does something cool"
+            triggers = frozenset({PassiveTrigger.TURN_START})
             
             def can_trigger(self, context: TriggerContext) -> bool:
                 return context.owner_stats.hp > 0
@@ -79,15 +80,10 @@ class Passive(ABC):
                 return {"message": "Passive activated!"}
     """
     
-    def __init__(self) -> None:
-        """Initialize passive with default values.
-        
-        Subclasses should override these in their __init__.
-        """
-        self.id: str = ""
-        self.display_name: str = ""
-        self.description: str = ""
-        self.triggers: list[PassiveTrigger] = []
+    id: ClassVar[str] = ""
+    display_name: ClassVar[str] = ""
+    description: ClassVar[str] = ""
+    triggers: ClassVar[frozenset[PassiveTrigger]] = frozenset()
     
     @abstractmethod
     def can_trigger(self, context: TriggerContext) -> bool:
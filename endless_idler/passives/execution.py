@@ -7,6 +7,7 @@ passive abilities during combat.
 from typing import Any
 
 from endless_idler.combat.stats import Stats
+from endless_idler.passives.results import RedirectResult
 from endless_idler.passives.triggers import PassiveTrigger
 from endless_idler.passives.triggers import TriggerContext
 
@@ -37,24 +38,24 @@ def trigger_passives_for_characters(
     """
     results: list[dict[str, Any]] = []
     extra = extra or {}
+    # Built on the first subscriber and reused; each passive still gets its own `extra` copy.
+    context: TriggerContext | None = None
 
     for character in characters:
-        if not hasattr(character, "_passive_instances"):
-            continue
-
-        for passive in character._passive_instances:
-            if not hasattr(passive, "triggers") or trigger not in passive.triggers:
-                continue
-
-            context = TriggerContext(
-                trigger=trigger,
-                owner_stats=character,
-                all_allies=all_allies,
-                onsite_allies=onsite_allies,
-                offsite_allies=offsite_allies,
-                enemies=enemies,
-                extra=dict(extra),
-            )
+        for passive in _passives_for(character, trigger):
+            if context is None:
+                context = TriggerContext(
+                    trigger=trigger,
+                    owner_stats=character,
+                    all_allies=all_allies,
+                    onsite_allies=onsite_allies,
+                    offsite_allies=offsite_allies,
+                    enemies=enemies,
+                    extra=dict(extra),
+                )
+            else:
+                context.owner_stats = character
+                context.extra = dict(extra)
 
             try:
                 if passive.can_trigger(context):
@@ -73,6 +74,19 @@ def trigger_passives_for_characters(
     return results
 
 
+def _passives_for(character: Any, trigger: PassiveTrigger) -> tuple[Any, ...] | list[Any]:
+    """Passives of `character` listening for `trigger`, from its index when it has one."""
+    passives_for = getattr(character, "passives_for", None)
+    if passives_for is not None:
+        return passives_for(trigger)
+    # Duck-typed owners without a trigger index.
+    return [
+        passive
+        for passive in getattr(character, "_passive_instances", ())
+        if trigger in (getattr(passive, "triggers", None) or ())
+    ]
+
+
 def trigger_turn_start_passives(
     *,
     all_allies: list[Stats],
@@ -188,10 +202,23 @@ def apply_target_selection_passives(
     )
 
     # Check if any passive redirected the target
+    if not results:
+        return original_target
+    available_ids = {id(target) for target in available_targets}
     for result in results:
-        if "new_target" in result and isinstance(result["new_target"], Stats):
-            # Verify the new target is in the available targets
-            if result["new_target"] in available_targets:
-                return result["new_target"]
+        new_target = _redirect_target(result, all_allies)
+        # Verify the new target is in the available targets
+        if new_target is not None and id(new_target) in available_ids:
+            return new_target
 
     return original_target
+
+
+def _redirect_target(result: dict[str, Any], all_allies: list[Stats]) -> Stats | None:
+    """The target a TARGET_SELECTION result redirects to, if any."""
+    for effect in result.get("effects", ()):
+        if isinstance(effect, RedirectResult) and 0 <= effect.to_slot < len(all_allies):
+            return all_allies[effect.to_slot]
+    # Passives that only report the untyped "new_target" key.
+    new_target = result.get("new_target")
+    return new_target if isinstance(new_target, Stats) else None
@@ -35,18 +35,15 @@ class LadyDarknessEclipsingVeil(Passive):
         defense_ignore: 0.50 (50% defense penetration)
     """
     
-    def __init__(self) -> None:
-        """Initialize the Eclipsing Veil passive with default values."""
-        super().__init__()
-        self.id = "lady_darkness_eclipsing_veil"
-        self.display_name = "Eclipsing Veil"
-        self.description = (
-            "Lady Darkness always deals 2x base damage and ignores 50% of "
-            "the target's defense when attacking."
-        )
-        self.triggers = [PassiveTrigger.PRE_DAMAGE]
-        self.damage_multiplier = 2.0
-        self.defense_ignore = 0.50
+    id = "lady_darkness_eclipsing_veil"
+    display_name = "Eclipsing Veil"
+    description = (
+        "Lady Darkness always deals 2x base damage and ignores 50% of "
+        "the target's defense when attacking."
+    )
+    triggers = frozenset({PassiveTrigger.PRE_DAMAGE})
+    damage_multiplier = 2.0
+    defense_ignore = 0.50
     
     def can_trigger(self, context: TriggerContext) -> bool:
         """Check if Lady Darkness is the attacker in this damage event.
@@ -67,7 +64,7 @@ class LadyDarknessEclipsingVeil(Passive):
             return False
         
         # Verify the attacker is the owner of this passive
-        return attacker == context.owner_stats
+        return attacker is context.owner_stats
     
     def execute(self, context: TriggerContext) -> dict[str, Any]:
         """Apply damage amplification and defense ignore effects.
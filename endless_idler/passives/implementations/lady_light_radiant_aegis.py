@@ -7,6 +7,7 @@ from typing import Any
 
 from endless_idler.passives.base import Passive
 from endless_idler.passives.registry import register_passive
+from endless_idler.passives.results import HealResult
 from endless_idler.passives.triggers import PassiveTrigger, TriggerContext
 
 
@@ -21,17 +22,14 @@ class LadyLightRadiantAegis(Passive):
     - Healing respects max HP limits
     """
 
-    def __init__(self) -> None:
-        """Initialize the Radiant Aegis passive."""
-        super().__init__()
-        self.id = "lady_light_radiant_aegis"
-        self.display_name = "Radiant Aegis"
-        self.description = (
-            "When Lady Light is offsite, heal all party members (onsite + offsite) "
-            "for 50% of her regain stat at the start of each turn."
-        )
-        self.triggers = [PassiveTrigger.TURN_START]
-        self.heal_multiplier = 0.50
+    id = "lady_light_radiant_aegis"
+    display_name = "Radiant Aegis"
+    description = (
+        "When Lady Light is offsite, heal all party members (onsite + offsite) "
+        "for 50% of her regain stat at the start of each turn."
+    )
+    triggers = frozenset({PassiveTrigger.TURN_START})
+    heal_multiplier = 0.50
 
     def can_trigger(self, context: TriggerContext) -> bool:
         """Check if Lady Light is offsite.
@@ -43,10 +41,7 @@ class LadyLightRadiantAegis(Passive):
             True if Lady Light is offsite, False otherwise
         """
         # Check if owner (Lady Light) is in offsite list
-        if context.owner_stats in context.offsite_allies:
-            return True
-
-        return False
+        return context.is_offsite(context.owner_stats)
 
     def execute(self, context: TriggerContext) -> dict[str, Any]:
         """Execute healing for all party members.
@@ -59,15 +54,17 @@ class LadyLightRadiantAegis(Passive):
                 - healed: list of (character_id, heal_amount) tuples
                 - total_healing: sum of all healing done
                 - base_heal_amount: the base heal calculated
+                - effects: a HealResult per healed ally slot
         """
         # Calculate heal amount based on Lady Light's regain
         base_heal = int(context.owner_stats.regain * self.heal_multiplier)
 
         healed_targets = []
+        effects = []
         total_healing = 0
 
         # Heal all allies (onsite + offsite)
-        for ally_stats in context.all_allies:
+        for slot, ally_stats in enumerate(context.all_allies):
             # Calculate actual healing (cannot exceed max HP)
             current_hp = ally_stats.hp
             max_hp = ally_stats.max_hp
@@ -83,10 +80,12 @@ class LadyLightRadiantAegis(Passive):
                 # Using a fallback since character_id may not exist on Stats
                 char_id = getattr(ally_stats, "character_id", "unknown")
                 healed_targets.append((char_id, actual_heal))
+                effects.append(HealResult(slot=slot, amount=actual_heal))
                 total_healing += actual_heal
 
         return {
             "healed": healed_targets,
             "total_healing": total_healing,
             "base_heal_amount": base_heal,
+            "effects": effects,
         }
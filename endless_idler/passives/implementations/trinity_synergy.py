@@ -7,6 +7,9 @@ from typing import Any
 
 from endless_idler.passives.base import Passive
 from endless_idler.passives.registry import register_passive
+from endless_idler.passives.results import PassiveEffect
+from endless_idler.passives.results import RedirectResult
+from endless_idler.passives.results import StatChangeResult
 from endless_idler.passives.triggers import PassiveTrigger, TriggerContext
 
 
@@ -27,20 +30,11 @@ def is_trinity_active(context: TriggerContext) -> tuple[bool, dict[str, Any]]:
         - is_active: True if all three members present
         - member_map: Dict mapping character IDs to their Stats objects
     """
-    all_chars = context.all_allies
-    
     trinity_members = {
-        LADY_LIGHT_ID: None,
-        LADY_DARKNESS_ID: None,
-        PERSONA_LIGHT_AND_DARK_ID: None,
+        char_id: context.ally_by_character_id(char_id)
+        for char_id in (LADY_LIGHT_ID, LADY_DARKNESS_ID, PERSONA_LIGHT_AND_DARK_ID)
     }
     
-    # Find each trinity member
-    for stats in all_chars:
-        char_id = getattr(stats, 'character_id', '')
-        if char_id in trinity_members:
-            trinity_members[char_id] = stats
-    
     # All must be present
     is_active = all(stats is not None for stats in trinity_members.values())
     
@@ -60,22 +54,19 @@ class TrinitySynergy(Passive):
     This passive encourages using all three family members together.
     """
     
-    def __init__(self) -> None:
-        """Initialize the Trinity Synergy passive."""
-        super().__init__()
-        self.id = "trinity_synergy"
-        self.display_name = "Trinity Synergy"
-        self.description = (
-            "When Lady Darkness, Lady Light, and Persona Light and Dark are all in the party, "
-            "each gains unique powerful bonuses based on their role."
-        )
-        self.triggers = [PassiveTrigger.TURN_START, PassiveTrigger.TARGET_SELECTION]
-        
-        # Effect multipliers
-        self.lady_light_regain_mult = 15.0
-        self.lady_light_healing_mult = 4.0
-        self.lady_darkness_damage_mult = 2.0
-        self.lady_darkness_bleed_reduction = 0.5
+    id = "trinity_synergy"
+    display_name = "Trinity Synergy"
+    description = (
+        "When Lady Darkness, Lady Light, and Persona Light and Dark are all in the party, "
+        "each gains unique powerful bonuses based on their role."
+    )
+    triggers = frozenset({PassiveTrigger.TURN_START, PassiveTrigger.TARGET_SELECTION})
+    
+    # Effect multipliers
+    lady_light_regain_mult = 15.0
+    lady_light_healing_mult = 4.0
+    lady_darkness_damage_mult = 2.0
+    lady_darkness_bleed_reduction = 0.5
     
     def can_trigger(self, context: TriggerContext) -> bool:
         """Check if trinity is active.
@@ -100,25 +91,27 @@ class TrinitySynergy(Passive):
                 - trigger_type: str
                 - effects_applied: list of effect descriptions
                 - character_id: str (owner of this passive instance)
+                - effects: typed records of the stat changes and redirections
         """
         is_active, trinity_members = is_trinity_active(context)
         
         if not is_active:
-            return {"trigger_type": context.trigger.value, "effects_applied": []}
+            return {"trigger_type": context.trigger.value, "effects_applied": [], "effects": []}
         
         effects_applied = []
+        effects: list[PassiveEffect] = []
         owner_id = getattr(context.owner_stats, 'character_id', '')
         
         # TURN_START: Apply stat modifications
         if context.trigger == PassiveTrigger.TURN_START:
             effects_applied.extend(self._apply_turn_start_effects(
-                trinity_members, owner_id, context
+                trinity_members, owner_id, context, effects
             ))
         
         # TARGET_SELECTION: Handle attack redirection
         elif context.trigger == PassiveTrigger.TARGET_SELECTION:
             redirection = self._apply_target_redirection(
-                trinity_members, context
+                trinity_members, context, effects
             )
             if redirection:
                 effects_applied.append(redirection)
@@ -127,6 +120,7 @@ class TrinitySynergy(Passive):
             "trigger_type": context.trigger.value,
             "effects_applied": effects_applied,
             "character_id": owner_id,
+            "effects": effects,
         }
         
         # For TARGET_SELECTION, include the new target if redirected
@@ -140,6 +134,7 @@ class TrinitySynergy(Passive):
         trinity_members: dict[str, Any],
         owner_id: str,
         context: TriggerContext,
+        typed_effects: list[PassiveEffect],
     ) -> list[str]:
         """Apply stat modifications at turn start.
         
@@ -147,6 +142,7 @@ class TrinitySynergy(Passive):
             trinity_members: Map of character IDs to Stats
             owner_id: ID of character owning this passive instance
             context: Trigger context
+            typed_effects: Receives a record for each stat changed
             
         Returns:
             List of effect descriptions
@@ -161,6 +157,9 @@ class TrinitySynergy(Passive):
             bonus_regain = int(base_regain * (self.lady_light_regain_mult - 1.0))
             if hasattr(lady_light, 'regain'):
                 lady_light.regain += bonus_regain
+                slot = context.slot_of(lady_light)
+                if slot is not None and bonus_regain:
+                    typed_effects.append(StatChangeResult(slot=slot, stat="regain", amount=bonus_regain))
             effects.append(f"Lady Light regain boosted by {self.lady_light_regain_mult}x")
             
             # Store healing multiplier for use in healing calculations
@@ -185,12 +184,14 @@ class TrinitySynergy(Passive):
         self,
         trinity_members: dict[str, Any],
         context: TriggerContext,
+        typed_effects: list[PassiveEffect],
     ) -> str | None:
         """Redirect attacks targeting Lady Darkness to Persona.
         
         Args:
             trinity_members: Map of character IDs to Stats
             context: Trigger context with targeting information
+            typed_effects: Receives a record when the attack is redirected
             
         Returns:
             Description of redirection if applied, None otherwise
@@ -200,12 +201,16 @@ class TrinitySynergy(Passive):
         lady_darkness = trinity_members.get(LADY_DARKNESS_ID)
         
         # Check if target is Lady Darkness and Persona is available
-        if original_target == lady_darkness and persona:
+        if lady_darkness is not None and original_target is lady_darkness and persona:
             # Check if Persona is alive (has HP > 0)
             persona_hp = getattr(persona, 'hp', 0)
             if persona_hp > 0:
                 # Modify the target
                 context.extra["new_target"] = persona
+                from_slot = context.slot_of(lady_darkness)
+                to_slot = context.slot_of(persona)
+                if from_slot is not None and to_slot is not None:
+                    typed_effects.append(RedirectResult(from_slot=from_slot, to_slot=to_slot))
                 return "Attack redirected from Lady Darkness to Persona Light and Dark"
         
         return None
@@ -2,6 +2,10 @@
 
 This module provides a centralized registry for passive ability classes,
 allowing them to be registered, retrieved, and instantiated by ID.
+
+Passives that declare their `id` as a class attribute are immutable
+definitions: `load_passive` hands every owner the same instance, so they must
+not keep per-owner data on `self`.
 """
 
 from typing import Type
@@ -12,6 +16,9 @@ from endless_idler.passives.base import PassiveBase
 # Global registry mapping passive IDs to their class implementations
 _PASSIVE_REGISTRY: dict[str, Type[PassiveBase]] = {}
 
+# One shared instance per passive whose metadata is declared on the class
+_SHARED_INSTANCES: dict[str, PassiveBase] = {}
+
 
 def register_passive(passive_class: Type[PassiveBase]) -> Type[PassiveBase]:
     """Register a passive ability class in the global registry.
@@ -28,13 +35,12 @@ def register_passive(passive_class: Type[PassiveBase]) -> Type[PassiveBase]:
     Example:
         @register_passive
         class MyPassive(Passive):
-            def __init__(self):
-                super().__init__()
-                self.id = "my_passive"
-                ...
+            id = "my_passive"
+            triggers = frozenset({PassiveTrigger.TURN_START})
+            ...
     """
     # For classes that set id as a class attribute
-    if hasattr(passive_class, 'id') and isinstance(passive_class.id, str):
+    if _declares_class_id(passive_class):
         _PASSIVE_REGISTRY[passive_class.id] = passive_class
     else:
         # For classes that set id in __init__, we need to instantiate temporarily
@@ -63,9 +69,10 @@ def get_passive(passive_id: str) -> Type[PassiveBase] | None:
 
 
 def load_passive(passive_id: str) -> PassiveBase | None:
-    """Instantiate a passive ability by its ID.
+    """Get a passive ability instance by its ID.
     
-    Convenience function that retrieves and instantiates in one call.
+    Passives that declare their `id` on the class are built once and the same
+    instance is returned for every owner; others are instantiated per call.
     
     Args:
         passive_id: The unique identifier of the passive
@@ -78,10 +85,16 @@ def load_passive(passive_id: str) -> PassiveBase | None:
         if passive:
             can_activate = passive.can_trigger(context)
     """
+    instance = _SHARED_INSTANCES.get(passive_id)
+    if instance is not None:
+        return instance
     passive_class = get_passive(passive_id)
-    if passive_class:
-        return passive_class()
-    return None
+    if not passive_class:
+        return None
+    instance = passive_class()
+    if _declares_class_id(passive_class):
+        _SHARED_INSTANCES[passive_id] = instance
+    return instance
 
 
 def list_passives() -> list[str]:
@@ -103,3 +116,9 @@ def clear_registry() -> None:
     Primarily useful for testing purposes.
     """
     _PASSIVE_REGISTRY.clear()
+    _SHARED_INSTANCES.clear()
+
+
+def _declares_class_id(passive_class: Type[PassiveBase]) -> bool:
+    passive_id = getattr(passive_class, "id", None)
+    return isinstance(passive_id, str) and bool(passive_id)
@@ -0,0 +1,55 @@
+"""Typed records of what a passive did.
+
+Passives still apply their effects to the `Stats` objects directly, so later
+passives in the same trigger see them. They also list each change under the
+`"effects"` key of their result dict. Records name allies by slot: their
+position in `TriggerContext.all_allies`. Callers that built that list can then
+map a record back to its combatant by index.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Iterator
+from typing import Union
+
+
+@dataclass(frozen=True, slots=True)
+class HealResult:
+    """HP restored to the ally in `slot`."""
+
+    slot: int
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class ShieldResult:
+    """Shield points granted to the ally in `slot`."""
+
+    slot: int
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class StatChangeResult:
+    """`stat` of the ally in `slot` changed by `amount`."""
+
+    slot: int
+    stat: str
+    amount: float
+
+
+@dataclass(frozen=True, slots=True)
+class RedirectResult:
+    """An attack on the ally in `from_slot` goes to the ally in `to_slot` instead."""
+
+    from_slot: int
+    to_slot: int
+
+
+PassiveEffect = Union[HealResult, ShieldResult, StatChangeResult, RedirectResult]
+
+
+def iter_effects(results: list[dict[str, Any]]) -> Iterator[PassiveEffect]:
+    """Every typed effect listed by `results`, in execution order."""
+    for result in results:
+        yield from result.get("effects", ())
@@ -7,6 +7,7 @@ and the context data passed to them during activation.
 from enum import Enum
 from typing import Any
 from dataclasses import dataclass
+from dataclasses import field
 
 
 class PassiveTrigger(Enum):
@@ -44,6 +45,10 @@ class TriggerContext:
         extra: Additional context data specific to the trigger type.
                For example, PRE_DAMAGE might include damage_amount,
                TARGET_SELECTION might include available_targets, etc.
+
+    Roster queries (`is_onsite`, `ally_by_character_id`, ...) compare by
+    identity through indexes built on first use. `Stats` is a dataclass, so
+    `in` and `==` on the lists would compare every field instead.
     """
     
     trigger: PassiveTrigger
@@ -53,3 +58,52 @@ class TriggerContext:
     offsite_allies: list[Any]
     enemies: list[Any]
     extra: dict[str, Any]
+    _roster: "_RosterIndex | None" = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def owner_slot(self) -> int | None:
+        """Position of the owner in `all_allies`, or None when it is not an ally."""
+        return self.slot_of(self.owner_stats)
+
+    def slot_of(self, stats: Any) -> int | None:
+        """Position of `stats` in `all_allies`, or None when it is not an ally."""
+        return self._index().ally_slots.get(id(stats))
+
+    def is_ally(self, stats: Any) -> bool:
+        return id(stats) in self._index().ally_slots
+
+    def is_onsite(self, stats: Any) -> bool:
+        return id(stats) in self._index().onsite_ids
+
+    def is_offsite(self, stats: Any) -> bool:
+        return id(stats) in self._index().offsite_ids
+
+    def is_enemy(self, stats: Any) -> bool:
+        return id(stats) in self._index().enemy_ids
+
+    def ally_by_character_id(self, character_id: str) -> Any | None:
+        """The ally with this `character_id` (the last one listed if several share it)."""
+        return self._index().allies_by_character_id.get(character_id)
+
+    def _index(self) -> "_RosterIndex":
+        roster = self._roster
+        if roster is None:
+            roster = _RosterIndex(self)
+            self._roster = roster
+        return roster
+
+
+class _RosterIndex:
+    """Identity lookups over one `TriggerContext`'s rosters."""
+
+    __slots__ = ("ally_slots", "onsite_ids", "offsite_ids", "enemy_ids", "allies_by_character_id")
+
+    def __init__(self, context: TriggerContext) -> None:
+        self.ally_slots: dict[int, int] = {}
+        self.allies_by_character_id: dict[str, Any] = {}
+        for slot, stats in enumerate(context.all_allies):
+            self.ally_slots.setdefault(id(stats), slot)
+            self.allies_by_character_id[getattr(stats, "character_id", "")] = stats
+        self.onsite_ids = {id(stats) for stats in context.onsite_allies}
+        self.offsite_ids = {id(stats) for stats in context.offsite_allies}
+        self.enemy_ids = {id(stats) for stats in context.enemies}
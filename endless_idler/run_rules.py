@@ -12,6 +12,8 @@ PARTY_HP_WIN_HEAL = 4
 IDLE_PARTY_HP_HEAL_AMOUNT = 1
 IDLE_PARTY_HP_HEAL_INTERVAL_SECONDS = 15 * 60
 
+FOE_LEVEL_FIGHT_SCALE = 1.3
+
 
 def clamp_party_hp(save: RunSave) -> None:
     save.party_hp_max = max(1, int(save.party_hp_max))
@@ -40,6 +42,10 @@ def apply_battle_result(save: RunSave, *, victory: bool) -> bool:
     return False
 
 
+def foe_level_for_fight(party_level: int, fight_number: int) -> int:
+    return max(1, int(max(1, int(party_level)) * float(max(1, int(fight_number))) * FOE_LEVEL_FIGHT_SCALE))
+
+
 def calculate_gold_bonus(tokens: int, winstreak: int) -> int:
     """Calculate bonus gold from tokens and winstreak.
     
@@ -61,6 +67,21 @@ def calculate_gold_bonus(tokens: int, winstreak: int) -> int:
     return base_bonus + soft_capped_bonus
 
 
+def calculate_battle_gold(kills: int, *, victory: bool, tokens: int, winstreak: int) -> int:
+    """Gold awarded for a battle with `kills` foe kills (0 when nothing was killed).
+
+    Victory pays full kills plus the token/winstreak bonus; a loss pays half the
+    kills (minimum 1) plus the bonus.
+    """
+    kills = max(0, int(kills))
+    if kills <= 0:
+        return 0
+    bonus = calculate_gold_bonus(tokens, winstreak)
+    if victory:
+        return kills + bonus
+    return max(1, kills // 2) + bonus
+
+
 def apply_idle_party_heal(save: RunSave, *, now: float | None = None) -> int:
     clamp_party_hp(save)
     if save.party_hp_current <= 0:
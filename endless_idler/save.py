@@ -9,19 +9,18 @@ import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from PySide6.QtCore import QStandardPaths
-
 from endless_idler.save_codec import as_character_progress_dict
 from endless_idler.save_codec import as_character_stats_dict
 from endless_idler.save_codec import as_float
 from endless_idler.save_codec import as_int
 from endless_idler.save_codec import as_int_dict
 from endless_idler.save_codec import as_optional_str_list
+from endless_idler.save_codec import as_str_list
 from endless_idler.save_codec import normalized_character_progress
 from endless_idler.save_codec import normalized_character_stats
 
 
-SAVE_VERSION = 8
+SAVE_VERSION = 9
 DEFAULT_RUN_TOKENS = 20
 DEFAULT_CHARACTER_COST = 1
 DEFAULT_SHOP_REROLL_COST = 2
@@ -60,6 +59,10 @@ class RunSave:
     idle_exp_penalty_seconds: float = 0.0
     idle_shared_exp_percentage: int = 0
     idle_risk_reward_level: int = 0
+    idle_last_tick_at: float = 0.0
+    # The idle party that `idle_last_tick_at` was stamped with; offline catch-up only applies to it.
+    idle_last_tick_onsite: list[str] = field(default_factory=list)
+    idle_last_tick_offsite: list[str] = field(default_factory=list)
     winstreak: int = 0
 
 
@@ -135,6 +138,9 @@ class SaveManager:
             idle_exp_penalty_seconds=penalty_seconds,
             idle_shared_exp_percentage=shared_exp_percentage,
             idle_risk_reward_level=risk_reward_level,
+            idle_last_tick_at=as_float(data.get("idle_last_tick_at", 0.0), default=0.0),
+            idle_last_tick_onsite=as_str_list(data.get("idle_last_tick_onsite", [])),
+            idle_last_tick_offsite=as_str_list(data.get("idle_last_tick_offsite", [])),
             winstreak=as_int(data.get("winstreak", 0), default=0),
         )
         return _normalized_save(save)
@@ -163,6 +169,9 @@ class SaveManager:
             "idle_exp_penalty_seconds": save.idle_exp_penalty_seconds,
             "idle_shared_exp_percentage": save.idle_shared_exp_percentage,
             "idle_risk_reward_level": save.idle_risk_reward_level,
+            "idle_last_tick_at": save.idle_last_tick_at,
+            "idle_last_tick_onsite": save.idle_last_tick_onsite,
+            "idle_last_tick_offsite": save.idle_last_tick_offsite,
             "winstreak": save.winstreak,
         }
 
@@ -181,6 +190,9 @@ def _default_save_path() -> Path:
     if home.exists():
         return home / ".midoriai" / "idlesave.json"
 
+    # Imported lazily so headless tools can load saves without PySide6.
+    from PySide6.QtCore import QStandardPaths
+
     base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
     if not base:
         base = str(Path.cwd())
@@ -301,6 +313,9 @@ def _normalized_save(save: RunSave) -> RunSave:
         idle_exp_penalty_seconds=float(max(0.0, getattr(save, "idle_exp_penalty_seconds", 0.0))),
         idle_shared_exp_percentage=max(0, min(95, int(getattr(save, "idle_shared_exp_percentage", 0)))),
         idle_risk_reward_level=max(0, min(150, int(getattr(save, "idle_risk_reward_level", 0)))),
+        idle_last_tick_at=float(max(0.0, float(getattr(save, "idle_last_tick_at", 0.0)))),
+        idle_last_tick_onsite=[str(item) for item in getattr(save, "idle_last_tick_onsite", []) if item],
+        idle_last_tick_offsite=[str(item) for item in getattr(save, "idle_last_tick_offsite", []) if item],
         winstreak=max(0, int(getattr(save, "winstreak", 0))),
     )
 
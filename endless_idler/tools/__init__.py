@@ -0,0 +1 @@
+"""Headless command-line tools (run with `python -m endless_idler.tools.<name>`)."""
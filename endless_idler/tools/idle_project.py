@@ -0,0 +1,212 @@
+"""Project how long idle characters need to reach a level.
+
+Loads the current save through `SaveManager`, rebuilds the idle party with the
+Qt-free `IdleSimulation` and fast-forwards it for every requested shared-EXP %
+and risk/reward setting, printing the time each onsite and offsite character
+needs to reach `--target-level` (the rebirth level, 50, by default).
+
+    python -m endless_idler.tools.idle_project --shared 0,50,95 --risk 0,25
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import random
+import argparse
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from endless_idler.characters.plugins import discover_character_plugins
+from endless_idler.idle.state import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.state import REBIRTH_MIN_LEVEL
+from endless_idler.idle.state import IdleSimulation
+from endless_idler.save import RunSave
+from endless_idler.save import SaveManager
+
+
+DEFAULT_SHARED_EXP_PERCENTAGES = (0, 25, 50, 75, 95)
+DEFAULT_RISK_REWARD_LEVELS = (0,)
+DEFAULT_MAX_HOURS = 24.0 * 30
+# Ticks per fast-forward call; only bounds how soon the loop notices everyone is done.
+_CHUNK_TICKS = int(60 * 60 / IDLE_TICK_INTERVAL_SECONDS)
+
+
+@dataclass(frozen=True, slots=True)
+class LevelProjection:
+    char_id: str
+    placement: str
+    start_level: int
+    # None when the target is not reached within the projection horizon.
+    seconds: float | None
+
+
+class _ProjectingSimulation(IdleSimulation):
+    """Records the tick on which each character first reaches `target_level`."""
+
+    def __init__(self, *, target_level: int, **kwargs: object) -> None:
+        self.target_level = target_level
+        self.reached_at: dict[str, int] = {}
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+
+    def _notify_level_up(self, char_id: str, level: int) -> None:
+        if level >= self.target_level and char_id not in self.reached_at:
+            self.reached_at[char_id] = self.get_tick_count()
+
+
+def project_levels(
+    save: RunSave,
+    *,
+    plugins_by_id: dict[str, object],
+    target_level: int = REBIRTH_MIN_LEVEL,
+    shared_exp_percentage: int = 0,
+    risk_reward_level: int = 0,
+    max_seconds: float = DEFAULT_MAX_HOURS * 60 * 60,
+    seed: int = 0,
+) -> list[LevelProjection]:
+    """Time until each party character reaches `target_level` under one idle setting."""
+    onsite = [str(item) for item in save.onsite if item]
+    offsite = [str(item) for item in save.offsite if item]
+    started_at = float(time.time())
+    simulation = _ProjectingSimulation(
+        target_level=target_level,
+        char_ids=onsite,
+        offsite_ids=offsite,
+        party_level=max(1, int(save.party_level)),
+        stacks=dict(save.stacks),
+        plugins_by_id=plugins_by_id,
+        rng=random.Random(seed),
+        progress_by_id=dict(save.character_progress),
+        stats_by_id=dict(save.character_stats),
+        initial_stats_by_id=dict(save.character_initial_stats),
+        exp_bonus_seconds=float(save.idle_exp_bonus_seconds),
+        exp_penalty_seconds=float(save.idle_exp_penalty_seconds),
+        shared_exp_percentage=shared_exp_percentage,
+        risk_reward_level=risk_reward_level,
+        started_at=started_at,
+        clock=lambda: started_at,
+    )
+
+    placements: dict[str, str] = {char_id: "onsite" for char_id in onsite}
+    for char_id in offsite:
+        placements.setdefault(char_id, "offsite")
+
+    start_levels: dict[str, int] = {}
+    for char_id in placements:
+        data = simulation.get_char_data(char_id)
+        if data is None:
+            continue
+        start_levels[char_id] = int(data["level"])  # type: ignore[arg-type]
+        if start_levels[char_id] >= target_level:
+            simulation.reached_at[char_id] = 0
+
+    dt = float(IDLE_TICK_INTERVAL_SECONDS)
+    max_ticks = int(max(0.0, float(max_seconds)) / dt)
+    elapsed = 0
+    while elapsed < max_ticks and len(simulation.reached_at) < len(start_levels):
+        elapsed += simulation.fast_forward_ticks(
+            min(_CHUNK_TICKS, max_ticks - elapsed),
+            start_time=started_at + elapsed * dt,
+        )
+
+    projections: list[LevelProjection] = []
+    for char_id, start_level in start_levels.items():
+        reached = simulation.reached_at.get(char_id)
+        projections.append(
+            LevelProjection(
+                char_id=char_id,
+                placement=placements[char_id],
+                start_level=start_level,
+                seconds=None if reached is None else reached * dt,
+            )
+        )
+    return projections
+
+
+def _format_duration(seconds: float | None, *, max_seconds: float) -> str:
+    if seconds is None:
+        return f"not within {max_seconds / 3600:g}h"
+    seconds = max(0, int(round(seconds)))
+    minutes, sec = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days:d}d {hours:02d}h {minutes:02d}m"
+    if hours:
+        return f"{hours:d}h {minutes:02d}m {sec:02d}s"
+    return f"{minutes:d}m {sec:02d}s"
+
+
+def _int_list(raw: str) -> list[int]:
+    try:
+        return [int(item) for item in raw.split(",") if item.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {raw!r}") from exc
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m endless_idler.tools.idle_project",
+        description="Project idle time-to-level for the saved party.",
+    )
+    parser.add_argument("--save", type=Path, default=None, help="save file (defaults to the game's save path)")
+    parser.add_argument("--target-level", type=int, default=REBIRTH_MIN_LEVEL)
+    parser.add_argument(
+        "--shared",
+        type=_int_list,
+        default=list(DEFAULT_SHARED_EXP_PERCENTAGES),
+        help="comma-separated shared EXP percentages (0-95)",
+    )
+    parser.add_argument(
+        "--risk",
+        type=_int_list,
+        default=list(DEFAULT_RISK_REWARD_LEVELS),
+        help="comma-separated risk/reward levels (0-150)",
+    )
+    parser.add_argument("--max-hours", type=float, default=DEFAULT_MAX_HOURS)
+    parser.add_argument("--seed", type=int, default=0, help="seed for level-up rolls")
+    args = parser.parse_args(argv)
+
+    manager = SaveManager(args.save)
+    save = manager.load()
+    if save is None:
+        print(f"No save found at {manager.path}", file=sys.stderr)
+        return 1
+
+    plugins_by_id: dict[str, object] = {plugin.char_id: plugin for plugin in discover_character_plugins()}
+    max_seconds = max(0.0, float(args.max_hours)) * 60 * 60
+
+    started = time.perf_counter()
+    projected_seconds = 0.0
+    for risk_reward_level in args.risk:
+        for shared_exp_percentage in args.shared:
+            projections = project_levels(
+                save,
+                plugins_by_id=plugins_by_id,
+                target_level=args.target_level,
+                shared_exp_percentage=shared_exp_percentage,
+                risk_reward_level=risk_reward_level,
+                max_seconds=max_seconds,
+                seed=args.seed,
+            )
+            reached = [item.seconds for item in projections if item.seconds is not None]
+            unreached = len(reached) < len(projections)
+            projected_seconds += max_seconds if unreached else max(reached, default=0.0)
+
+            print(f"shared EXP {shared_exp_percentage}% / risk {risk_reward_level}")
+            for item in projections:
+                duration = _format_duration(item.seconds, max_seconds=max_seconds)
+                print(
+                    f"  {item.placement:<7} {item.char_id:<24} "
+                    f"lv {item.start_level:>3} -> {args.target_level:<3} {duration}"
+                )
+            print()
+
+    elapsed = time.perf_counter() - started
+    print(f"Projected {projected_seconds / 3600:.0f}h of idle time in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
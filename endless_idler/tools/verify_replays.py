@@ -0,0 +1,58 @@
+"""Re-simulate stored battle replays and check they still match.
+
+Loads the replay ring kept next to the save (`ReplayStore`), re-runs every
+fight from its seed with the current rules and reports each log that no longer
+matches, e.g. after a balance or engine change.
+
+    python -m endless_idler.tools.verify_replays
+"""
+
+from __future__ import annotations
+
+import sys
+import argparse
+
+from pathlib import Path
+
+from endless_idler.characters.plugins import discover_character_plugins
+from endless_idler.combat.replay import KIND_OVER
+from endless_idler.combat.replay import FLAG_VICTORY
+from endless_idler.combat.replay import ReplayStore
+from endless_idler.combat.replay import verify_replay
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m endless_idler.tools.verify_replays",
+        description="Re-simulate stored battle replays and compare their event logs.",
+    )
+    parser.add_argument("--replays", type=Path, default=None, help="replay file (defaults to the one beside the save)")
+    args = parser.parse_args(argv)
+
+    store = ReplayStore(args.replays)
+    logs = store.load()
+    if not logs:
+        print(f"No replays found at {store.path}", file=sys.stderr)
+        return 1
+
+    plugins = discover_character_plugins()
+    mismatched = 0
+    for index, log in enumerate(logs, start=1):
+        result = log.result
+        if result is None or result.kind != KIND_OVER:
+            outcome = "unfinished"
+        else:
+            outcome = "victory" if result.flags & FLAG_VICTORY else "defeat"
+        ok = verify_replay(log, plugins=plugins)
+        mismatched += int(not ok)
+        print(
+            f"{index:>3} fight {log.setup.fight_number:<4} seed {log.seed:<20} "
+            f"{log.steps:>6} steps {outcome:<10} {'ok' if ok else 'MISMATCH'}"
+        )
+
+    print(f"{len(logs) - mismatched}/{len(logs)} replays match", file=sys.stderr)
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
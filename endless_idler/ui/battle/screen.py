@@ -3,6 +3,8 @@ from __future__ import annotations
 import time
 import random
 
+from dataclasses import replace
+
 from PySide6.QtCore import QTimer
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
@@ -15,24 +17,26 @@ from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
 
 from endless_idler.characters.plugins import discover_character_plugins
-from endless_idler.passives.execution import apply_target_selection_passives
-from endless_idler.passives.execution import trigger_turn_start_passives
-from endless_idler.ui.battle.mechanics import apply_dark_sacrifice
-from endless_idler.ui.battle.mechanics import apply_fire_self_bleed
-from endless_idler.ui.battle.mechanics import dark_damage_multiplier_from_removed_hp
-from endless_idler.ui.battle.mechanics import fire_damage_multiplier_from_removed_hp
-from endless_idler.ui.battle.mechanics import resolve_light_heal
+from endless_idler.combat.engine import BATTLE_STEP_SECONDS
+from endless_idler.combat.engine import BattleEngine
+from endless_idler.combat.engine import BattleEvent
+from endless_idler.combat.engine import BattleOverEvent
+from endless_idler.combat.engine import BleedEvent
+from endless_idler.combat.engine import DodgeEvent
+from endless_idler.combat.engine import FellEvent
+from endless_idler.combat.engine import HealEvent
+from endless_idler.combat.engine import HitEvent
+from endless_idler.combat.engine import StatChangeEvent
+from endless_idler.combat.engine import StatusEvent
+from endless_idler.combat.forecast import FightSetup
+from endless_idler.combat.replay import ReplayLog
+from endless_idler.combat.replay import ReplayPlayer
+from endless_idler.combat.replay import ReplayRecorder
+from endless_idler.combat.replay import ReplayStore
+from endless_idler.combat.replay import new_replay_seed
 from endless_idler.run_rules import apply_battle_result
-from endless_idler.run_rules import calculate_gold_bonus
+from endless_idler.run_rules import calculate_battle_gold
 from endless_idler.ui.battle.colors import color_for_damage_type_id
-from endless_idler.ui.battle.sim import Combatant
-from endless_idler.ui.battle.sim import apply_offsite_stat_share
-from endless_idler.ui.battle.sim import build_reserves
-from endless_idler.ui.battle.sim import build_foes
-from endless_idler.ui.battle.sim import build_party
-from endless_idler.ui.battle.sim import calculate_damage
-from endless_idler.ui.battle.sim import choose_weighted_attacker
-from endless_idler.ui.battle.sim import choose_weighted_target_by_aggro
 from endless_idler.ui.battle.widgets import Arena
 from endless_idler.ui.battle.widgets import CombatantCard
 from endless_idler.ui.onsite import BattleOnsiteCharacterCard
@@ -46,16 +50,43 @@ from endless_idler.progression import record_character_death
 
 
 DEATH_EXP_DEBUFF_DURATION_SECONDS = 60 * 60
+BATTLE_SPEEDS = (1, 2, 4, 16)
+# Faster speeds coalesce several engine steps into one repaint instead of shrinking the timer further.
+MIN_BATTLE_FRAME_MS = 60
+SKIP_MAX_STEPS = 100_000
+TURN_ORDER_PREVIEW = 6
+
+
+def battle_frame_plan(speed: int) -> tuple[int, int]:
+    """Timer interval (ms) and engine steps per tick for a speed multiplier."""
+    speed = max(1, int(speed))
+    step_ms = BATTLE_STEP_SECONDS * 1000
+    steps_per_frame = max(1, int(round(speed * MIN_BATTLE_FRAME_MS / step_ms)))
+    return max(1, int(round(step_ms * steps_per_frame / speed))), steps_per_frame
 
 
 class BattleScreenWidget(QWidget):
+    """Plays one fight, or re-renders a recorded one when the payload carries `"replay"`."""
+
     finished = Signal()
+    replay_requested = Signal(object)
 
     def __init__(self, *, payload: object, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setObjectName("battleScreen")
 
         data = payload if isinstance(payload, dict) else {}
+        replay = data.get("replay")
+        # Set when replaying, and once a live fight has been recorded.
+        self._replay_log: ReplayLog | None = replay if isinstance(replay, ReplayLog) else None
+        self._replaying = self._replay_log is not None
+        if self._replay_log is not None:
+            data = {
+                "party_level": self._replay_log.setup.party_level,
+                "onsite": list(self._replay_log.setup.onsite),
+                "offsite": list(self._replay_log.setup.offsite),
+                "stacks": dict(self._replay_log.setup.stacks),
+            }
         party_level = int(data.get("party_level", 1) or 1)
         onsite_raw = data.get("onsite", [])
         offsite_raw = data.get("offsite", [])
@@ -86,48 +117,47 @@ class BattleScreenWidget(QWidget):
         self._save = self._save_manager.load() or RunSave()
         self._fight_number = max(1, int(getattr(self._save, "fight_number", 1)))
 
-        self._party: list[Combatant] = build_party(
-            onsite=onsite,
-            party_level=self._party_level,
-            stacks=self._stacks,
-            plugins_by_id=self._plugin_by_id,
-            rng=self._rng,
-            progress_by_id=dict(self._save.character_progress),
-            stats_by_id=dict(self._save.character_stats),
-        )
-        self._reserves: list[Combatant] = build_reserves(
-            char_ids=offsite,
-            party_level=self._party_level,
-            stacks=self._stacks,
-            plugins_by_id=self._plugin_by_id,
-            rng=self._rng,
-            limit=6,
-            progress_by_id=dict(self._save.character_progress),
-            stats_by_id=dict(self._save.character_stats),
-        )
-        apply_offsite_stat_share(party=self._party, reserves=self._reserves, share=0.10)
-
-        foe_level = max(1, int(self._party_level * float(self._fight_number) * 1.3))
-        self._foes: list[Combatant] = build_foes(
-            exclude_ids=set(onsite + offsite),
-            party_level=foe_level,
-            foe_count=5,
-            plugins=self._plugins,
-            rng=self._rng,
-        )
+        # The fight draws only from its own seeded rng so it can be recorded and
+        # verified; cards and run resets keep using `self._rng`.
+        self._engine: BattleEngine | ReplayPlayer
+        self._recorder: ReplayRecorder | None = None
+        if self._replay_log is not None:
+            self._fight_setup = self._replay_log.setup
+            self._fight_seed = self._replay_log.seed
+            self._party, self._reserves, self._foes = self._replay_log.build_battle(plugins=self._plugins)
+            self._engine = ReplayPlayer(
+                self._replay_log,
+                party=self._party,
+                reserves=self._reserves,
+                foes=self._foes,
+            )
+        else:
+            self._fight_setup = replace(
+                FightSetup.from_save(self._save),
+                onsite=tuple(onsite),
+                offsite=tuple(offsite),
+                party_level=self._party_level,
+                stacks=dict(self._stacks),
+            )
+            self._fight_seed = new_replay_seed(self._rng)
+            battle_rng = random.Random(self._fight_seed)
+            self._party, self._reserves, self._foes = self._fight_setup.build_battle(
+                plugins=self._plugins,
+                rng=battle_rng,
+            )
+            self._engine = BattleEngine(
+                party=self._party,
+                reserves=self._reserves,
+                foes=self._foes,
+                rng=battle_rng,
+                step_seconds=BATTLE_STEP_SECONDS,
+            )
+            self._recorder = ReplayRecorder(self._party + self._reserves + self._foes)
 
         self._party_cards: list[QWidget] = []
         self._reserve_cards: list[CombatantCard] = []
         self._foe_cards: list[CombatantCard] = []
-        self._turn_side = "party"
         self._battle_over = False
-        self._foe_kills = 0
-        
-        # Stalemate detection
-        self._stalemate_hp_ratio: float | None = None
-        self._stalemate_last_check_time: float = time.time()
-        self._stalemate_stacks: int = 0
-        self._stalemate_tick_counter: int = 0
 
         root = QVBoxLayout()
         root.setContentsMargins(16, 16, 16, 16)
@@ -145,8 +175,34 @@ class BattleScreenWidget(QWidget):
         back.clicked.connect(self._on_back_clicked)
         header.addWidget(back, 0, Qt.AlignmentFlag.AlignLeft)
 
+        speed = QPushButton()
+        speed.setObjectName("battleSpeedButton")
+        speed.setCursor(Qt.CursorShape.PointingHandCursor)
+        speed.setToolTip("Battle speed")
+        speed.clicked.connect(self._on_speed_clicked)
+        header.addWidget(speed, 0, Qt.AlignmentFlag.AlignLeft)
+        self._speed_button = speed
+        self._speed_index = 0
+
+        skip = QPushButton("Skip")
+        skip.setObjectName("battleSkipButton")
+        skip.setCursor(Qt.CursorShape.PointingHandCursor)
+        skip.setToolTip("Resolve the rest of the fight instantly")
+        skip.clicked.connect(self._on_skip_clicked)
+        header.addWidget(skip, 0, Qt.AlignmentFlag.AlignLeft)
+        self._skip_button = skip
+
+        replay_button = QPushButton("Replay")
+        replay_button.setObjectName("battleReplayButton")
+        replay_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        replay_button.setToolTip("Watch this fight again from its recording")
+        replay_button.setEnabled(False)
+        replay_button.clicked.connect(self._on_replay_clicked)
+        header.addWidget(replay_button, 0, Qt.AlignmentFlag.AlignLeft)
+        self._replay_button = replay_button
+
         header.addStretch(1)
-        title = QLabel("Battle")
+        title = QLabel("Replay" if self._replaying else "Battle")
         title.setObjectName("battleTitle")
         header.addWidget(title, 0, Qt.AlignmentFlag.AlignCenter)
         header.addStretch(1)
@@ -166,6 +222,11 @@ class BattleScreenWidget(QWidget):
         self._status.setFixedWidth(self._status.fontMetrics().horizontalAdvance("M" * 11) + 12)
         header.addWidget(self._status, 0, Qt.AlignmentFlag.AlignRight)
 
+        self._turn_order = QLabel("")
+        self._turn_order.setObjectName("battleTurnOrder")
+        self._turn_order.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        root.addWidget(self._turn_order)
+
         arena = Arena()
         self._arena = arena
 
@@ -273,9 +334,21 @@ class BattleScreenWidget(QWidget):
         arena_layout.setColumnStretch(1, 1)
         arena_layout.setColumnStretch(2, 0)
 
+        # Keyed by id(): foes can share a char_id with party members.
+        self._widget_by_combatant: dict[int, QWidget] = {}
+        for combatants, cards in (
+            (self._party, self._party_cards),
+            (self._reserves, self._reserve_cards),
+            (self._foes, self._foe_cards),
+        ):
+            for combatant, card in zip(combatants, cards, strict=False):
+                self._widget_by_combatant[id(combatant)] = card
+
+        self._steps_per_frame = 1
         self._battle_timer = QTimer(self)
-        self._battle_timer.setInterval(240)
         self._battle_timer.timeout.connect(self._step_battle)
+        self._apply_battle_speed()
+        self._refresh_turn_order()
         self._battle_timer.start()
 
     def _refresh_party_hp(self) -> None:
@@ -290,405 +363,115 @@ class BattleScreenWidget(QWidget):
             max_hp=int(getattr(save, "party_hp_max", 0)),
         )
 
-    def _calculate_hp_ratio(self) -> float:
-        """Calculate combined HP ratio: (party_max/party_current + reserves_max/reserves_current) vs (foes_max/foes_current)"""
-        party_ratio = sum(
-            c.max_hp / max(1, c.stats.hp) 
-            for c in self._party 
-            if c.stats.hp > 0
-        )
-        reserve_ratio = sum(
-            c.max_hp / max(1, c.stats.hp) 
-            for c in self._reserves 
-            if c.stats.hp > 0
-        )
-        foe_ratio = sum(
-            c.max_hp / max(1, c.stats.hp) 
-            for c in self._foes 
-            if c.stats.hp > 0
-        )
-        
-        allies_total = party_ratio + reserve_ratio
-        return allies_total / max(0.01, foe_ratio)
-    
-    def _check_stalemate(self) -> None:
-        """Detect stalemate and apply bleed if HP ratios haven't changed significantly in 15 seconds"""
-        current_time = time.time()
-        current_ratio = self._calculate_hp_ratio()
-        
-        if self._stalemate_hp_ratio is None:
-            self._stalemate_hp_ratio = current_ratio
-            self._stalemate_last_check_time = current_time
-            return
-        
-        time_elapsed = current_time - self._stalemate_last_check_time
-        
-        if time_elapsed >= 15.0:
-            ratio_change = abs(current_ratio - self._stalemate_hp_ratio) / max(0.01, abs(self._stalemate_hp_ratio))
-            
-            if ratio_change < 0.10:
-                self._stalemate_stacks += 1
-                self._set_status(f"Stalemate! Bleed x{self._stalemate_stacks}")
-            
-            self._stalemate_hp_ratio = current_ratio
-            self._stalemate_last_check_time = current_time
-    
-    def _apply_stalemate_bleed(self) -> None:
-        """Apply 1% current HP true damage per stack to all combatants every 10 ticks"""
-        if self._stalemate_stacks <= 0:
-            return
-        
-        self._stalemate_tick_counter += 1
-        
-        if self._stalemate_tick_counter >= 10:
-            self._stalemate_tick_counter = 0
-            damage_percent = 0.01 * self._stalemate_stacks
-            
-            for combatant in self._party + self._reserves + self._foes:
-                if combatant.stats.hp > 0:
-                    damage = max(1, int(combatant.stats.hp * damage_percent))
-                    combatant.stats.hp = max(0, combatant.stats.hp - damage)
-            
-            for card in self._party_cards + self._reserve_cards + self._foe_cards:
-                if hasattr(card, 'refresh'):
-                    card.refresh()
-
-    def _step_battle(self) -> None:
-        if self._battle_over:
-            return
-        if self._is_over():
-            self._on_battle_over()
-            return
-        
-        # Check for stalemate and apply bleed
-        self._check_stalemate()
-        self._apply_stalemate_bleed()
-
-        party_alive = [
-            (c, w)
-            for c, w in zip(self._party, self._party_cards, strict=False)
-            if c.stats.hp > 0
-        ]
-        foes_alive = [
-            (c, w)
-            for c, w in zip(self._foes, self._foe_cards, strict=False)
-            if c.stats.hp > 0
-        ]
-        if not party_alive or not foes_alive:
-            self._on_battle_over()
-            return
+    def _on_speed_clicked(self) -> None:
+        self._speed_index = (self._speed_index + 1) % len(BATTLE_SPEEDS)
+        self._apply_battle_speed()
 
-        # Trigger TURN_START passives for party
-        party_stats = [c.stats for c in self._party if c.stats.hp > 0]
-        reserve_stats = [c.stats for c in self._reserves if c.stats.hp > 0]
-        all_party_stats = party_stats + reserve_stats
-        foe_stats = [c.stats for c in self._foes if c.stats.hp > 0]
-        
-        turn_start_results = trigger_turn_start_passives(
-            all_allies=all_party_stats,
-            onsite_allies=party_stats,
-            offsite_allies=reserve_stats,
-            enemies=foe_stats,
-        )
-        
-        # Process TURN_START passive results (e.g., healing from Lady Light)
-        for result in turn_start_results:
-            if "healing_done" in result:
-                heals_by_target = result["healing_done"]
-                for target_stats, heal_amount_val in heals_by_target.items():
-                    # Find the combatant widget to refresh
-                    for combatant in self._party + self._reserves:
-                        if combatant.stats is target_stats:
-                            # Find the widget
-                            for card in self._party_cards + self._reserve_cards:
-                                if hasattr(card, 'refresh'):
-                                    card.refresh()
-                            break
-        
-        if not party_alive or not foes_alive:
-            self._on_battle_over()
-            return
+    def _apply_battle_speed(self) -> None:
+        speed = BATTLE_SPEEDS[self._speed_index]
+        interval_ms, self._steps_per_frame = battle_frame_plan(speed)
+        self._battle_timer.setInterval(interval_ms)
+        self._speed_button.setText(f"x{speed}")
 
-        if self._turn_side == "party":
-            attacker, attacker_widget = choose_weighted_attacker(party_alive, self._rng)
-            self._turn_side = "foes"
-            attacker_side = "party"
-        else:
-            attacker, attacker_widget = choose_weighted_attacker(foes_alive, self._rng)
-            self._turn_side = "party"
-            attacker_side = "foes"
-
-        attacker.turns_taken += 1
-        element_id = attacker.stats.element_id
-        color = color_for_damage_type_id(element_id)
-
-        party_onsite = [c for c, _ in party_alive]
-        foes_onsite = [c for c, _ in foes_alive]
-        party_widgets = {c: w for c, w in party_alive}
-        foe_widgets = {c: w for c, w in foes_alive}
-        reserve_widgets = {c: w for c, w in zip(self._reserves, self._reserve_cards, strict=False)}
-
-        if attacker_side == "party":
-            allies_onsite = party_onsite
-            allies_offsite = [c for c in self._reserves if c.stats.hp > 0]
-            enemies = foes_alive
-        else:
-            allies_onsite = foes_onsite
-            allies_offsite = []
-            enemies = party_alive
-
-        if element_id == "ice":
-            if not attacker.ice_charge_ready:
-                attacker.ice_charge_ready = True
-                self._set_status(f"{attacker.name} is charging…")
-                return
-            attacker.ice_charge_ready = False
-
-        if element_id == "light":
-            healed = resolve_light_heal(
-                attacker=attacker,
-                onsite_allies=allies_onsite,
-                offsite_allies=allies_offsite,
-            )
-            if healed:
-                self._set_status(f"{attacker.name} heals!")
-                for target, _ in healed:
-                    widget = party_widgets.get(target) or foe_widgets.get(target) or reserve_widgets.get(target)
-                    if widget is not None:
-                        widget.refresh()
-                        self._arena.add_pulse(attacker_widget, widget, color, same_team=True)
-                return
-
-        if element_id == "dark":
-            removed = apply_dark_sacrifice(onsite_allies=allies_onsite, offsite_allies=allies_offsite)
-            attacker.pending_damage_multiplier *= dark_damage_multiplier_from_removed_hp(removed)
-            if removed:
-                self._set_status(f"{attacker.name} sacrifices {removed} HP!")
-                for target in allies_onsite:
-                    widget = party_widgets.get(target) or foe_widgets.get(target)
-                    if widget is not None:
-                        widget.refresh()
-                for target in allies_offsite:
-                    widget = reserve_widgets.get(target)
-                    if widget is not None:
-                        widget.refresh()
-
-        if element_id == "fire":
-            removed = apply_fire_self_bleed(combatant=attacker, turns_taken=attacker.turns_taken)
-            attacker.pending_damage_multiplier *= fire_damage_multiplier_from_removed_hp(removed)
-            if removed:
-                attacker_widget.refresh()
-
-        damage_multiplier = float(max(0.0, attacker.pending_damage_multiplier))
-        attacker.pending_damage_multiplier = 1.0
-
-        if not enemies:
+    def _on_skip_clicked(self) -> None:
+        if self._battle_over:
             return
+        self._battle_timer.stop()
 
-        # Prepare passive context (convert Combatants to Stats)
-        allies_onsite_stats = [c.stats for c in allies_onsite]
-        allies_offsite_stats = [c.stats for c in allies_offsite]
-        all_allies_stats = allies_onsite_stats + allies_offsite_stats
-        enemies_stats = [c.stats for c, _ in enemies]
-
-        if element_id == "wind":
-            # Check if TARGET_SELECTION passives want to redirect
-            # Use first enemy as "original_target" for wind attacks
-            original_target_stats = enemies[0][0].stats if enemies else None
-            
-            if original_target_stats:
-                final_target_stats = apply_target_selection_passives(
-                    attacker=attacker.stats,
-                    original_target=original_target_stats,
-                    available_targets=enemies_stats,
-                    all_allies=all_allies_stats,
-                    onsite_allies=allies_onsite_stats,
-                    offsite_allies=allies_offsite_stats,
-                    enemies=enemies_stats,
-                )
-                
-                # If redirected to a different target, attack only that target
-                if final_target_stats is not original_target_stats:
-                    # Find the combatant and widget for the redirected target
-                    target, target_widget = next(
-                        (c, w) for c, w in enemies if c.stats is final_target_stats
-                    )
-                    
-                    # Single target attack due to redirection
-                    damage, crit, dodged = calculate_damage(
-                        attacker.stats,
-                        target.stats,
-                        self._rng,
-                        damage_multiplier=damage_multiplier,
-                        all_allies=all_allies_stats,
-                        onsite_allies=allies_onsite_stats,
-                        offsite_allies=allies_offsite_stats,
-                        enemies=enemies_stats,
-                    )
-                    if not dodged and damage > 0:
-                        previous_hp = int(target.stats.hp)
-                        target.stats.hp = max(0, previous_hp - int(damage))
-                        self._arena.add_pulse(attacker_widget, target_widget, color, crit=crit)
-                        self._set_status(f"{attacker.name} gusts {target.name} for {damage}{' (CRIT)' if crit else ''} (redirected)")
-                        target_widget.refresh()
-                        if previous_hp > 0 and target.stats.hp <= 0:
-                            self._handle_combatant_fell(target)
-                    if self._is_over():
-                        self._on_battle_over()
-                    return
-            
-            # Normal wind attack - hit all enemies
-            target_count = len(enemies)
-            total_damage = 0
-            any_crit = False
-            for target, target_widget in enemies:
-                damage, crit, dodged = calculate_damage(
-                    attacker.stats,
-                    target.stats,
-                    self._rng,
-                    damage_multiplier=damage_multiplier,
-                    all_allies=all_allies_stats,
-                    onsite_allies=allies_onsite_stats,
-                    offsite_allies=allies_offsite_stats,
-                    enemies=enemies_stats,
-                )
-                if dodged:
-                    continue
-                damage = int(damage // max(1, target_count))
-                if damage <= 0:
-                    continue
-                previous_hp = int(target.stats.hp)
-                target.stats.hp = max(0, previous_hp - int(damage))
-                total_damage += damage
-                any_crit = any_crit or crit
-                self._arena.add_pulse(attacker_widget, target_widget, color, crit=crit)
-                target_widget.refresh()
-                if previous_hp > 0 and target.stats.hp <= 0:
-                    self._handle_combatant_fell(target)
-            if total_damage > 0:
-                self._set_status(f"{attacker.name} gusts for {total_damage}{' (CRIT)' if any_crit else ''}")
-            if self._is_over():
-                self._on_battle_over()
-            return
+        events: list[BattleEvent] = []
+        turns = 0
+        while not self._engine.over and turns < SKIP_MAX_STEPS:
+            events.extend(self._step_engine())
+            turns += 1
+        self._replay_events(events, pulse_start=None)
 
-        if element_id == "lightning":
-            # Initial target selection
-            initial_target, initial_widget = (
-                self._rng.choice(enemies)
-                if attacker_side == "party"
-                else choose_weighted_target_by_aggro(enemies, self._rng)
-            )
-            
-            # Apply TARGET_SELECTION passives to allow redirection
-            final_target_stats = apply_target_selection_passives(
-                attacker=attacker.stats,
-                original_target=initial_target.stats,
-                available_targets=enemies_stats,
-                all_allies=all_allies_stats,
-                onsite_allies=allies_onsite_stats,
-                offsite_allies=allies_offsite_stats,
-                enemies=enemies_stats,
-            )
-            
-            # Find the combatant and widget for the final target
-            target, target_widget = next(
-                (c, w) for c, w in enemies if c.stats is final_target_stats
-            )
-            total_damage = 0
-            any_crit = False
-            landed = 0
-            for _ in range(5):
-                if target.stats.hp <= 0:
-                    break
-                damage, crit, dodged = calculate_damage(
-                    attacker.stats,
-                    target.stats,
-                    self._rng,
-                    damage_multiplier=damage_multiplier,
-                    all_allies=all_allies_stats,
-                    onsite_allies=allies_onsite_stats,
-                    offsite_allies=allies_offsite_stats,
-                    enemies=enemies_stats,
-                )
-                if dodged:
-                    continue
-                if damage <= 0:
-                    continue
-                landed += 1
-                any_crit = any_crit or crit
-                previous_hp = int(target.stats.hp)
-                target.stats.hp = max(0, previous_hp - int(damage))
-                total_damage += damage
-                self._arena.add_pulse(attacker_widget, target_widget, color, crit=crit)
-                target_widget.refresh()
-                if previous_hp > 0 and target.stats.hp <= 0:
-                    self._handle_combatant_fell(target)
-                    break
-            if landed:
-                self._set_status(f"{attacker.name} zaps {target.name} {landed}x for {total_damage}{' (CRIT)' if any_crit else ''}")
-            if self._is_over():
-                self._on_battle_over()
+        if not self._battle_over:
+            self._battle_timer.start()
             return
-
-        # Initial target selection for generic attack
-        initial_target, initial_widget = (
-            self._rng.choice(enemies)
-            if attacker_side == "party"
-            else choose_weighted_target_by_aggro(enemies, self._rng)
-        )
-        
-        # Apply TARGET_SELECTION passives to allow redirection
-        final_target_stats = apply_target_selection_passives(
-            attacker=attacker.stats,
-            original_target=initial_target.stats,
-            available_targets=enemies_stats,
-            all_allies=all_allies_stats,
-            onsite_allies=allies_onsite_stats,
-            offsite_allies=allies_offsite_stats,
-            enemies=enemies_stats,
-        )
-        
-        # Find the combatant and widget for the final target
-        target, target_widget = next(
-            (c, w) for c, w in enemies if c.stats is final_target_stats
+        fell = sum(1 for event in events if isinstance(event, FellEvent) and event.side == "party")
+        self._status.setToolTip(
+            f"{self._status.text()}: skipped {turns} turns, "
+            f"{self._engine.foe_kills} foes defeated, {fell} allies fell"
         )
 
-        damage, crit, dodged = calculate_damage(
-            attacker.stats,
-            target.stats,
-            self._rng,
-            damage_multiplier=damage_multiplier,
-            all_allies=all_allies_stats,
-            onsite_allies=allies_onsite_stats,
-            offsite_allies=allies_offsite_stats,
-            enemies=enemies_stats,
-        )
-        if dodged:
-            self._set_status(f"{target.name} dodged!")
-            self._arena.add_pulse(attacker_widget, target_widget, QColor(240, 240, 240))
+    def _step_battle(self) -> None:
+        events: list[BattleEvent] = []
+        step_events: list[BattleEvent] = []
+        for _ in range(self._steps_per_frame):
+            step_events = self._step_engine()
+            events.extend(step_events)
+            if self._engine.over:
+                break
+        self._replay_events(events, pulse_start=len(events) - len(step_events))
+
+    def _step_engine(self) -> list[BattleEvent]:
+        events = self._engine.step()
+        if self._recorder is not None:
+            self._recorder.record(events)
+        return events
+
+    def _replay_events(self, events: list[BattleEvent], *, pulse_start: int | None) -> None:
+        """Apply engine events to the screen in one refresh.
+
+        Every touched card refreshes once and the status shows the latest message;
+        only events from index `pulse_start` on draw pulses (None draws none).
+        """
+        widgets = self._widget_by_combatant
+        touched: dict[int, QWidget] = {}
+        status: str | None = None
+        battle_over: BattleOverEvent | None = None
+        for index, event in enumerate(events):
+            if isinstance(event, StatusEvent):
+                status = event.message
+                continue
+            if isinstance(event, FellEvent):
+                if event.side == "party" and not self._replaying:
+                    self._apply_death_exp_debuff(event.target.char_id)
+                continue
+            if isinstance(event, BattleOverEvent):
+                battle_over = event
+                continue
+            if isinstance(event, (HitEvent, HealEvent, BleedEvent, StatChangeEvent)):
+                target_widget = widgets.get(id(event.target))
+                if target_widget is not None:
+                    touched[id(event.target)] = target_widget
+            if pulse_start is not None and index >= pulse_start:
+                self._add_event_pulse(event)
+
+        for widget in touched.values():
+            widget.refresh()
+        if status is not None:
+            self._set_status(status)
+        if battle_over is not None:
+            self._on_battle_over(battle_over)
+        self._refresh_turn_order()
+
+    def _refresh_turn_order(self) -> None:
+        if self._battle_over:
+            self._turn_order.setText("")
             return
-
-        if damage <= 0:
+        names = [combatant.name for combatant in self._engine.upcoming_turns(TURN_ORDER_PREVIEW)]
+        self._turn_order.setText("Next: " + " › ".join(names) if names else "")
+
+    def _add_event_pulse(self, event: BattleEvent) -> None:
+        widgets = self._widget_by_combatant
+        if isinstance(event, HitEvent):
+            source = widgets.get(id(event.attacker))
+            color = color_for_damage_type_id(event.element_id)
+            options = {"crit": event.crit}
+        elif isinstance(event, HealEvent) and event.source is not None:
+            source = widgets.get(id(event.source))
+            color = color_for_damage_type_id(event.source.stats.element_id)
+            options = {"same_team": True}
+        elif isinstance(event, DodgeEvent):
+            source = widgets.get(id(event.attacker))
+            color = QColor(240, 240, 240)
+            options = {}
+        else:
             return
-
-        previous_hp = int(target.stats.hp)
-        target.stats.hp = max(0, previous_hp - int(damage))
-        self._arena.add_pulse(attacker_widget, target_widget, color, crit=crit)
-        self._set_status(f"{attacker.name} hits {target.name} for {damage}{' (CRIT)' if crit else ''}")
-
-        target_widget.refresh()
-        if previous_hp > 0 and target.stats.hp <= 0:
-            self._handle_combatant_fell(target)
-
-        if self._is_over():
-            self._on_battle_over()
-
-    def _handle_combatant_fell(self, target: Combatant) -> None:
-        self._set_status(f"{target.name} fell!")
-        if target in self._party:
-            self._apply_death_exp_debuff(target.char_id)
-        elif target in self._foes:
-            self._foe_kills += 1
+        target = widgets.get(id(event.target))
+        if source is not None and target is not None:
+            self._arena.add_pulse(source, target, color, **options)
 
     def _set_status(self, message: str) -> None:
         message = str(message or "").replace("\n", " ").strip()
@@ -700,26 +483,27 @@ class BattleScreenWidget(QWidget):
             message = f"{message[:clipped]}…"
         self._status.setText(message)
 
-    def _on_battle_over(self) -> None:
+    def _on_battle_over(self, event: BattleOverEvent) -> None:
         if self._battle_over:
             return
         self._battle_over = True
-        
-        # Reset stalemate tracking
-        self._stalemate_stacks = 0
-        self._stalemate_hp_ratio = None
-        self._stalemate_tick_counter = 0
-
-        party_alive = any(c.stats.hp > 0 for c in self._party)
-        foes_alive = any(c.stats.hp > 0 for c in self._foes)
-        victory = bool(party_alive and not foes_alive)
-        defeat = bool(foes_alive and not party_alive)
-        if party_alive and not foes_alive:
-            self._award_gold(self._foe_kills, victory=True)
+        self._skip_button.setEnabled(False)
+
+        if self._replaying:
+            self._set_status("Victory" if event.victory else "Defeat" if event.defeat else "Over")
+            self._replay_button.setEnabled(True)
+            self._battle_timer.stop()
+            return
+        self._save_replay()
+
+        victory = event.victory
+        defeat = event.defeat
+        if victory:
+            self._award_gold(event.foe_kills, victory=True)
             self._set_status("Victory")
             self._apply_idle_exp_bonus()
-        elif foes_alive and not party_alive:
-            self._award_gold(self._foe_kills, victory=False)
+        elif defeat:
+            self._award_gold(event.foe_kills, victory=False)
             self._set_status("Defeat")
             self._apply_idle_exp_penalty()
         else:
@@ -770,6 +554,22 @@ class BattleScreenWidget(QWidget):
         except Exception:
             pass
 
+    def _save_replay(self) -> None:
+        if self._recorder is None:
+            return
+        self._replay_log = self._recorder.log(setup=self._fight_setup, seed=self._fight_seed)
+        self._recorder = None
+        self._replay_button.setEnabled(True)
+        try:
+            ReplayStore().append(self._replay_log)
+        except Exception:
+            pass
+
+    def _on_replay_clicked(self) -> None:
+        if self._replay_log is None or not self._battle_over:
+            return
+        self.replay_requested.emit({"replay": self._replay_log})
+
     def _apply_idle_exp_bonus(self) -> None:
         self._extend_idle_exp_timer(key="idle_exp_bonus_seconds", seconds=5 * 60)
 
@@ -783,27 +583,20 @@ class BattleScreenWidget(QWidget):
             kills: Number of foes defeated
             victory: If True, award full gold. If False, award 50% of base kills only.
         """
-        gold = max(0, int(kills))
-        if gold <= 0:
+        if max(0, int(kills)) <= 0:
             return
 
         try:
             manager = SaveManager()
             save = manager.load() or RunSave()
-            
+
             tokens = max(0, int(save.tokens))
-            winstreak = max(0, int(getattr(save, "winstreak", 0)))
-            bonus = calculate_gold_bonus(tokens, winstreak)
-            
-            if victory:
-                # Full rewards on victory: base kills + bonus
-                total_gold = gold + bonus
-            else:
-                # Partial rewards on loss: 50% of base kills + full bonus
-                # Bonus helps struggling players, reduced base maintains win incentive
-                loss_gold = max(1, gold // 2)  # Minimum 1 gold for killing any foes
-                total_gold = loss_gold + bonus
-            
+            total_gold = calculate_battle_gold(
+                kills,
+                victory=victory,
+                tokens=tokens,
+                winstreak=max(0, int(getattr(save, "winstreak", 0))),
+            )
             save.tokens = tokens + total_gold
             manager.save(save)
         except Exception:
@@ -859,13 +652,8 @@ class BattleScreenWidget(QWidget):
         except Exception:
             return
 
-    def _is_over(self) -> bool:
-        party_alive = any(c.stats.hp > 0 for c in self._party)
-        foes_alive = any(c.stats.hp > 0 for c in self._foes)
-        return not party_alive or not foes_alive
-
     def _on_back_clicked(self) -> None:
-        if self._battle_over:
+        if self._battle_over or self._replaying:
             self._finish()
             return
         
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import time
 import random
 
+from PySide6.QtCore import QEvent
 from PySide6.QtCore import QTimer
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
@@ -15,9 +17,13 @@ from PySide6.QtWidgets import QWidget
 from PySide6.QtWidgets import QFrame
 
 from endless_idler.characters.plugins import discover_character_plugins
-from endless_idler.combat.party_stats import apply_offsite_stat_share
-from endless_idler.combat.party_stats import build_scaled_character_stats
-from endless_idler.combat.stats import Stats
+from endless_idler.idle.worker import IdleSimulationWorker
+from endless_idler.idle.card_refresh import IdleCardRefresher
+from endless_idler.idle.session import clear_idle_session
+from endless_idler.idle.session import idle_resume_at
+from endless_idler.idle.session import stamp_idle_session
+from endless_idler.idle.state import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.state import IdleSimulation
 from endless_idler.run_rules import apply_idle_party_heal
 from endless_idler.run_rules import start_idle_heal_timer
 from endless_idler.save import OFFSITE_SLOTS
@@ -26,17 +32,25 @@ from endless_idler.save import RunSave
 from endless_idler.save import SaveManager
 from endless_idler.ui.idle.widgets import IdleArena
 from endless_idler.ui.idle.widgets import IdleOffsiteCard
-from endless_idler.ui.idle.idle_state import IDLE_TICK_INTERVAL_SECONDS
-from endless_idler.ui.idle.idle_state import IdleGameState
 from endless_idler.ui.onsite import IdleOnsiteCharacterCard
 from endless_idler.ui.onsite import compute_stat_maxima
 from endless_idler.ui.party_hp_bar import PartyHpHeader
 
 
+IDLE_UI_REFRESH_SECONDS = 0.1
+IDLE_UI_BACKGROUND_REFRESH_SECONDS = 1.0
+
+
 class IdleScreenWidget(QWidget):
     finished = Signal()
 
-    def __init__(self, *, payload: object, parent: QWidget | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        payload: object,
+        ui_refresh_seconds: float = IDLE_UI_REFRESH_SECONDS,
+        parent: QWidget | None = None,
+    ) -> None:
         super().__init__(parent)
         self.setObjectName("idleScreen")
 
@@ -81,7 +95,13 @@ class IdleScreenWidget(QWidget):
         self._plugins = discover_character_plugins()
         self._plugin_by_id = {plugin.char_id: plugin for plugin in self._plugins}
 
-        self._idle_state = IdleGameState(
+        # Resume from the last autosaved idle tick so time spent with the app closed still counts.
+        now = float(time.time())
+        resume_at = idle_resume_at(self._save, onsite=onsite, offsite=offsite, now=now)
+
+        # A plain simulation, not the Qt `IdleGameState`: it ticks on the worker thread,
+        # where emitting Qt signals would be unsafe.
+        self._idle_state = IdleSimulation(
             char_ids=onsite,
             offsite_ids=offsite,
             party_level=self._party_level,
@@ -95,6 +115,19 @@ class IdleScreenWidget(QWidget):
             exp_penalty_seconds=float(self._save.idle_exp_penalty_seconds),
             shared_exp_percentage=int(getattr(self._save, "idle_shared_exp_percentage", 0)),
             risk_reward_level=int(getattr(self._save, "idle_risk_reward_level", 0)),
+            started_at=resume_at,
+        )
+        # The worker owns the state from here on; widgets read its published snapshots.
+        self._worker = IdleSimulationWorker(
+            self._idle_state,
+            catch_up_seconds=now - resume_at if resume_at < now else 0.0,
+            catch_up_start=resume_at,
+        )
+        self._card_refresher = IdleCardRefresher(
+            plugins_by_id=self._plugin_by_id,
+            party_level=self._party_level,
+            reserve_ids=offsite,
+            stat_maxima=compute_stat_maxima,
         )
 
         self._onsite_cards: list[IdleOnsiteCharacterCard] = []
@@ -156,7 +189,7 @@ class IdleScreenWidget(QWidget):
             card = IdleOnsiteCharacterCard(
                 char_id=char_id,
                 plugin=plugin,
-                idle_state=self._idle_state,
+                idle_state=self._worker,
                 rng=self._rng,
                 stack_count=stack_count,
                 on_rebirth=self._rebirth_character,
@@ -182,7 +215,7 @@ class IdleScreenWidget(QWidget):
             card = IdleOffsiteCard(
                 char_id=char_id,
                 plugin=plugin,
-                idle_state=self._idle_state,
+                idle_state=self._worker,
                 rng=self._rng,
                 stack_count=stack_count,
                 on_rebirth=self._rebirth_character,
@@ -211,10 +244,16 @@ class IdleScreenWidget(QWidget):
 
         self._update_mods_ui()
 
-        self._idle_state.tick_update.connect(self._on_tick)
-        self._idle_timer = QTimer(self)
-        self._idle_timer.timeout.connect(self._idle_state.process_tick)
-        self._idle_timer.start(int(max(1, IDLE_TICK_INTERVAL_SECONDS * 1000)))
+        # The worker advances the simulation in whole fixed ticks from a wall-clock
+        # accumulator, so the UI refresh rate (and throttling) never changes how much
+        # idle time is simulated.
+        self._ui_refresh_seconds = float(max(IDLE_TICK_INTERVAL_SECONDS, ui_refresh_seconds))
+        self._throttled = False
+        self._worker.start()
+
+        self._render_timer = QTimer(self)
+        self._render_timer.timeout.connect(self._render_frame)
+        self._render_timer.start(int(max(1, self._ui_refresh_seconds * 1000)))
 
         self._autosave_timer = QTimer(self)
         self._autosave_timer.timeout.connect(self._autosave)
@@ -290,90 +329,30 @@ class IdleScreenWidget(QWidget):
         return panel
 
     def _on_shared_exp_changed(self, value: int) -> None:
-        self._idle_state.set_shared_exp_percentage(value)
+        self._worker.set_shared_exp_percentage(value)
         self._update_mods_ui()
 
     def _on_risk_reward_changed(self, value: int) -> None:
-        self._idle_state.set_risk_reward_level(value)
+        self._worker.set_risk_reward_level(value)
         self._update_mods_ui()
 
     def _update_mods_ui(self) -> None:
-        shared_pct = self._idle_state.get_shared_exp_percentage()
+        shared_pct = self._worker.get_shared_exp_percentage()
         self._shared_exp_label.setText(f"Shared EXP: {shared_pct}%")
         self._shared_exp_slider.setValue(shared_pct)
 
-        rr_level = self._idle_state.get_risk_reward_level()
+        rr_level = self._worker.get_risk_reward_level()
         self._rr_label.setText(f"Risk & Reward: {rr_level}")
         self._rr_slider.setValue(rr_level)
 
     def _refresh_character_cards(self) -> None:
-        snapshots: list[tuple[IdleOnsiteCharacterCard, dict, Stats, float]] = []
-        party_stats: list[Stats] = []
-        for card in self._onsite_cards:
-            snapshot = card.snapshot()
-            if snapshot is None:
-                continue
-            data, stats = snapshot
-            try:
-                max_hp = float(max(1.0, float(data.get("max_hp", 1.0))))
-            except (TypeError, ValueError):
-                max_hp = 1.0
-            try:
-                hp = float(max(0.0, float(data.get("hp", 0.0))))
-            except (TypeError, ValueError):
-                hp = 0.0
-            ratio = min(1.0, hp / max_hp) if max_hp > 0 else 1.0
-            snapshots.append((card, data, stats, ratio))
-            party_stats.append(stats)
-
-        reserves: list[Stats] = []
-        seen: set[str] = set()
-        for char_id in [str(item) for item in getattr(self, "_offsite_ids", []) if item]:
-            if len(reserves) >= 6:
-                break
-            if char_id in seen:
-                continue
-            seen.add(char_id)
-
-            plugin = self._plugin_by_id.get(char_id)
-            data = self._idle_state.get_char_data(char_id)
-            if plugin is None or not isinstance(data, dict):
-                continue
-            base_stats = data.get("base_stats")
-            if not isinstance(base_stats, dict):
-                continue
-            stacks = max(1, int(data.get("stack", 1)))
-            stars = max(1, int(getattr(plugin, "stars", 1) or 1))
-            progress: dict[str, float | int] = {
-                "level": max(1, int(data.get("level", 1))),
-                "exp": float(max(0.0, float(data.get("exp", 0.0)))),
-                "exp_multiplier": float(max(0.0, float(data.get("exp_multiplier", 1.0)))),
-                "max_hp_level_bonus_version": max(0, int(data.get("max_hp_level_bonus_version", 0))),
-            }
-            reserves.append(
-                build_scaled_character_stats(
-                    plugin=plugin,
-                    party_level=self._party_level,
-                    stars=stars,
-                    stacks=stacks,
-                    progress=progress,
-                    saved_base_stats=base_stats,
-                )
-            )
-
-        apply_offsite_stat_share(party=party_stats, reserves=reserves, share=0.10)
-
-        for (_card, _data, stats, ratio) in snapshots:
-            stats.hp = max(0, min(stats.max_hp, int(round(float(stats.max_hp) * ratio))))
-
-        maxima = compute_stat_maxima(party_stats)
-        for card, data, stats, _ratio in snapshots:
-            card.apply_snapshot(data, stats, maxima=maxima)
-
-        for card in self._offsite_cards:
-            card.update_display()
+        self._card_refresher.refresh(
+            self._worker.snapshot(),
+            onsite_cards=self._onsite_cards,
+            offsite_cards=self._offsite_cards,
+        )
 
-    def _on_tick(self, tick_count: int) -> None:
+    def _render_frame(self) -> None:
         self._refresh_character_cards()
         healed = 0
         try:
@@ -383,76 +362,95 @@ class IdleScreenWidget(QWidget):
         if healed > 0:
             self._save_manager.save(self._save)
             self._refresh_party_hp()
+        self._update_refresh_rate()
+
+    def set_ui_refresh_seconds(self, seconds: float) -> None:
+        self._ui_refresh_seconds = float(max(IDLE_TICK_INTERVAL_SECONDS, seconds))
+        self._update_refresh_rate(force=True)
+
+    def _is_backgrounded(self) -> bool:
+        window = self.window()
+        if window.isMinimized() or not self.isVisible():
+            return True
+        if not window.isActiveWindow():
+            return True
+        return self.visibleRegion().isEmpty()
+
+    def _update_refresh_rate(self, *, force: bool = False) -> None:
+        throttled = self._is_backgrounded()
+        if throttled == self._throttled and not force:
+            return
+        self._throttled = throttled
+
+        if throttled:
+            interval = max(self._ui_refresh_seconds, IDLE_UI_BACKGROUND_REFRESH_SECONDS)
+            sim_interval = interval
+        else:
+            interval = self._ui_refresh_seconds
+            sim_interval = IDLE_TICK_INTERVAL_SECONDS
+        self._render_timer.setInterval(int(max(1, interval * 1000)))
+        self._worker.set_step_seconds(sim_interval)
+        if not throttled:
+            self._render_frame()
+
+    def changeEvent(self, event: object) -> None:
+        event_type = getattr(event, "type", lambda: None)()
+        if event_type in (QEvent.Type.WindowStateChange, QEvent.Type.ActivationChange):
+            self._update_refresh_rate()
+        try:
+            super().changeEvent(event)  # type: ignore[misc]
+        except Exception:
+            return
 
     def _rebirth_character(self, char_id: str) -> None:
-        if not self._idle_state.rebirth_character(char_id):
+        if not self._worker.rebirth_character(char_id):
             return
 
         try:
-            save = self._save
-            progress = dict(save.character_progress)
-            progress.update(self._idle_state.export_progress())
-            save.character_progress = progress
-            stats = dict(save.character_stats)
-            stats.update(self._idle_state.export_character_stats())
-            save.character_stats = stats
-            initial_stats = dict(getattr(save, "character_initial_stats", {}) or {})
-            initial_stats.update(self._idle_state.export_initial_stats())
-            save.character_initial_stats = initial_stats
-            bonus_seconds, penalty_seconds = self._idle_state.export_run_buff_seconds()
-            save.idle_exp_bonus_seconds = bonus_seconds
-            save.idle_exp_penalty_seconds = penalty_seconds
-            save.idle_shared_exp_percentage = self._idle_state.get_shared_exp_percentage()
-            save.idle_risk_reward_level = self._idle_state.get_risk_reward_level()
-            self._save_manager.save(save)
+            self._write_idle_state(last_tick_at=float(time.time()))
+            self._save_manager.save(self._save)
         except Exception:
             return
 
         self._refresh_character_cards()
 
+    def _write_idle_state(self, *, last_tick_at: float) -> None:
+        export = self._worker.export_state()
+        save = self._save
+        progress = dict(save.character_progress)
+        progress.update(export.progress)
+        save.character_progress = progress
+        stats = dict(save.character_stats)
+        stats.update(export.character_stats)
+        save.character_stats = stats
+        initial_stats = dict(getattr(save, "character_initial_stats", {}) or {})
+        initial_stats.update(export.initial_stats)
+        save.character_initial_stats = initial_stats
+        save.idle_exp_bonus_seconds = export.exp_bonus_seconds
+        save.idle_exp_penalty_seconds = export.exp_penalty_seconds
+        save.idle_shared_exp_percentage = export.shared_exp_percentage
+        save.idle_risk_reward_level = export.risk_reward_level
+        if last_tick_at > 0.0:
+            stamp_idle_session(save, last_tick_at=last_tick_at, onsite=self._onsite_ids, offsite=self._offsite_ids)
+        else:
+            clear_idle_session(save)
+
     def _autosave(self) -> None:
         try:
-            save = self._save
-            progress = dict(save.character_progress)
-            progress.update(self._idle_state.export_progress())
-            save.character_progress = progress
-            stats = dict(save.character_stats)
-            stats.update(self._idle_state.export_character_stats())
-            save.character_stats = stats
-            initial_stats = dict(getattr(save, "character_initial_stats", {}) or {})
-            initial_stats.update(self._idle_state.export_initial_stats())
-            save.character_initial_stats = initial_stats
-            bonus_seconds, penalty_seconds = self._idle_state.export_run_buff_seconds()
-            save.idle_exp_bonus_seconds = bonus_seconds
-            save.idle_exp_penalty_seconds = penalty_seconds
-            save.idle_shared_exp_percentage = self._idle_state.get_shared_exp_percentage()
-            save.idle_risk_reward_level = self._idle_state.get_risk_reward_level()
-            self._save_manager.save(save)
+            self._write_idle_state(last_tick_at=float(time.time()))
+            self._save_manager.save(self._save)
         except Exception:
             pass
 
     def _finish(self) -> None:
-        if self._idle_timer:
-            self._idle_timer.stop()
+        if self._render_timer:
+            self._render_timer.stop()
         if self._autosave_timer:
             self._autosave_timer.stop()
+        self._worker.stop()
         try:
-            save = self._save
-            progress = dict(save.character_progress)
-            progress.update(self._idle_state.export_progress())
-            save.character_progress = progress
-            stats = dict(save.character_stats)
-            stats.update(self._idle_state.export_character_stats())
-            save.character_stats = stats
-            initial_stats = dict(getattr(save, "character_initial_stats", {}) or {})
-            initial_stats.update(self._idle_state.export_initial_stats())
-            save.character_initial_stats = initial_stats
-            bonus_seconds, penalty_seconds = self._idle_state.export_run_buff_seconds()
-            save.idle_exp_bonus_seconds = bonus_seconds
-            save.idle_exp_penalty_seconds = penalty_seconds
-            save.idle_shared_exp_percentage = self._idle_state.get_shared_exp_percentage()
-            save.idle_risk_reward_level = self._idle_state.get_risk_reward_level()
-            self._save_manager.save(save)
+            self._write_idle_state(last_tick_at=0.0)
+            self._save_manager.save(self._save)
         except Exception:
             pass
         self.finished.emit()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 
+from collections.abc import Mapping
 from collections.abc import Callable
 
 from PySide6.QtCore import Qt
@@ -14,6 +15,8 @@ from PySide6.QtWidgets import QProgressBar
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
 
+from endless_idler.idle.state import IdleChange
+
 
 class IdleArena(QFrame):
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -39,6 +42,7 @@ class IdleOffsiteCard(QFrame):
         self._rng = rng
         self._stack_count = stack_count
         self._on_rebirth = on_rebirth
+        self._tint_applied = False
 
         self.setFixedSize(220, 96)
 
@@ -120,53 +124,62 @@ class IdleOffsiteCard(QFrame):
         
         # Element tint will be applied on first update_display call
 
-    def update_display(self) -> None:
+    @property
+    def char_id(self) -> str:
+        return self._char_id
+
+    def update_display(self, changes: int = IdleChange.ALL) -> None:
+        """Refresh the widgets for the fields flagged in `changes` (an `IdleChange` mask)."""
         data = self._idle_state.get_char_data(self._char_id)
         if not data:
             return
 
         level = int(data.get("level", 1))
-        exp = float(data.get("exp", 0))
-        next_exp = float(data.get("next_exp", 30))
-        hp = float(data.get("hp", 0))
-        max_hp = float(data.get("max_hp", 1000))
-
-        gain_per_second = 0.0
-        getter = getattr(self._idle_state, "get_exp_gain_per_second", None)
-        if callable(getter):
-            try:
-                gain_per_second = float(getter(self._char_id))
-            except Exception:
-                gain_per_second = 0.0
-
-        self._level_label.setText(f"Level: {level}")
-        self._exp_bar.setRange(0, max(1, int(next_exp)))
-        self._exp_bar.setValue(int(exp))
-        if gain_per_second > 0:
-            self._exp_bar.setFormat(f"EXP {max(0, int(exp))} / {max(1, int(next_exp))} +{gain_per_second:.2f}/s")
-        else:
-            self._exp_bar.setFormat(f"EXP {max(0, int(exp))} / {max(1, int(next_exp))}")
-
-        self._hp_bar.setRange(0, max(1, int(max_hp)))
-        self._hp_bar.setValue(int(hp))
-        self._hp_bar.setFormat(f"{max(0, int(hp))} / {max(1, int(max_hp))}")
-
-        self._rebirth_button.setVisible(level >= 50)
-        
-        # Apply element tint on each update
-        self._apply_element_tint(data)
-    
-    def _apply_element_tint(self, data: dict) -> None:
+        if changes & IdleChange.LEVEL:
+            self._level_label.setText(f"Level: {level}")
+            self._rebirth_button.setVisible(level >= 50)
+
+        if changes & (IdleChange.EXP | IdleChange.LEVEL):
+            exp = float(data.get("exp", 0))
+            next_exp = float(data.get("next_exp", 30))
+
+            gain_per_second = 0.0
+            getter = getattr(self._idle_state, "get_exp_gain_per_second", None)
+            if callable(getter):
+                try:
+                    gain_per_second = float(getter(self._char_id))
+                except Exception:
+                    gain_per_second = 0.0
+
+            self._exp_bar.setRange(0, max(1, int(next_exp)))
+            self._exp_bar.setValue(int(exp))
+            if gain_per_second > 0:
+                self._exp_bar.setFormat(f"EXP {max(0, int(exp))} / {max(1, int(next_exp))} +{gain_per_second:.2f}/s")
+            else:
+                self._exp_bar.setFormat(f"EXP {max(0, int(exp))} / {max(1, int(next_exp))}")
+
+        if changes & IdleChange.HP:
+            hp = float(data.get("hp", 0))
+            max_hp = float(data.get("max_hp", 1000))
+            self._hp_bar.setRange(0, max(1, int(max_hp)))
+            self._hp_bar.setValue(int(hp))
+            self._hp_bar.setFormat(f"{max(0, int(hp))} / {max(1, int(max_hp))}")
+
+        # The element (and so the tint) never changes, so it is only applied once.
+        if not self._tint_applied:
+            self._apply_element_tint(data)
+
+    def _apply_element_tint(self, data: Mapping[str, object]) -> None:
         from endless_idler.combat.party_stats import build_scaled_character_stats
         
         if not self._plugin:
             return
         
-        if not data or not isinstance(data, dict):
+        if not data or not isinstance(data, Mapping):
             return
         
         base_stats = data.get("base_stats")
-        saved_base_stats = dict(base_stats) if isinstance(base_stats, dict) else {}
+        saved_base_stats = dict(base_stats) if isinstance(base_stats, Mapping) else {}
         
         try:
             stack_count = max(1, int(data.get("stack", 1)))
@@ -205,6 +218,7 @@ class IdleOffsiteCard(QFrame):
         
         tint_color = f"rgba({color.red()}, {color.green()}, {color.blue()}, 60)"
         self.setStyleSheet(f"QFrame#idleOffsiteCard {{ background-color: {tint_color} !important; }}")
+        self._tint_applied = True
 
     def _request_rebirth(self) -> None:
         if self._on_rebirth is None:
@@ -146,6 +146,7 @@ class MainMenuWindow(QMainWindow):
 
         battle = BattleScreenWidget(payload=payload)
         battle.finished.connect(self._close_battle_screen)
+        battle.replay_requested.connect(self._open_battle_screen)
         self._battle_screen = battle
         self._stack.addWidget(battle)
         self._stack.setCurrentWidget(battle)
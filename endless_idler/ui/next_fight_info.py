@@ -6,6 +6,8 @@ from PySide6.QtWidgets import QHBoxLayout
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QSizePolicy
 
+from endless_idler.combat.forecast import FightForecast
+
 
 class NextFightInfo(QFrame):
     def __init__(self, parent: QFrame | None = None) -> None:
@@ -28,6 +30,28 @@ class NextFightInfo(QFrame):
         self._level_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
         layout.addWidget(self._level_label, 0, Qt.AlignmentFlag.AlignVCenter)
 
+        self._forecast_label = QLabel("")
+        self._forecast_label.setObjectName("nextFightForecastLabel")
+        self._forecast_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
+        self._forecast_label.setVisible(False)
+        layout.addWidget(self._forecast_label, 0, Qt.AlignmentFlag.AlignVCenter)
+
     def set_level(self, level: int) -> None:
         level = max(1, int(level))
         self._level_label.setText(f"Level: {level}")
+
+    def set_forecast(self, forecast: FightForecast | None, *, pending: bool = False) -> None:
+        if forecast is None:
+            self._forecast_label.setText("Win: …" if pending else "")
+            self._forecast_label.setToolTip("")
+            self._forecast_label.setVisible(pending)
+            return
+        self._forecast_label.setText(f"Win: {forecast.win_rate * 100:.0f}%")
+        unresolved = f" ({forecast.unresolved} more ended without a result)" if forecast.unresolved else ""
+        self._forecast_label.setToolTip(
+            f"Estimated from {forecast.fights} simulated fights{unresolved}\n"
+            f"Win chance: {forecast.win_rate * 100:.1f}%\n"
+            f"Expected gold: {forecast.expected_gold:.1f}\n"
+            f"Expected party HP loss: {forecast.expected_party_hp_loss:.1f}"
+        )
+        self._forecast_label.setVisible(True)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import random
 
+from collections.abc import Mapping
 from collections.abc import Callable
 
 from PySide6.QtCore import QPoint
@@ -18,7 +19,9 @@ from PySide6.QtWidgets import QWidget
 
 from endless_idler.combat.party_stats import build_scaled_character_stats
 from endless_idler.combat.stats import Stats
+from endless_idler.idle.state import IdleChange
 from endless_idler.ui.onsite.stat_bars import StatBarsPanel
+from endless_idler.ui.onsite.stat_bars import compute_stat_maxima
 from endless_idler.ui.party_builder_common import build_character_stats_tooltip
 from endless_idler.ui.tooltip import hide_stained_tooltip
 from endless_idler.ui.tooltip import show_stained_tooltip
@@ -98,6 +101,10 @@ class OnsiteCharacterCardBase(QFrame):
         self._team_side = (team_side or "left").strip().lower()
         self._stack_count = max(1, int(stack_count))
         self._tooltip_html = ""
+        self._tooltip_args: dict[str, object] | None = None
+        self._element_tint: str | None = None
+        self._hp_display: tuple[int, int] | None = None
+        self._exp_display: tuple[int, int, str] | None = None
         self._stats_panel: StatBarsPanel | None = None
         self._stats_popup: OnsiteStatsPopup | None = None
 
@@ -190,6 +197,9 @@ class OnsiteCharacterCardBase(QFrame):
     def set_hp(self, *, current: float, max_hp: float) -> None:
         current_hp = max(0, int(current))
         max_hp_value = max(1, int(max_hp))
+        if self._hp_display == (current_hp, max_hp_value):
+            return
+        self._hp_display = (current_hp, max_hp_value)
         self._hp_bar.setRange(0, max_hp_value)
         self._hp_bar.setValue(min(current_hp, max_hp_value))
         self._hp_bar.setFormat(f"{current_hp} / {max_hp_value}")
@@ -197,6 +207,9 @@ class OnsiteCharacterCardBase(QFrame):
     def set_exp(self, *, current: float, max_exp: float, format_text: str) -> None:
         exp_value = max(0, int(current))
         exp_max = max(1, int(max_exp))
+        if self._exp_display == (exp_value, exp_max, str(format_text)):
+            return
+        self._exp_display = (exp_value, exp_max, str(format_text))
         self._exp_bar.setRange(0, exp_max)
         self._exp_bar.setValue(min(exp_value, exp_max))
         self._exp_bar.setFormat(str(format_text))
@@ -228,13 +241,15 @@ class OnsiteCharacterCardBase(QFrame):
         maxima: dict[str, float],
     ) -> None:
         self._stats = stats
-        self._tooltip_html = build_character_stats_tooltip(
-            name=str(name),
-            stars=stars,
-            stacks=stacks,
-            stackable=stackable,
-            stats=stats,
-        )
+        # Built on hover; HP ticks would otherwise rebuild it many times a second.
+        self._tooltip_html = ""
+        self._tooltip_args = {
+            "name": str(name),
+            "stars": stars,
+            "stacks": stacks,
+            "stackable": stackable,
+            "stats": stats,
+        }
 
         if self._stats_panel is None:
             self._stats_panel = StatBarsPanel(stats=stats, maxima=maxima)
@@ -250,6 +265,9 @@ class OnsiteCharacterCardBase(QFrame):
     def _apply_element_tint(self, stats: Stats) -> None:
         from endless_idler.ui.battle.colors import color_for_damage_type_id
         element_id = getattr(stats, "element_id", "generic")
+        if element_id == self._element_tint:
+            return
+        self._element_tint = element_id
         color = color_for_damage_type_id(element_id)
         
         tint_color = f"rgba({color.red()}, {color.green()}, {color.blue()}, 60)"
@@ -265,7 +283,12 @@ class OnsiteCharacterCardBase(QFrame):
         point.setX(rect.right())
         return QPointF(self.mapToGlobal(point))
 
+    def invalidate_tooltip(self) -> None:
+        self._tooltip_html = ""
+
     def enterEvent(self, event: object) -> None:
+        if not self._tooltip_html and self._tooltip_args is not None:
+            self._tooltip_html = build_character_stats_tooltip(**self._tooltip_args)  # type: ignore[arg-type]
         if self._tooltip_html:
             element_id = getattr(getattr(self, "_stats", None), "element_id", None)
             show_stained_tooltip(self, self._tooltip_html, element_id=element_id)
@@ -401,12 +424,12 @@ class IdleOnsiteCharacterCard(OnsiteCharacterCardBase):
     def char_id(self) -> str:
         return self._char_id
 
-    def snapshot(self) -> tuple[dict, Stats] | None:
+    def snapshot(self) -> tuple[Mapping[str, object], Stats] | None:
         getter = getattr(self._idle_state, "get_char_data", None)
         if not callable(getter):
             return None
         data = getter(self._char_id)
-        if not isinstance(data, dict) or not data:
+        if not isinstance(data, Mapping) or not data:
             return None
 
         party_level = 1
@@ -418,7 +441,7 @@ class IdleOnsiteCharacterCard(OnsiteCharacterCardBase):
                 party_level = 1
 
         base_stats = data.get("base_stats")
-        saved_base_stats = dict(base_stats) if isinstance(base_stats, dict) else {}
+        saved_base_stats = dict(base_stats) if isinstance(base_stats, Mapping) else {}
 
         try:
             stack_count = max(1, int(data.get("stack", 1)))
@@ -444,47 +467,75 @@ class IdleOnsiteCharacterCard(OnsiteCharacterCardBase):
         )
         return data, stats
 
-    def apply_snapshot(self, data: dict, stats: Stats, *, maxima: dict[str, float]) -> None:
-        stack_count = max(1, int(data.get("stack", 1)))
-        self.set_stack_count(stack_count)
-
-        level = int(getattr(stats, "level", int(data.get("level", 1))))
-        exp = float(data.get("exp", 0.0))
-        next_exp = float(data.get("next_exp", 30.0))
-        hp = float(getattr(stats, "hp", float(data.get("hp", 0.0))))
-        max_hp = float(getattr(stats, "max_hp", float(data.get("max_hp", 1000.0))))
-
-        gain_per_second = 0.0
-        getter = getattr(self._idle_state, "get_exp_gain_per_second", None)
-        if callable(getter):
-            try:
-                gain_per_second = float(getter(self._char_id))
-            except Exception:
-                gain_per_second = 0.0
+    def apply_snapshot(self, data: Mapping[str, object], stats: Stats, *, maxima: dict[str, float]) -> None:
+        self.apply_changes(data, IdleChange.ALL, stats=stats, maxima=maxima)
 
-        exp_format = f"EXP {max(0, int(exp))} / {max(1, int(next_exp))}"
-        if gain_per_second > 0:
-            exp_format = f"{exp_format} +{gain_per_second:.2f}/s"
-
-        self.set_level(level)
-        self.set_hp(current=hp, max_hp=max_hp)
-        self.set_exp(current=exp, max_exp=next_exp, format_text=exp_format)
-
-        show_rebirth = max(1, int(level)) >= 50
-
-        def on_click() -> None:
-            if self._on_rebirth is not None:
-                self._on_rebirth(self._char_id)
-
-        self.set_action_button(label="Rebirth", visible=show_rebirth, on_click=on_click if show_rebirth else None)
+    def apply_changes(
+        self,
+        data: Mapping[str, object],
+        changes: int,
+        *,
+        stats: Stats | None = None,
+        maxima: dict[str, float] | None = None,
+    ) -> None:
+        """Push the fields flagged in `changes` (an `IdleChange` mask) into the widgets.
 
-        stars = getattr(self._plugin, "stars", None) if self._plugin else None
-        display_name = getattr(self._plugin, "display_name", self._char_id) if self._plugin else self._char_id
-        self.set_stats(
-            name=str(display_name),
-            stars=stars,
-            stacks=stack_count,
-            stackable=stack_count > 1,
-            stats=stats,
-            maxima=maxima,
-        )
+        `stats` is the freshly rebuilt Stats when derived stats changed; `maxima` is
+        passed whenever the party-wide stat bar maxima were recomputed.
+        """
+        stack_count = max(1, int(data.get("stack", 1)))
+        if changes & IdleChange.STACK:
+            self.set_stack_count(stack_count)
+
+        level = max(1, int(data.get("level", 1)))
+        if changes & IdleChange.LEVEL:
+            self.set_level(level)
+            show_rebirth = level >= 50
+
+            def on_click() -> None:
+                if self._on_rebirth is not None:
+                    self._on_rebirth(self._char_id)
+
+            self.set_action_button(label="Rebirth", visible=show_rebirth, on_click=on_click if show_rebirth else None)
+
+        if changes & (IdleChange.EXP | IdleChange.LEVEL):
+            exp = float(data.get("exp", 0.0))
+            next_exp = float(data.get("next_exp", 30.0))
+
+            gain_per_second = 0.0
+            getter = getattr(self._idle_state, "get_exp_gain_per_second", None)
+            if callable(getter):
+                try:
+                    gain_per_second = float(getter(self._char_id))
+                except Exception:
+                    gain_per_second = 0.0
+
+            exp_format = f"EXP {max(0, int(exp))} / {max(1, int(next_exp))}"
+            if gain_per_second > 0:
+                exp_format = f"{exp_format} +{gain_per_second:.2f}/s"
+            self.set_exp(current=exp, max_exp=next_exp, format_text=exp_format)
+
+        current = stats if stats is not None else getattr(self, "_stats", None)
+        if stats is not None or changes & IdleChange.HP:
+            max_hp = float(max(1.0, float(data.get("max_hp", 1.0))))
+            ratio = min(1.0, max(0.0, float(data.get("hp", 0.0))) / max_hp)
+            if isinstance(current, Stats):
+                current.hp = max(0, min(current.max_hp, int(round(float(current.max_hp) * ratio))))
+                self.set_hp(current=current.hp, max_hp=current.max_hp)
+                self.invalidate_tooltip()
+            else:
+                self.set_hp(current=max_hp * ratio, max_hp=max_hp)
+
+        if stats is not None:
+            stars = getattr(self._plugin, "stars", None) if self._plugin else None
+            display_name = getattr(self._plugin, "display_name", self._char_id) if self._plugin else self._char_id
+            self.set_stats(
+                name=str(display_name),
+                stars=stars,
+                stacks=stack_count,
+                stackable=stack_count > 1,
+                stats=stats,
+                maxima=maxima if maxima is not None else compute_stat_maxima([stats]),
+            )
+        elif maxima is not None and self._stats_panel is not None:
+            self._stats_panel.set_maxima(maxima)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import time
 import random
 
 from PySide6.QtCore import QPropertyAnimation
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
 from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
 from PySide6.QtWidgets import QFrame
 from PySide6.QtWidgets import QGraphicsOpacityEffect
 from PySide6.QtWidgets import QGridLayout
@@ -19,10 +21,14 @@ from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
 
 from endless_idler.characters.plugins import discover_character_plugins
+from endless_idler.combat.forecast import FightForecaster
+from endless_idler.combat.forecast import FightSetup
 from endless_idler.combat.party_stats import apply_offsite_stat_share
 from endless_idler.combat.party_stats import build_scaled_character_stats
 from endless_idler.combat.stats import Stats
+from endless_idler.idle.session import clear_idle_session
 from endless_idler.progression import record_character_death
+from endless_idler.run_rules import foe_level_for_fight
 from endless_idler.save import (
     BAR_SLOTS,
     DEFAULT_CHARACTER_COST,
@@ -85,6 +91,8 @@ class PartyBuilderWidget(QWidget):
             save=self._save_manager.load() or self._new_run_save(),
             allowed_char_ids=set(self._plugin_by_id),
         )
+        # The party builder owns the characters now, so an idle session left open cannot catch up later.
+        clear_idle_session(self._save)
         self._save_manager.save(self._save)
         self._slots_by_id: dict[str, DropSlot] = {}
         self._shop_open = False
@@ -96,6 +104,7 @@ class PartyBuilderWidget(QWidget):
         self._shop_exp_signature: tuple[tuple[str, ...], tuple[str, ...], int] | None = None
         self._shop_exp_timer: QTimer | None = None
         self._shop_exp_ticks = 0
+        self._shop_exp_last_tick_at: float | None = None
         self._shop_tile: StandbyShopTile | None = None
         self._party_level_tile: StandbyPartyLevelTile | None = None
         self._rewards_plane: RewardsPlane | None = None
@@ -105,6 +114,13 @@ class PartyBuilderWidget(QWidget):
         self._idle_bar: IdleBar | None = None
         self._party_hp_header: PartyHpHeader | None = None
         self._next_fight_info: object | None = None
+        self._fight_forecaster = FightForecaster()
+        # Stop the forecast worker processes with this widget, or at the latest when the app quits.
+        self.destroyed.connect(self._fight_forecaster.shutdown)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._fight_forecaster.shutdown)
+        self._fight_forecast_timer: QTimer | None = None
         self._merge_fx: MergeFxOverlay | None = None
 
         root = QVBoxLayout()
@@ -168,6 +184,11 @@ class PartyBuilderWidget(QWidget):
         finalize_timer.timeout.connect(self._finalize_party_changes)
         self._party_finalize_timer = finalize_timer
 
+        forecast_timer = QTimer(self)
+        forecast_timer.setInterval(250)
+        forecast_timer.timeout.connect(self._poll_fight_forecast)
+        self._fight_forecast_timer = forecast_timer
+
         shop_timer = QTimer(self)
         shop_timer.setInterval(int(max(1, IDLE_TICK_INTERVAL_SECONDS * 1000)))
         shop_timer.timeout.connect(self._shop_exp_tick)
@@ -183,7 +204,9 @@ class PartyBuilderWidget(QWidget):
 
     def showEvent(self, event: object) -> None:
         if self._shop_exp_timer is not None and not self._shop_exp_timer.isActive():
+            self._shop_exp_last_tick_at = None
             self._shop_exp_timer.start()
+        self._refresh_next_fight_info()
         try:
             super().showEvent(event)  # type: ignore[misc]
         except Exception:
@@ -193,6 +216,7 @@ class PartyBuilderWidget(QWidget):
         if self._shop_exp_timer is not None:
             self._shop_exp_timer.stop()
         self._save_shop_exp_state()
+        self._cancel_fight_forecast()
         try:
             super().hideEvent(event)  # type: ignore[misc]
         except Exception:
@@ -735,6 +759,7 @@ class PartyBuilderWidget(QWidget):
         self._save.character_deaths = preserved_deaths
         self._save.idle_exp_bonus_seconds = preserved_bonus
         self._save.idle_exp_penalty_seconds = preserved_penalty
+        clear_idle_session(self._save)
         self._save_manager.save(self._save)
 
         self._set_sell_zones_active(False)
@@ -927,6 +952,7 @@ class PartyBuilderWidget(QWidget):
             self._save.stacks[char_id] = max(1, int(self._save.stacks.get(char_id, 1)))
 
         self._party_dirty = True
+        self._cancel_fight_forecast()
         self._schedule_party_finalize()
 
     def _schedule_party_finalize(self) -> None:
@@ -961,6 +987,7 @@ class PartyBuilderWidget(QWidget):
             self._shop_exp_state = None
             self._shop_exp_signature = None
             self._shop_exp_ticks = 0
+            self._shop_exp_last_tick_at = None
             return
 
         signature = (tuple(onsite), tuple(offsite), int(self._save.party_level))
@@ -983,11 +1010,25 @@ class PartyBuilderWidget(QWidget):
             self._shop_exp_signature = signature
             self._shop_exp_ticks = 0
 
-        self._shop_exp_state.process_tick()
-        self._shop_exp_ticks += 1
+        # Run every tick owed since the last timer callback; a busy event loop can
+        # deliver timeouts late, and batching keeps the shop EXP rate steady.
+        now = time.monotonic()
+        ticks = 1
+        if self._shop_exp_last_tick_at is not None and IDLE_TICK_INTERVAL_SECONDS > 0:
+            ticks = int((now - self._shop_exp_last_tick_at) / IDLE_TICK_INTERVAL_SECONDS)
+            if ticks <= 0:
+                return
+            self._shop_exp_last_tick_at += ticks * IDLE_TICK_INTERVAL_SECONDS
+        else:
+            self._shop_exp_last_tick_at = now
+
+        save_every = int(max(1, round(5.0 / IDLE_TICK_INTERVAL_SECONDS))) if IDLE_TICK_INTERVAL_SECONDS > 0 else 0
+        previous_ticks = self._shop_exp_ticks
+        self._shop_exp_state.process_ticks(ticks)
+        self._shop_exp_ticks += ticks
         self._merge_shop_exp_exports()
 
-        if IDLE_TICK_INTERVAL_SECONDS > 0 and self._shop_exp_ticks % int(max(1, round(5.0 / IDLE_TICK_INTERVAL_SECONDS))) == 0:
+        if save_every and self._shop_exp_ticks // save_every != previous_ticks // save_every:
             self._save_shop_exp_state()
 
     def _merge_shop_exp_exports(self) -> None:
@@ -1005,6 +1046,8 @@ class PartyBuilderWidget(QWidget):
         initial_stats = dict(getattr(self._save, "character_initial_stats", {}) or {})
         initial_stats.update(self._shop_exp_state.export_initial_stats())
         self._save.character_initial_stats = initial_stats
+        # The shop drip has granted EXP for this time; idle must not credit it again.
+        clear_idle_session(self._save)
 
     def _save_shop_exp_state(self) -> None:
         if self._shop_exp_state is None:
@@ -1048,9 +1091,36 @@ class PartyBuilderWidget(QWidget):
         
         party_level = max(1, int(getattr(self._save, "party_level", 1)))
         fight_number = max(1, int(getattr(self._save, "fight_number", 1)))
-        foe_level = max(1, int(party_level * float(fight_number) * 1.3))
+        foe_level = foe_level_for_fight(party_level, fight_number)
         
         self._next_fight_info.set_level(foe_level)
+        self._restart_fight_forecast()
+
+    def _restart_fight_forecast(self) -> None:
+        if self._next_fight_info is None or not self.isVisible():
+            return
+        setup = FightSetup.from_save(self._save)
+        if setup == self._fight_forecaster.setup:
+            return
+        self._fight_forecaster.start(setup)
+        self._next_fight_info.set_forecast(None, pending=bool(setup.onsite))
+        if self._fight_forecast_timer is not None and setup.onsite:
+            self._fight_forecast_timer.start()
+
+    def _cancel_fight_forecast(self) -> None:
+        self._fight_forecaster.cancel()
+        if self._fight_forecast_timer is not None:
+            self._fight_forecast_timer.stop()
+        if self._next_fight_info is not None:
+            self._next_fight_info.set_forecast(None)
+
+    def _poll_fight_forecast(self) -> None:
+        if self._next_fight_info is None:
+            return
+        running = self._fight_forecaster.is_running()
+        self._next_fight_info.set_forecast(self._fight_forecaster.forecast(), pending=running)
+        if not running and self._fight_forecast_timer is not None:
+            self._fight_forecast_timer.stop()
 
     def _refresh_rewards_plane(self) -> None:
         if self._rewards_plane is None:
@@ -1106,6 +1176,7 @@ class PartyBuilderWidget(QWidget):
             return
 
         latest = sanitize_save_characters(save=latest, allowed_char_ids=set(self._plugin_by_id))
+        clear_idle_session(latest)
         self._save_manager.save(latest)
 
         self._save = latest
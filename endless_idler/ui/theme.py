@@ -120,6 +120,12 @@ QLabel#nextFightLevelLabel {
     font-weight: 600;
 }
 
+QLabel#nextFightForecastLabel {
+    color: rgba(160, 220, 255, 220);
+    font-size: 12px;
+    font-weight: 600;
+}
+
 QPushButton#partyRerollButton {
     background-color: rgba(255, 255, 255, 16);
     border: 1px solid rgba(255, 255, 255, 22);
@@ -404,6 +410,28 @@ QPushButton#battleBackButton:hover {
     background-color: rgba(120, 180, 255, 44);
 }
 
+QPushButton#battleSpeedButton,
+QPushButton#battleSkipButton,
+QPushButton#battleReplayButton {
+    background-color: rgba(255, 255, 255, 16);
+    border: 1px solid rgba(255, 255, 255, 22);
+    border-radius: 0px;
+    padding: 8px 12px;
+    color: rgba(255, 255, 255, 235);
+    font-size: 13px;
+}
+
+QPushButton#battleSpeedButton:hover,
+QPushButton#battleSkipButton:hover,
+QPushButton#battleReplayButton:hover {
+    background-color: rgba(120, 180, 255, 44);
+}
+
+QPushButton#battleSkipButton:disabled,
+QPushButton#battleReplayButton:disabled {
+    color: rgba(255, 255, 255, 90);
+}
+
 QLabel#battleTitle {
     color: rgba(255, 255, 255, 240);
     font-size: 18px;
@@ -415,6 +443,11 @@ QLabel#battleStatus {
     font-size: 12px;
 }
 
+QLabel#battleTurnOrder {
+    color: rgba(255, 255, 255, 170);
+    font-size: 12px;
+}
+
 QFrame#battleArena {
     background-color: rgba(10, 14, 26, 140);
     border: 1px solid rgba(255, 255, 255, 18);
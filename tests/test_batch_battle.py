@@ -0,0 +1,125 @@
+"""Statistical checks for the NumPy batch battle kernel against the scalar path."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.batch import BatchBattle
+from endless_idler.combat.batch import sample_damage
+from endless_idler.combat.damage_types import load_damage_type
+from endless_idler.combat.engine import BattleEngine
+from endless_idler.combat.engine import BattleOverEvent
+from endless_idler.combat.sim import build_foes
+from endless_idler.combat.sim import build_party
+from endless_idler.combat.sim import calculate_damage
+from endless_idler.combat.stats import Stats
+
+
+PLUGINS = [
+    CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "carly", "foe_a", "foe_b", "foe_c")
+]
+PARTY_IDS = ["ally", "bubbles", "carly"]
+SCALAR_LINEUPS = 200
+SCALAR_REPEATS = 2
+BATCH_REPEATS = 10
+# Standard errors allowed between batch and scalar means. The seeds are fixed,
+# so this sets the sensitivity of the check rather than a flake rate.
+Z_BOUND = 3.0
+
+
+def make_stats(*, element: str, atk: int, defense: int, dodge: float, crit: float) -> Stats:
+    stats = Stats()
+    stats.damage_type = load_damage_type(element)
+    stats.atk = atk
+    stats.defense = defense
+    stats.dodge_odds = dodge
+    stats.crit_rate = crit
+    return stats
+
+
+def make_lineup(seed: int) -> tuple:
+    rng = random.Random(seed)
+    party = build_party(
+        onsite=PARTY_IDS,
+        party_level=5,
+        stacks={},
+        plugins_by_id={plugin.char_id: plugin for plugin in PLUGINS},
+        rng=rng,
+    )
+    # Foes a few levels up keep the win rate near one half, where it is most sensitive.
+    foes = build_foes(exclude_ids=set(PARTY_IDS), party_level=8, foe_count=3, plugins=PLUGINS, rng=rng)
+    return (party, [], foes), rng
+
+
+def run_scalar(lineup: tuple, rng: random.Random) -> tuple[bool, int, int]:
+    """(victory, steps, foe kills) of one `BattleEngine` fight, steps counted like `BatchBattle`."""
+    party, reserves, foes = lineup
+    engine = BattleEngine(party=party, reserves=reserves, foes=foes, rng=rng)
+    steps = 0
+    while True:
+        steps += 1
+        for event in engine.step():
+            if isinstance(event, BattleOverEvent):
+                return event.victory, steps, event.foe_kills
+
+
+def assert_same_mean(batch, scalar, *, z: float = Z_BOUND) -> None:
+    """Two-sample z check: the means differ by at most `z` standard errors.
+
+    For 0/1 outcomes the sample variance is p(1 - p), so this is the normal
+    (Wald) interval for a difference of two binomial proportions.
+    """
+    batch = np.asarray(batch, dtype=float)
+    scalar = np.asarray(scalar, dtype=float)
+    stderr = np.sqrt(batch.var() / batch.size + scalar.var() / scalar.size)
+    assert abs(batch.mean() - scalar.mean()) <= z * stderr
+
+
+def test_vectorized_damage_matches_calculate_damage():
+    attacker = make_stats(element="fire", atk=300, defense=50, dodge=0.05, crit=0.25)
+    target = make_stats(element="ice", atk=200, defense=120, dodge=0.15, crit=0.05)
+    samples = 20_000
+
+    rng = random.Random(1)
+    scalar = [calculate_damage(attacker, target, rng) for _ in range(samples)]
+    scalar_damage = np.array([damage for damage, _, _ in scalar])
+    scalar_dodged = np.array([dodged for _, _, dodged in scalar])
+    scalar_crit = np.array([crit for _, crit, _ in scalar])
+
+    damage, crit, dodged = sample_damage(attacker, target, samples=samples, rng=np.random.default_rng(1))
+
+    assert abs(dodged.mean() - scalar_dodged.mean()) < 0.015
+    assert abs(crit[~dodged].mean() - scalar_crit[~scalar_dodged].mean()) < 0.02
+    assert damage[~dodged].mean() == pytest.approx(scalar_damage[~scalar_dodged].mean(), rel=0.02)
+    assert damage[~dodged].min() >= scalar_damage[~scalar_dodged].min() - 1
+    assert damage[~dodged].max() <= scalar_damage[~scalar_dodged].max() + 1
+
+
+def test_batch_outcomes_match_battle_engine():
+    """Win rate, fight length and foe kills agree with the scalar engine within Z_BOUND errors.
+
+    With 400 scalar fights and 2000 batched ones at a win rate near 0.45, the
+    win-rate bound is about ±8pp; fight length is held to about 1% and kills to
+    about 0.2.
+    """
+    lineups = [make_lineup(seed)[0] for seed in range(SCALAR_LINEUPS)]
+    scalar = np.array(
+        [
+            run_scalar(make_lineup(seed)[0], random.Random(seed * SCALAR_REPEATS + repeat))
+            for seed in range(SCALAR_LINEUPS)
+            for repeat in range(SCALAR_REPEATS)
+        ],
+        dtype=float,
+    )
+
+    outcome = BatchBattle([lineup for lineup in lineups for _ in range(BATCH_REPEATS)], seed=3).run()
+    assert outcome.battles == SCALAR_LINEUPS * BATCH_REPEATS
+    assert np.all(outcome.victory | outcome.defeat)
+    assert 0.2 < outcome.win_rate < 0.8
+    assert_same_mean(outcome.victory, scalar[:, 0])
+    assert_same_mean(outcome.steps, scalar[:, 1])
+    assert_same_mean(outcome.foe_kills, scalar[:, 2])
@@ -0,0 +1,81 @@
+"""Tests for the headless battle engine."""
+
+import random
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.engine import BattleEngine
+from endless_idler.combat.engine import BattleOverEvent
+from endless_idler.combat.engine import FellEvent
+from endless_idler.combat.engine import HealEvent
+from endless_idler.combat.engine import HitEvent
+from endless_idler.combat.sim import build_foes
+from endless_idler.combat.sim import build_party
+from endless_idler.passives.registry import load_passive
+
+
+PLUGINS = [
+    CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "foe_a", "foe_b", "foe_c")
+]
+
+
+def run_battle(seed: int) -> tuple[list[object], BattleOverEvent | None]:
+    rng = random.Random(seed)
+    plugins_by_id = {plugin.char_id: plugin for plugin in PLUGINS}
+    party = build_party(
+        onsite=["ally", "bubbles"],
+        party_level=5,
+        stacks={},
+        plugins_by_id=plugins_by_id,
+        rng=rng,
+    )
+    foes = build_foes(
+        exclude_ids={"ally", "bubbles"},
+        party_level=3,
+        foe_count=3,
+        plugins=PLUGINS,
+        rng=rng,
+    )
+    engine = BattleEngine(party=party, reserves=[], foes=foes, rng=rng)
+    events: list[object] = []
+    result = None
+    for _ in range(100_000):
+        step_events = engine.step()
+        events.extend(step_events)
+        if engine.over:
+            result = step_events[-1]
+            break
+    return events, result
+
+
+def test_battle_runs_headless_to_completion():
+    events, result = run_battle(seed=11)
+    assert isinstance(result, BattleOverEvent)
+    assert result.victory != result.defeat
+    assert any(isinstance(event, HitEvent) for event in events)
+    fell = [event for event in events if isinstance(event, FellEvent)]
+    assert result.foe_kills == sum(1 for event in fell if event.side == "foes")
+
+
+def test_battle_is_deterministic_for_a_seed():
+    first_events, first = run_battle(seed=5)
+    second_events, second = run_battle(seed=5)
+    assert first == second
+    assert [type(event) for event in first_events] == [type(event) for event in second_events]
+
+
+def test_turn_start_passive_heals_become_events_for_their_targets():
+    rng = random.Random(3)
+    plugins_by_id = {plugin.char_id: plugin for plugin in PLUGINS}
+    party = build_party(onsite=["ally", "bubbles"], party_level=5, stacks={}, plugins_by_id=plugins_by_id, rng=rng)
+    reserves = build_party(onsite=["foe_c"], party_level=5, stacks={}, plugins_by_id=plugins_by_id, rng=rng)
+    reserves[0].stats.set_passives([load_passive("lady_light_radiant_aegis")])
+    foes = build_foes(exclude_ids={"ally", "bubbles", "foe_c"}, party_level=3, foe_count=2, plugins=PLUGINS, rng=rng)
+    wounded = party[1]
+    wounded.stats.hp = wounded.stats.max_hp - 10
+
+    engine = BattleEngine(party=party, reserves=reserves, foes=foes, rng=rng)
+    heals = [event for event in engine.step() if isinstance(event, HealEvent) and event.source is None]
+
+    assert len(heals) == 1
+    assert heals[0].target is wounded and heals[0].amount == 10
@@ -0,0 +1,67 @@
+"""Tests for recorded battle replays."""
+
+from dataclasses import replace
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.engine import BattleOverEvent
+from endless_idler.combat.forecast import FightSetup
+from endless_idler.combat.replay import KIND_HIT
+from endless_idler.combat.replay import KIND_OVER
+from endless_idler.combat.replay import ReplayLog
+from endless_idler.combat.replay import ReplayPlayer
+from endless_idler.combat.replay import ReplayStore
+from endless_idler.combat.replay import record_battle
+from endless_idler.combat.replay import verify_replay
+
+
+PLUGINS = [
+    CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "foe_a", "foe_b", "foe_c")
+]
+
+SETUP = FightSetup(
+    onsite=("ally", "bubbles"),
+    offsite=(),
+    party_level=4,
+    fight_number=1,
+    stacks={"ally": 2},
+)
+
+
+def test_replay_log_round_trips_and_verifies():
+    log = record_battle(SETUP, 1234, plugins=PLUGINS)
+    assert log.result is not None and log.result.kind == KIND_OVER
+    assert any(record.kind == KIND_HIT for record in log)
+
+    restored = ReplayLog.from_bytes(log.to_bytes())
+    assert restored == log
+    assert verify_replay(restored, plugins=PLUGINS)
+
+
+def test_verify_replay_rejects_a_tampered_log():
+    log = record_battle(SETUP, 99, plugins=PLUGINS)
+    assert not verify_replay(replace(log, seed=100), plugins=PLUGINS)
+    assert not verify_replay(replace(log, records=log.records[:-16]), plugins=PLUGINS)
+
+
+def test_player_replays_the_recorded_outcome_without_rules():
+    log = record_battle(SETUP, 7, plugins=PLUGINS)
+    party, reserves, foes = log.build_battle(plugins=PLUGINS)
+    player = ReplayPlayer(log, party=party, reserves=reserves, foes=foes)
+
+    result = player.run()
+    assert isinstance(result, BattleOverEvent)
+    assert player.over
+    assert result.foe_kills == log.result.amount
+    assert result.victory == (not any(c.stats.hp > 0 for c in foes))
+
+
+def test_replay_store_keeps_a_bounded_ring(tmp_path):
+    store = ReplayStore(tmp_path / "idlesave.replays", capacity=3)
+    logs = [record_battle(SETUP, seed, plugins=PLUGINS, max_steps=40) for seed in range(5)]
+    for log in logs:
+        store.append(log)
+
+    assert store.load() == logs[-3:]
+    assert store.latest() == logs[-1]
+    assert ReplayStore(tmp_path / "missing.replays").load() == []
@@ -0,0 +1,55 @@
+"""Tests for damage-type flyweights, element codes and the type matrix."""
+
+import copy
+import pickle
+
+from endless_idler.combat.damage_types import ELEMENT_IDS
+from endless_idler.combat.damage_types import FIRE
+from endless_idler.combat.damage_types import GENERIC
+from endless_idler.combat.damage_types import ICE
+from endless_idler.combat.damage_types import TYPE_MULTIPLIERS
+from endless_idler.combat.damage_types import Fire
+from endless_idler.combat.damage_types import element_code
+from endless_idler.combat.damage_types import load_damage_type
+from endless_idler.combat.damage_types import type_multiplier
+from endless_idler.combat.stats import Stats
+
+
+def test_matrix_matches_the_type_chart():
+    assert TYPE_MULTIPLIERS[element_code("ice")][element_code("fire")] == 1.25
+    assert TYPE_MULTIPLIERS[element_code("fire")][element_code("fire")] == 0.75
+    assert TYPE_MULTIPLIERS[element_code("wind")][element_code("generic")] == 0.75
+    assert TYPE_MULTIPLIERS[element_code("dark")][element_code("fire")] == 1.0
+    for attacker in ELEMENT_IDS:
+        for defender in ELEMENT_IDS:
+            assert type_multiplier(attacker.upper(), f" {defender} ") == TYPE_MULTIPLIERS[
+                element_code(attacker)
+            ][element_code(defender)]
+
+
+def test_stats_resolve_the_element_when_the_damage_type_is_assigned():
+    stats = Stats()
+    assert stats.element_id == "generic"
+    assert stats.element_code == element_code("generic")
+
+    stats.damage_type = load_damage_type("Lightning")
+    assert stats.element_id == "lightning"
+    assert stats.element_code == element_code("lightning")
+
+    stats.damage_type = Fire()
+    assert stats.element_code == element_code("fire")
+    assert element_code("no-such-type") == element_code("generic")
+
+
+def test_damage_types_are_shared_instances():
+    assert Fire() is FIRE
+    assert load_damage_type("Fire") is FIRE
+    assert load_damage_type("fire / ice") is FIRE
+    assert load_damage_type(None) is GENERIC
+    assert copy.deepcopy(FIRE) is FIRE
+    assert pickle.loads(pickle.dumps(FIRE)) is FIRE
+
+    stats = Stats()
+    assert stats.damage_type is GENERIC
+    stats.damage_type = "Ice"
+    assert stats.damage_type is ICE
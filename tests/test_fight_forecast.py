@@ -0,0 +1,120 @@
+"""Tests for the next-fight Monte Carlo forecast."""
+
+import time
+
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat import forecast as forecast_module
+from endless_idler.combat.forecast import FightForecaster
+from endless_idler.combat.forecast import FightSetup
+from endless_idler.combat.forecast import party_hp_loss
+from endless_idler.combat.forecast import simulate_fights
+from endless_idler.run_rules import calculate_battle_gold
+
+
+PLUGINS = [
+    CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "foe_a", "foe_b", "foe_c")
+]
+
+SETUP = FightSetup(
+    onsite=("ally", "bubbles"),
+    offsite=(),
+    party_level=4,
+    fight_number=1,
+    tokens=10,
+    party_hp_current=100,
+    party_hp_max=100,
+)
+
+
+def test_simulate_fights_is_deterministic_per_seed():
+    first = simulate_fights(SETUP, [1, 2, 3, 4], plugins=PLUGINS)
+    second = simulate_fights(SETUP, [1, 2, 3, 4], plugins=PLUGINS)
+    assert first == second
+    assert first.fights == 4
+    assert 0.0 <= first.win_rate <= 1.0
+
+
+def test_battle_gold_and_hp_loss_follow_run_rules():
+    assert calculate_battle_gold(0, victory=True, tokens=50, winstreak=0) == 0
+    assert calculate_battle_gold(5, victory=True, tokens=10, winstreak=0) == 7
+    assert calculate_battle_gold(5, victory=False, tokens=10, winstreak=0) == 4
+    assert party_hp_loss(SETUP, victory=True) == 0
+    assert party_hp_loss(SETUP, victory=False) == 13
+
+
+def wait_until_done(forecaster: FightForecaster, *, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while forecaster.is_running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not forecaster.is_running()
+
+
+def test_unresolved_fights_do_not_count_as_losses(monkeypatch):
+    """Fights that hit the step cap are reported apart and leave the rates alone."""
+    resolved = simulate_fights(SETUP, [1, 2, 3, 4], plugins=PLUGINS)
+    assert resolved.unresolved == 0
+
+    # One step is never enough to finish a fight, so every one of these stalls.
+    monkeypatch.setattr(forecast_module, "FORECAST_MAX_STEPS", 1)
+    stalled = simulate_fights(SETUP, [5, 6, 7], plugins=PLUGINS)
+    assert (stalled.fights, stalled.unresolved, stalled.wins, stalled.gold_total) == (0, 3, 0, 0)
+    assert stalled.win_rate == 0.0 and stalled.expected_party_hp_loss == 0.0
+
+    merged = resolved.merged(stalled)
+    assert (merged.fights, merged.unresolved) == (4, 3)
+    assert merged.win_rate == resolved.win_rate
+    assert merged.expected_gold == resolved.expected_gold
+    assert merged.expected_party_hp_loss == resolved.expected_party_hp_loss
+
+
+def test_forecaster_merges_batches_and_restarts():
+    harder = replace(SETUP, fight_number=40)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        forecaster = FightForecaster(fights=12, batch_fights=4, executor_factory=lambda: executor)
+        forecaster.start(SETUP)
+        wait_until_done(forecaster)
+        forecast = forecaster.forecast()
+        assert forecast is not None and forecast.fights == 12
+
+        # Restarting on another setup drops the old results instead of merging into them.
+        forecaster.start(harder)
+        assert forecaster.setup == harder
+        wait_until_done(forecaster)
+        forecast = forecaster.forecast()
+        assert forecast is not None and forecast.fights + forecast.unresolved == 12
+        assert forecast.wins == 0
+        assert forecast.expected_party_hp_loss == party_hp_loss(harder, victory=False)
+
+        forecaster.cancel()
+        assert forecaster.forecast() is None
+        assert forecaster.setup is None
+
+
+def test_forecaster_shutdown_stops_the_pool():
+    executors: list[ThreadPoolExecutor] = []
+
+    def make_executor() -> ThreadPoolExecutor:
+        executors.append(ThreadPoolExecutor(max_workers=1))
+        return executors[-1]
+
+    forecaster = FightForecaster(fights=4, batch_fights=4, executor_factory=make_executor)
+    forecaster.start(SETUP)
+    wait_until_done(forecaster)
+    forecaster.shutdown()
+    forecaster.shutdown()
+
+    assert forecaster.setup is None and not forecaster.is_running()
+    with pytest.raises(RuntimeError):
+        executors[0].submit(int)
+
+    # A later forecast gets a fresh pool.
+    forecaster.start(SETUP)
+    wait_until_done(forecaster)
+    assert len(executors) == 2
+    forecaster.shutdown()
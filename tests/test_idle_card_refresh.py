@@ -0,0 +1,126 @@
+"""Tests for the idle screen's incremental card refresh, driven without Qt."""
+
+import random
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.combat.party_stats import build_scaled_character_stats
+from endless_idler.idle.card_refresh import IdleCardRefresher
+from endless_idler.idle.state import IdleChange
+from endless_idler.idle.state import IdleSimulation
+from endless_idler.idle.worker import IdleSimulationWorker
+
+
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "reserve")
+}
+
+
+class FakeOnsiteCard:
+    def __init__(self, worker: IdleSimulationWorker, char_id: str) -> None:
+        self._worker = worker
+        self.char_id = char_id
+        self.applied: list[tuple[IdleChange, bool, bool]] = []
+
+    def snapshot(self):
+        data = self._worker.get_char_data(self.char_id)
+        stats = build_scaled_character_stats(
+            plugin=PLUGINS[self.char_id],
+            party_level=self._worker.get_party_level(),
+            stars=3,
+            stacks=int(data["stack"]),
+            progress={"level": int(data["level"]), "exp": float(data["exp"])},
+            saved_base_stats=dict(data["base_stats"]),
+        )
+        return data, stats
+
+    def apply_changes(self, data, changes, *, stats=None, maxima=None):
+        self.applied.append((IdleChange(changes), stats is not None, maxima is not None))
+
+
+class FakeOffsiteCard:
+    def __init__(self, char_id: str) -> None:
+        self.char_id = char_id
+        self.updates: list[IdleChange] = []
+
+    def update_display(self, changes=IdleChange.ALL):
+        self.updates.append(IdleChange(changes))
+
+
+def make_screen():
+    state = IdleSimulation(
+        char_ids=["ally", "bubbles"],
+        offsite_ids=["reserve"],
+        party_level=2,
+        stacks={},
+        plugins_by_id=PLUGINS,
+        rng=random.Random(5),
+        shared_exp_percentage=20,
+        started_at=0.0,
+        clock=lambda: 0.0,
+    )
+    worker = IdleSimulationWorker(state)
+    maxima_calls: list[int] = []
+
+    def stat_maxima(stats_list):
+        maxima_calls.append(len(stats_list))
+        return {"atk": 1.0}
+
+    refresher = IdleCardRefresher(
+        plugins_by_id=PLUGINS,
+        party_level=2,
+        reserve_ids=["reserve"],
+        stat_maxima=stat_maxima,
+    )
+    onsite = [FakeOnsiteCard(worker, "ally"), FakeOnsiteCard(worker, "bubbles")]
+    offsite = [FakeOffsiteCard("reserve")]
+    return worker, refresher, onsite, offsite, maxima_calls
+
+
+def test_first_refresh_builds_every_card_once():
+    worker, refresher, onsite, offsite, maxima_calls = make_screen()
+
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+
+    assert set(refresher.card_stats) == {"ally", "bubbles"}
+    assert maxima_calls == [2]
+    for card in onsite:
+        assert card.applied == [(IdleChange.ALL, True, True)]
+    assert offsite[0].updates == [IdleChange.ALL]
+
+
+def test_later_refreshes_push_only_changed_fields():
+    worker, refresher, onsite, offsite, maxima_calls = make_screen()
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+    for card in onsite:
+        card.applied.clear()
+
+    # Same snapshot again: nothing to do.
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+    assert all(not card.applied for card in onsite)
+
+    worker._last_step_at -= 0.5
+    worker.step()
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+    assert maxima_calls == [2]
+    for card in onsite:
+        assert len(card.applied) == 1
+        changes, rebuilt, new_maxima = card.applied[0]
+        assert changes & IdleChange.EXP
+        assert not changes & IdleChange.LEVEL
+        assert not rebuilt and not new_maxima
+
+
+def test_reserve_level_up_rebuilds_onsite_stats():
+    worker, refresher, onsite, offsite, maxima_calls = make_screen()
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+    before = dict(refresher.card_stats)
+
+    with worker._lock:
+        worker._state.grant_exp("reserve", 10_000.0)
+        worker._publish()
+    refresher.refresh(worker.snapshot(), onsite_cards=onsite, offsite_cards=offsite)
+
+    assert maxima_calls == [2, 2]
+    assert all(refresher.card_stats[char_id] is not before[char_id] for char_id in before)
+    assert offsite[0].updates[-1] & IdleChange.LEVEL
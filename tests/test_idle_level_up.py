@@ -0,0 +1,50 @@
+"""Tests for bulk idle level-ups."""
+
+import random
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.idle.state import IdleSimulation
+
+
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "reserve")
+}
+
+
+def make_state() -> IdleSimulation:
+    return IdleSimulation(
+        char_ids=["ally"],
+        offsite_ids=["reserve"],
+        party_level=1,
+        stacks={},
+        plugins_by_id=PLUGINS,
+        rng=random.Random(11),
+        started_at=1000.0,
+    )
+
+
+def test_grant_exp_spans_levels_and_keeps_leftover():
+    """A large grant applies every covered level and carries the remainder."""
+    state = make_state()
+    before = dict(state.get_char_data("ally")["base_stats"])
+
+    gained = state.grant_exp("ally", 50_000.0)
+
+    data = state.get_char_data("ally")
+    assert gained > 5
+    assert data["level"] == 1 + gained
+    assert 0.0 < data["exp"] < data["next_exp"]
+    assert data["hp"] == data["max_hp"]
+    assert data["base_stats"]["max_hp"] == before["max_hp"] + 10.0 * gained
+    assert sum(data["base_stats"][key] > before[key] for key in ("atk", "defense", "regain")) >= 1
+
+
+def test_grant_exp_below_next_level_only_adds_exp():
+    state = make_state()
+    next_exp = state.get_char_data("ally")["next_exp"]
+
+    assert state.grant_exp("ally", next_exp / 2) == 0
+    assert state.get_char_data("ally")["level"] == 1
+    assert state.get_char_data("ally")["exp"] == next_exp / 2
+    assert state.grant_exp("missing", 10.0) == 0
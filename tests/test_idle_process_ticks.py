@@ -0,0 +1,189 @@
+"""Tests for batched idle ticking.
+
+`IdleSimulation.process_ticks(n)` must leave the idle state exactly as `n` calls
+of `process_tick` would, for the same RNG seed and tick timestamps. The closed
+form `fast_forward_ticks(n)` must land on the same levels, EXP and HP.
+"""
+
+import random
+
+import pytest
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.idle.state import IDLE_TICK_INTERVAL_SECONDS
+from endless_idler.idle.state import IdleSimulation
+
+
+START = 1000.0
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "luna", "reserve_a", "reserve_b")
+}
+
+
+def make_state(*, risk_reward_level: int, shared_exp_percentage: int, cls: type = IdleSimulation) -> IdleSimulation:
+    state = cls(
+        char_ids=["ally", "bubbles", "luna"],
+        offsite_ids=["reserve_a", "reserve_b"],
+        party_level=3,
+        stacks={"ally": 2},
+        plugins_by_id=PLUGINS,
+        rng=random.Random(7),
+        progress_by_id={
+            "bubbles": {"death_exp_debuff_stacks": 3, "death_exp_debuff_until": START + 50.03},
+            "reserve_a": {"level": 48, "exp": 10, "death_exp_debuff_stacks": 2, "death_exp_debuff_until": START + 100.0},
+        },
+        exp_bonus_seconds=30.0,
+        exp_penalty_seconds=5.05,
+        shared_exp_percentage=shared_exp_percentage,
+        risk_reward_level=risk_reward_level,
+        started_at=START,
+    )
+    # Tick k is stamped START + k * dt, matching process_ticks(start_time=START).
+    state._time = lambda: START + state._tick_count * IDLE_TICK_INTERVAL_SECONDS
+    return state
+
+
+def snapshot(state: IdleSimulation) -> tuple:
+    return (
+        state.export_progress(),
+        state.export_character_stats(),
+        state.export_run_buff_seconds(),
+        {char_id: (state.get_char_data(char_id)["hp"], state.get_char_data(char_id)["max_hp"]) for char_id in PLUGINS},
+        state._rng.getstate(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("risk_reward_level", "shared_exp_percentage"),
+    [(0, 0), (5, 40), (150, 10), (0, 95)],
+)
+def test_process_ticks_matches_repeated_process_tick(risk_reward_level, shared_exp_percentage):
+    """Batched ticks are bit-identical to single ticks, including across a rebirth."""
+    single = make_state(risk_reward_level=risk_reward_level, shared_exp_percentage=shared_exp_percentage)
+    batched = make_state(risk_reward_level=risk_reward_level, shared_exp_percentage=shared_exp_percentage)
+
+    for _ in range(6000):
+        single.process_tick()
+    single.rebirth_character("reserve_a")
+    for _ in range(6000):
+        single.process_tick()
+
+    batched.process_ticks(6000, start_time=START)
+    batched.rebirth_character("reserve_a")
+    batched.process_ticks(6000, start_time=START + 6000 * IDLE_TICK_INTERVAL_SECONDS)
+
+    assert snapshot(batched) == snapshot(single)
+
+
+def outcome(state: IdleSimulation) -> dict[str, tuple[int, float, float, float]]:
+    progress = state.export_progress()
+    return {
+        char_id: (
+            progress[char_id]["level"],
+            progress[char_id]["exp"],
+            state.get_char_data(char_id)["hp"],
+            state.get_char_data(char_id)["max_hp"],
+        )
+        for char_id in PLUGINS
+    }
+
+
+def assert_same_outcome(fast: IdleSimulation, ticked: IdleSimulation) -> None:
+    expected = outcome(ticked)
+    for char_id, (level, exp, hp, max_hp) in outcome(fast).items():
+        assert level == expected[char_id][0], char_id
+        assert exp == pytest.approx(expected[char_id][1], rel=1e-9, abs=1e-6), char_id
+        assert hp == pytest.approx(expected[char_id][2], abs=1e-6), char_id
+        assert max_hp == expected[char_id][3], char_id
+    assert fast.export_run_buff_seconds() == pytest.approx(ticked.export_run_buff_seconds())
+    assert fast._tick_count == ticked._tick_count
+
+
+@pytest.mark.parametrize(
+    ("risk_reward_level", "shared_exp_percentage"),
+    [(0, 0), (5, 40), (150, 10), (0, 95)],
+)
+def test_fast_forward_matches_process_ticks(risk_reward_level, shared_exp_percentage):
+    """The closed form crosses level-ups, buff and debuff expiries on the same ticks."""
+    ticked = make_state(risk_reward_level=risk_reward_level, shared_exp_percentage=shared_exp_percentage)
+    fast = make_state(risk_reward_level=risk_reward_level, shared_exp_percentage=shared_exp_percentage)
+
+    ticked.process_ticks(6000, start_time=START)
+    assert fast.fast_forward_ticks(6000, start_time=START) == 6000
+
+    assert_same_outcome(fast, ticked)
+
+
+def test_fast_forward_drains_hp_to_the_floor():
+    """Risk-reward drain pins onsite HP at zero in both paths; reserves stay full."""
+    ticked = make_state(risk_reward_level=150, shared_exp_percentage=10)
+    fast = make_state(risk_reward_level=150, shared_exp_percentage=10)
+
+    ticked.process_ticks(6000, start_time=START)
+    fast.fast_forward_ticks(6000, start_time=START)
+
+    assert_same_outcome(fast, ticked)
+    for char_id in ("ally", "bubbles", "luna"):
+        assert fast.get_char_data(char_id)["hp"] == 0.0
+    for char_id in ("reserve_a", "reserve_b"):
+        data = fast.get_char_data(char_id)
+        assert data["hp"] == data["max_hp"]
+
+
+def test_fast_forward_matches_process_ticks_over_a_day():
+    """A one-day offline gap under risk-reward drain agrees with ticking through it."""
+    ticks = int(24 * 60 * 60 / IDLE_TICK_INTERVAL_SECONDS)
+    ticked = make_state(risk_reward_level=5, shared_exp_percentage=40)
+    fast = make_state(risk_reward_level=5, shared_exp_percentage=40)
+
+    ticked.process_ticks(ticks, start_time=START)
+    fast.fast_forward(ticks * IDLE_TICK_INTERVAL_SECONDS, start_time=START)
+
+    assert_same_outcome(fast, ticked)
+
+
+def test_process_ticks_emits_once():
+    """Only the final tick count is emitted."""
+    pytest.importorskip("PySide6")
+    from endless_idler.ui.idle.idle_state import IdleGameState
+
+    state = make_state(risk_reward_level=0, shared_exp_percentage=0, cls=IdleGameState)
+    emitted: list[int] = []
+    state.tick_update.connect(emitted.append)
+
+    assert state.process_ticks(250, start_time=START) == 250
+    assert emitted == [250]
+
+
+def test_death_debuff_expires_on_simulated_clock():
+    """Debuffs expire at the first tick stamped at or after `until`, not by wall-clock time."""
+    state = make_state(risk_reward_level=0, shared_exp_percentage=0)
+    state._time = lambda: 0.0
+
+    def debuff_ratio() -> float:
+        return state.get_exp_gain_per_tick("bubbles") / state.get_exp_gain_per_tick("ally")
+
+    assert debuff_ratio() == pytest.approx(0.85)
+    state.process_ticks(500, start_time=START)
+    assert state.export_progress()["bubbles"]["death_exp_debuff_stacks"] == 3
+    assert debuff_ratio() == pytest.approx(0.85)
+
+    state.process_ticks(1, start_time=START + 500 * IDLE_TICK_INTERVAL_SECONDS)
+    assert state.export_progress()["bubbles"]["death_exp_debuff_stacks"] == 0
+    assert debuff_ratio() == 1.0
+
+
+def test_gain_rate_table_rebuilds_only_on_change():
+    """Gain rates are cached until the shared %, a run buff or a debuff changes."""
+    state = make_state(risk_reward_level=0, shared_exp_percentage=20)
+    rates = state._gain_rate_table()
+    reserve_gain = state.get_exp_gain_per_tick("reserve_b")
+    assert state._gain_rate_table() is rates
+
+    state.set_shared_exp_percentage(60)
+    assert state.get_exp_gain_per_tick("reserve_b") > reserve_gain
+
+    ally_gain = state.get_exp_gain_per_tick("ally")
+    state.process_ticks(310, start_time=START)
+    assert state.get_exp_gain_per_tick("ally") == pytest.approx(ally_gain / 2.0)
@@ -0,0 +1,47 @@
+"""Tests for the headless idle projection tool."""
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.save import RunSave
+from endless_idler.tools.idle_project import project_levels
+
+
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "reserve")
+}
+
+
+def make_save() -> RunSave:
+    return RunSave(
+        onsite=["ally", "bubbles", None, None],
+        offsite=["reserve", None, None, None, None, None],
+        character_progress={"bubbles": {"level": 50}, "reserve": {"level": 45}},
+    )
+
+
+def test_project_levels_reports_each_character():
+    """Onsite characters level on their own; offsite ones need a shared EXP pool."""
+    projections = {
+        item.char_id: item
+        for item in project_levels(make_save(), plugins_by_id=PLUGINS, max_seconds=24 * 60 * 60)
+    }
+    assert [projections[char_id].placement for char_id in ("ally", "bubbles", "reserve")] == [
+        "onsite",
+        "onsite",
+        "offsite",
+    ]
+    assert projections["bubbles"].seconds == 0.0
+    assert projections["ally"].seconds is not None and projections["ally"].seconds > 0.0
+    assert projections["reserve"].seconds is None
+
+    shared = {
+        item.char_id: item
+        for item in project_levels(
+            make_save(),
+            plugins_by_id=PLUGINS,
+            shared_exp_percentage=50,
+            max_seconds=24 * 60 * 60,
+        )
+    }
+    assert shared["reserve"].seconds is not None
+    assert shared["ally"].seconds > projections["ally"].seconds
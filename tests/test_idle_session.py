@@ -0,0 +1,67 @@
+"""Tests for the idle-session stamp that drives offline catch-up."""
+
+import random
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.idle.session import clear_idle_session
+from endless_idler.idle.session import idle_resume_at
+from endless_idler.idle.session import stamp_idle_session
+from endless_idler.idle.state import IdleSimulation
+from endless_idler.save import RunSave
+from endless_idler.save import SaveManager
+
+
+ONSITE = ["ally", "bubbles"]
+OFFSITE = ["reserve"]
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in (*ONSITE, *OFFSITE)
+}
+
+
+def test_quit_on_idle_then_party_builder_then_idle_grants_no_catch_up(tmp_path):
+    """Time spent in the party builder is not credited again when idle is re-entered."""
+    manager = SaveManager(tmp_path / "save.json")
+
+    # The idle screen autosaves at t=1000, then the app is closed without pressing Back.
+    save = RunSave(onsite=[*ONSITE, None, None], offsite=[*OFFSITE])
+    stamp_idle_session(save, last_tick_at=1000.0, onsite=ONSITE, offsite=OFFSITE)
+    manager.save(save)
+
+    # Straight back into idle, the closed-app time is caught up.
+    loaded = manager.load()
+    assert loaded.idle_last_tick_onsite == ONSITE and loaded.idle_last_tick_offsite == OFFSITE
+    assert idle_resume_at(loaded, onsite=ONSITE, offsite=OFFSITE, now=2000.0) == 1000.0
+
+    # Instead, the party builder loads the save and its shop drip grants EXP.
+    clear_idle_session(loaded)
+    drip = IdleSimulation(
+        char_ids=ONSITE,
+        offsite_ids=OFFSITE,
+        party_level=1,
+        stacks={},
+        plugins_by_id=PLUGINS,
+        rng=random.Random(1),
+        progress_by_id=dict(loaded.character_progress),
+        started_at=2000.0,
+        clock=lambda: 2000.0,
+    )
+    drip.process_ticks(300, start_time=2000.0)
+    loaded.character_progress = drip.export_progress()
+    manager.save(loaded)
+
+    # Re-entering idle later resumes from now: the builder's time was already paid out.
+    reentered = manager.load()
+    assert reentered.idle_last_tick_at == 0.0
+    assert idle_resume_at(reentered, onsite=ONSITE, offsite=OFFSITE, now=5000.0) == 5000.0
+
+
+def test_catch_up_only_applies_to_the_stamped_party():
+    save = RunSave()
+    stamp_idle_session(save, last_tick_at=1000.0, onsite=ONSITE, offsite=OFFSITE)
+
+    assert idle_resume_at(save, onsite=ONSITE, offsite=OFFSITE, now=4000.0) == 1000.0
+    assert idle_resume_at(save, onsite=ONSITE, offsite=[], now=4000.0) == 4000.0
+    assert idle_resume_at(save, onsite=["bubbles", "ally"], offsite=OFFSITE, now=4000.0) == 4000.0
+    # A stamp from the future (clock change) is ignored too.
+    assert idle_resume_at(save, onsite=ONSITE, offsite=OFFSITE, now=500.0) == 500.0
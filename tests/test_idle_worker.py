@@ -0,0 +1,85 @@
+"""Tests for the background idle simulation worker and its snapshots."""
+
+import time
+import random
+import dataclasses
+
+import pytest
+
+from endless_idler.characters.plugins import CharacterPlugin
+from endless_idler.idle.state import IdleChange
+from endless_idler.idle.state import IdleSimulation
+from endless_idler.idle.worker import IdleSimulationWorker
+
+
+PLUGINS = {
+    char_id: CharacterPlugin(char_id=char_id, display_name=char_id, stars=3)
+    for char_id in ("ally", "bubbles", "reserve")
+}
+
+
+def make_worker(**kwargs: object) -> IdleSimulationWorker:
+    state = IdleSimulation(
+        char_ids=["ally", "bubbles"],
+        offsite_ids=["reserve"],
+        party_level=2,
+        stacks={},
+        plugins_by_id=PLUGINS,
+        rng=random.Random(3),
+        shared_exp_percentage=30,
+        started_at=1000.0,
+        clock=lambda: 1000.0,
+    )
+    return IdleSimulationWorker(state, **kwargs)  # type: ignore[arg-type]
+
+
+def test_snapshots_are_immutable_and_report_changes():
+    """Each publish yields a new frozen snapshot; changes are tracked by serial."""
+    worker = make_worker()
+    first = worker.snapshot()
+    assert first.changes_since(0) == {char_id: IdleChange.ALL for char_id in PLUGINS}
+
+    worker._last_step_at -= 1.0
+    assert worker.step() == 10
+
+    second = worker.snapshot()
+    assert second is not first
+    assert second.tick_count == 10
+    assert second.get_char_data("ally")["exp"] > first.get_char_data("ally")["exp"]
+    assert second.changes_since(first.serial)["ally"] & IdleChange.EXP
+    assert second.changes_since(second.serial) == {}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        second.get_char_data("ally").exp = 0.0  # type: ignore[misc]
+
+
+def test_export_matches_published_state():
+    """Save exports are taken under the worker lock and agree with the snapshot."""
+    worker = make_worker()
+    worker._last_step_at -= 2.0
+    worker.step()
+    worker.set_shared_exp_percentage(50)
+
+    export = worker.export_state()
+    snapshot = worker.snapshot()
+    assert export.shared_exp_percentage == snapshot.shared_exp_percentage == 50
+    for char_id in PLUGINS:
+        assert export.progress[char_id]["exp"] == snapshot.get_char_data(char_id)["exp"]
+        assert export.character_stats[char_id] == dict(snapshot.get_char_data(char_id)["base_stats"])
+
+
+def test_thread_catches_up_then_keeps_stepping():
+    """The thread applies the offline catch-up first, then publishes regular steps."""
+    worker = make_worker(catch_up_seconds=60.0, catch_up_start=400.0)
+    worker.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while worker.snapshot().tick_count < 600 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert worker.snapshot().tick_count >= 600
+    finally:
+        worker.stop()
+
+    ticks = worker.snapshot().tick_count
+    assert worker.export_state().progress["ally"]["exp"] == worker.snapshot().get_char_data("ally")["exp"]
+    time.sleep(0.15)
+    assert worker.snapshot().tick_count == ticks
@@ -0,0 +1,48 @@
+"""Tests for the offsite stat-share aggregator."""
+
+from endless_idler.combat.party_stats import OffsiteShareAggregator
+from endless_idler.combat.party_stats import STAT_SHARE_KEYS
+from endless_idler.combat.party_stats import apply_offsite_stat_share
+from endless_idler.combat.stats import Stats
+
+
+def make_stats(max_hp: int, atk: int, crit_rate: float) -> Stats:
+    stats = Stats()
+    stats.set_base_stat("max_hp", max_hp)
+    stats.set_base_stat("atk", atk)
+    stats.set_base_stat("crit_rate", crit_rate)
+    return stats
+
+
+def test_aggregator_matches_full_share():
+    """Applying the aggregate gives the same party stats as apply_offsite_stat_share."""
+    reserves = [make_stats(1200, 250, 0.05), make_stats(900, 310, 0.12)]
+    expected = make_stats(1000, 200, 0.05)
+    apply_offsite_stat_share(party=[expected], reserves=reserves, share=0.10)
+
+    aggregator = OffsiteShareAggregator(share=0.10)
+    for index, reserve in enumerate(reserves):
+        aggregator.set_reserve(f"reserve_{index}", reserve)
+    actual = make_stats(1000, 200, 0.05)
+    aggregator.apply(actual)
+
+    for stat_name in STAT_SHARE_KEYS:
+        assert actual.get_base_stat(stat_name) == expected.get_base_stat(stat_name)
+    assert actual.hp == actual.max_hp
+
+
+def test_aggregator_updates_by_delta():
+    """Replacing or removing one reserve only moves the totals by its difference."""
+    aggregator = OffsiteShareAggregator(share=0.10)
+    aggregator.set_reserve("a", make_stats(1000, 200, 0.05))
+    aggregator.set_reserve("b", make_stats(2000, 400, 0.10))
+    assert aggregator.bonus("max_hp") == 300
+
+    aggregator.set_reserve("a", make_stats(1500, 200, 0.05))
+    assert aggregator.bonus("max_hp") == 350
+    assert isinstance(aggregator.bonus("crit_rate"), float)
+
+    aggregator.remove_reserve("b")
+    assert len(aggregator) == 1
+    assert aggregator.bonus("max_hp") == 150
+    assert aggregator.bonus("atk") == 20
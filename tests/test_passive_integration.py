@@ -12,7 +12,10 @@ import pytest
 
 from endless_idler.characters.plugins import CharacterPlugin
 from endless_idler.combat.stats import Stats
+from endless_idler.passives.execution import trigger_passives_for_characters
 from endless_idler.passives.registry import load_passive
+from endless_idler.passives.triggers import PassiveTrigger
+from endless_idler.passives.triggers import TriggerContext
 
 # Directly import sim.py to avoid PySide6 dependency from screen.py
 sim_path = Path(__file__).parent.parent / "endless_idler" / "ui" / "battle" / "sim.py"
@@ -351,5 +354,67 @@ def test_target_selection_passives_integration():
     assert final_target_incomplete is lady_darkness, "Attack should not redirect when Trinity is incomplete"
 
 
+def test_passives_are_indexed_by_trigger():
+    """Test that attached passives are grouped by trigger and skipped when not subscribed."""
+    stats = Stats()
+    stats.character_id = "trinity"
+    trinity = load_passive("trinity_synergy")
+    veil = load_passive("lady_darkness_eclipsing_veil")
+    stats._passive_instances = [trinity, veil]
+
+    assert stats.passives_for(PassiveTrigger.TURN_START) == (trinity,)
+    assert stats.passives_for(PassiveTrigger.TARGET_SELECTION) == (trinity,)
+    assert stats.passives_for(PassiveTrigger.PRE_DAMAGE) == (veil,)
+    assert stats.passives_for(PassiveTrigger.DEATH) == ()
+
+    results = trigger_passives_for_characters(
+        characters=[stats],
+        trigger=PassiveTrigger.DEATH,
+        all_allies=[stats],
+        onsite_allies=[stats],
+        offsite_allies=[],
+        enemies=[],
+    )
+    assert results == []
+
+
+def test_trigger_context_rosters_compare_by_identity():
+    """Test that equal-looking Stats are not confused by roster checks."""
+    owner = Stats()
+    owner.character_id = "lady_light"
+    twin = Stats()
+    twin.character_id = "lady_light"
+
+    context = TriggerContext(
+        trigger=PassiveTrigger.TURN_START,
+        owner_stats=owner,
+        all_allies=[owner, twin],
+        onsite_allies=[owner],
+        offsite_allies=[twin],
+        enemies=[],
+        extra={},
+    )
+    assert context.is_onsite(owner) and not context.is_offsite(owner)
+    assert context.is_offsite(twin)
+    assert context.owner_slot == 0
+    assert context.ally_by_character_id("lady_light") is twin
+    assert not load_passive("lady_light_radiant_aegis").can_trigger(context)
+
+
+def test_class_declared_passives_are_shared():
+    """Test that owners share one passive instance instead of building their own."""
+    first = Stats()
+    second = Stats()
+    plugin = CharacterPlugin(
+        char_id="lady_light",
+        display_name="Lady Light",
+        passives=["lady_light_radiant_aegis"],
+    )
+    sim.load_passives_for_character(first, plugin, "lady_light")
+    sim.load_passives_for_character(second, plugin, "lady_light")
+    assert first._passive_instances[0] is second._passive_instances[0]
+    assert load_passive("lady_light_radiant_aegis") is first._passive_instances[0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""Tests for indexed stat effects and their cached modifiers."""
+
+import random
+
+from endless_idler.combat.stat_effect import StatEffect
+from endless_idler.combat.stats import Stats
+
+
+STAT_NAMES = ("atk", "defense", "max_hp", "crit_rate", "dodge_odds", "spd", "aggro_modifier")
+
+
+class _ListEffects:
+    """The original list-based effect handling, as a reference model."""
+
+    def __init__(self) -> None:
+        self.effects: list[StatEffect] = []
+
+    def add(self, effect: StatEffect) -> None:
+        self.remove_by_name(effect.name)
+        self.effects.append(effect)
+
+    def remove_by_name(self, name: str) -> None:
+        self.effects = [e for e in self.effects if e.name != name]
+
+    def remove_by_source(self, source: str) -> None:
+        self.effects = [e for e in self.effects if e.source != source]
+
+    def tick(self) -> None:
+        for effect in self.effects:
+            effect.tick()
+        self.effects = [e for e in self.effects if not e.is_expired()]
+
+    def modifier(self, stat_name: str) -> float:
+        total = 0.0
+        for effect in self.effects:
+            value = effect.stat_modifiers.get(stat_name)
+            if isinstance(value, (int, float)):
+                total += float(value)
+        return total
+
+
+def _snapshot(effects: list[StatEffect]) -> list[tuple[str, str, int]]:
+    return [(effect.name, effect.source, effect.duration) for effect in effects]
+
+
+def test_effect_store_matches_the_list_model():
+    rng = random.Random(5)
+    stats = Stats()
+    model = _ListEffects()
+    for _ in range(2000):
+        roll = rng.random()
+        if roll < 0.5:
+            keys = rng.sample(STAT_NAMES, rng.randint(1, 3))
+            fields = {
+                "name": f"effect_{rng.randrange(12)}",
+                "stat_modifiers": {key: rng.uniform(-0.3, 0.3) for key in keys},
+                "duration": rng.choice((-1, 0, 1, 2, 3, 6)),
+                "source": f"source_{rng.randrange(4)}",
+            }
+            stats.add_effect(StatEffect(**fields))
+            model.add(StatEffect(**fields))
+        elif roll < 0.65:
+            name = f"effect_{rng.randrange(12)}"
+            stats.remove_effect_by_name(name)
+            model.remove_by_name(name)
+        elif roll < 0.75:
+            source = f"source_{rng.randrange(4)}"
+            stats.remove_effect_by_source(source)
+            model.remove_by_source(source)
+        elif roll < 0.99:
+            stats.tick_effects()
+            model.tick()
+        else:
+            stats.clear_all_effects()
+            model.effects.clear()
+
+        assert _snapshot(stats.get_active_effects()) == _snapshot(model.effects)
+        for stat_name in STAT_NAMES:
+            assert stats._calculate_stat_modifier(stat_name) == model.modifier(stat_name)
+
+
+def test_effects_change_derived_stats():
+    stats = Stats()
+    stats.atk = 100
+    stats.add_effect(StatEffect(name="rage", stat_modifiers={"atk": 25}, duration=1, source="buff"))
+    assert stats.atk == 125
+
+    stats.add_effect(StatEffect(name="rage", stat_modifiers={"atk": 10}, duration=2, source="buff"))
+    assert stats.atk == 110
+
+    stats.tick_effects()
+    assert stats.get_effect("rage").duration == 1
+    assert stats.atk == 110
+    stats.tick_effects()
+    assert stats.get_effect("rage") is None
+    assert stats.atk == 100
+
+    stats.add_effect(StatEffect(name="ward", stat_modifiers={"defense": 5}, source="buff"))
+    assert stats.remove_effect_by_source("buff") == 1
+    assert stats.defense == stats.get_base_stat("defense")
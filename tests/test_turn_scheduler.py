@@ -0,0 +1,74 @@
+"""Tests for the action-gauge turn scheduler."""
+
+from endless_idler.combat.sim import Combatant
+from endless_idler.combat.stat_effect import StatEffect
+from endless_idler.combat.stats import GAUGE_START
+from endless_idler.combat.stats import Stats
+from endless_idler.combat.turns import TurnScheduler
+
+
+def make_combatant(char_id: str, spd: int) -> Combatant:
+    stats = Stats()
+    stats.spd = spd
+    return Combatant(char_id=char_id, name=char_id, stats=stats, max_hp=stats.max_hp)
+
+
+def take(scheduler: TurnScheduler, count: int) -> list[str]:
+    return [scheduler.next_turn().char_id for _ in range(count)]
+
+
+def test_turns_follow_speed_and_ties_keep_insertion_order():
+    fast = make_combatant("fast", 200)
+    slow = make_combatant("slow", 100)
+    other = make_combatant("other", 100)
+    scheduler = TurnScheduler([slow, fast, other])
+
+    assert fast.stats.base_action_value == GAUGE_START / 200
+    assert scheduler.upcoming(6) == [fast, slow, fast, other, fast, slow]
+    assert take(scheduler, 6) == ["fast", "slow", "fast", "other", "fast", "slow"]
+
+
+def test_speed_changes_and_removals():
+    hero = make_combatant("hero", 100)
+    foe = make_combatant("foe", 100)
+    scheduler = TurnScheduler([hero, foe])
+    assert take(scheduler, 1) == ["hero"]
+
+    # Doubling speed halves the action value hero still needs.
+    assert scheduler.action_value(hero) == GAUGE_START / 100
+    hero.stats.spd = 200
+    scheduler.refresh_speeds()
+    assert scheduler.action_value(hero) == GAUGE_START / 200
+    assert take(scheduler, 3) == ["foe", "hero", "hero"]
+
+    scheduler.remove(foe)
+    assert scheduler.upcoming(2) == [hero, hero]
+    hero.stats.hp = 0
+    assert scheduler.next_turn() is None
+
+
+def test_only_reported_speed_changes_are_refreshed():
+    hero = make_combatant("hero", 100)
+    foe = make_combatant("foe", 100)
+    scheduler = TurnScheduler([hero, foe])
+    assert take(scheduler, 1) == ["hero"]
+
+    # Effects that leave spd alone do not queue any scheduler work.
+    hero.stats.add_effect(StatEffect(name="rage", stat_modifiers={"atk": 25}, duration=1))
+    hero.stats.tick_effects()
+    assert scheduler._speed_dirty == []
+
+    hero.stats.add_effect(StatEffect(name="haste", stat_modifiers={"spd": 100}, duration=1))
+    assert scheduler._speed_dirty == [0]
+    scheduler.refresh_speeds()
+    assert scheduler._speed_dirty == []
+    assert scheduler.action_value(hero) == GAUGE_START / 200
+
+    # Expiry is reported like removal.
+    hero.stats.tick_effects()
+    scheduler.refresh_speeds()
+    assert scheduler.action_value(hero) == GAUGE_START / 100
+
+    scheduler.remove(foe)
+    foe.stats.spd = 300
+    assert scheduler._speed_dirty == []